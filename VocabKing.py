@@ -2,25 +2,155 @@
 # VocabKing.py — Premium UI + Full Feature Integration
 # Requirements:
 #   pip install customtkinter pyttsx3 pandas openpyxl
+#   (optional) pip install python-calamine   # much faster Excel import for large sheets
 #   pyinstaller --onefile --windowed --icon=assets/icon.ico --add-data "assets;assets" --add-data "words_dictionary.json;." VocabKing.py
 #
 # Notes:
 # - Uses a dark navy + gold theme across all screens.
 # - Fully wired deck actions: Open, Rename, Copy, Delete, Import, Add Deck.
-# - Word Add/Edit, Quiz (scoped), Word List (search/filter/toggle meanings), Excel import (up to 100 rows).
+# - Word Add/Edit, Quiz (scoped), Word List (search/filter/toggle meanings), Excel import (streamed, no row limit).
 # - Safe fonts (no tkfont.families() call before root).
+# - pandas / pyttsx3 are imported lazily on first use (warmed in background after the first frame).
+#   `python VocabKing.py --import-report [--import-budget-ms N]` times the real startup path (up to mainloop)
+#   and fails if a deferred module is loaded at startup or the budget is exceeded.
+# - Import parsers live in vocab_io.py (no tkinter) so batch-import worker processes never start the GUI.
 
-import customtkinter as ctk
-from tkinter import Menu, filedialog
-import tkinter as tk
-import pyttsx3
+import importlib
 import json
 import os, sys
-from PIL import Image
 import random
-import pandas as pd
+import string
+import unicodedata
 import threading
 import queue
+import time
+import bisect
+import hashlib
+import heapq
+import itertools
+import io
+import array
+import struct
+import zlib
+from collections import OrderedDict
+
+from vocab_io import (iter_import_rows, iter_delimited_rows, rows_to_deck,
+                      parse_import_file, diff_deck, merge_word,
+                      export_words, EXPORT_FORMATS, preview_import_file, DEFAULT_COLUMNS)
+
+if __name__ == "__main__" and getattr(sys, "frozen", False):
+    import multiprocessing
+    multiprocessing.freeze_support()  # PyInstaller exe: 프로세스 풀 자식이면 여기서 작업만 하고 종료
+
+# ==============================
+# Lazy Imports & Import Report
+# ==============================
+
+# 첫 화면 전에 필요한 모듈 / 기능을 처음 쓸 때 로드하는 모듈
+STARTUP_MODULES  = ("customtkinter", "PIL.Image")
+DEFERRED_MODULES = ("pandas", "numpy", "openpyxl", "pyttsx3", "concurrent.futures", "multiprocessing")
+STARTUP_CHECK_FLAG = "--startup-check"  # --import-report의 자식 프로세스: 첫 화면까지 만든 뒤 mainloop 대신 종료
+
+_lazy_modules = {}
+
+def _lazy_import(name):
+    """무거운 모듈은 처음 사용할 때 import (이후 캐시 사용)"""
+    mod = _lazy_modules.get(name)
+    if mod is None:
+        mod = importlib.import_module(name)
+        _lazy_modules[name] = mod
+    return mod
+
+def _warm_heavy_imports(names=DEFERRED_MODULES):
+    """첫 프레임 이후 백그라운드에서 미리 import 해두기 (실패는 무시, 실제 사용 시 에러 표시)"""
+    def worker():
+        for n in names:
+            try:
+                _lazy_import(n)
+            except Exception:
+                pass
+    threading.Thread(target=worker, daemon=True).start()
+
+def _run_importtime(args):
+    """새 인터프리터를 -X importtime으로 실행 → (CompletedProcess, [(module, self_us, cumulative_us, is_top)])"""
+    import subprocess
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args], capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cum_us), not name[1:2].isspace()))
+    return proc, rows
+
+def _interpreter_modules():
+    """인터프리터 기동만으로 로드되는 모듈(site, encodings 등) — 측정에서 제외"""
+    return {r[0] for r in _run_importtime(["-c", "pass"])[1]}
+
+def _measure_imports(modules, baseline):
+    """모듈만 새 인터프리터에서 import → (cumulative_us, {module: self_us}) / 실패 시 None"""
+    proc, rows = _run_importtime(["-c", "import " + ", ".join(modules)])
+    if proc.returncode != 0:
+        return None
+    rows = [r for r in rows if r[0] not in baseline]
+    cumulative = sum(cum for _, _, cum, is_top in rows if is_top)  # 최상위 import 줄의 누적 시간 합
+    return cumulative, {name: self_us for name, self_us, _, _ in rows}
+
+def print_import_report(budget_ms=None):
+    """실제 시작 경로(이 파일을 STARTUP_CHECK_FLAG로 실행, mainloop 직전 종료)의 import 비용 + 지연 모듈별 비용 출력.
+    시작 경로 실패(시작 모듈 미설치 포함) / 지연 모듈이 시작 시 로드됨 / 합계가 budget_ms 초과 → 1 반환 (회귀 방지용)"""
+    baseline = _interpreter_modules()
+    proc, rows = _run_importtime([os.path.abspath(__file__), STARTUP_CHECK_FLAG])
+    rows = [r for r in rows if r[0] not in baseline]
+    cumulative = {}
+    for name, _, cum, _ in rows:
+        cumulative.setdefault(name, cum)
+    failures = []
+
+    print("Startup (module load until mainloop):")
+    for mod in STARTUP_MODULES:
+        if mod in cumulative:
+            print(f"  {mod:<24} {cumulative[mod] / 1000:9.1f} ms")
+        else:
+            print(f"  {mod:<24} not loaded")
+            failures.append(f"startup module {mod} was not imported")
+    startup_total_ms = sum(cum for _, _, cum, is_top in rows if is_top) / 1000
+    print(f"Startup total: {startup_total_ms:.1f} ms")
+
+    print("Top startup modules by self time:")
+    for name, us, _, _ in sorted(rows, key=lambda r: r[1], reverse=True)[:10]:
+        print(f"  {name:<40} {us / 1000:9.1f} ms")
+
+    print("Deferred (first use / background warm-up):")
+    for mod in DEFERRED_MODULES:
+        res = _measure_imports([mod], baseline)
+        print(f"  {mod:<24} " + ("not installed" if res is None else f"{res[0] / 1000:9.1f} ms"))
+
+    if proc.returncode != 0:
+        # 자식이 남긴 마지막 줄 (ImportError / 시작 시 로드된 지연 모듈 목록 등)
+        detail = [line for line in (proc.stdout + proc.stderr).splitlines()
+                  if line.strip() and not line.startswith("import time:")]
+        failures.insert(0, f"startup path exited with {proc.returncode}" + (f": {detail[-1].strip()}" if detail else ""))
+    if budget_ms is not None and startup_total_ms > budget_ms:
+        failures.append(f"startup imports {startup_total_ms:.1f} ms > budget {budget_ms:.1f} ms")
+    for msg in failures:
+        print(f"FAIL: {msg}")
+    return 1 if failures else 0
+
+if "--import-report" in sys.argv:
+    _budget = None
+    if "--import-budget-ms" in sys.argv:
+        try:
+            _budget = float(sys.argv[sys.argv.index("--import-budget-ms") + 1])
+        except (IndexError, ValueError):
+            print("usage: VocabKing.py --import-report [--import-budget-ms MILLISECONDS]", file=sys.stderr)
+            sys.exit(2)
+    sys.exit(print_import_report(_budget))
+
+import customtkinter as ctk
+from tkinter import Menu, filedialog
+import tkinter as tk
+from PIL import Image
 
 # ==============================
 # App Constants & Global State
@@ -28,18 +158,33 @@ import queue
 
 APP_TITLE = "Vocab King"
 VOCAB_FILE = "decks.json"
+DECKS_JOURNAL_FILE = "decks.journal"    # 마지막 전체 저장 이후의 가벼운 변경 (JSONL, 로드 시 재생)
 
 # in-memory state
 decks: dict = {}
 current_deck = ""
 current_word = ""
-quiz_index = 0
 editing_word = None
 shuffle_enabled = False
 selected_word = {"text": None}
 selected_index = {"idx": None}
+multi_selected = set()              # word list 다중 선택 (Ctrl / Shift-클릭), 일괄 작업 대상
+_select_anchor = {"idx": None}      # Shift-클릭 범위의 기준 행
 filtered_words = []
 row_widgets = []
+quiz_session = None     # 진행 중인 QuizSession (Back 후에도 유지, 체크포인트 파일로 재개)
+quiz_deck = ""          # 현재 카드의 덱 (current_word와 함께 quiz_session.current에서 갱신)
+_quiz_shown_at = 0.0    # 현재 카드가 표시된 시각 (perf_counter, 응답 시간 기록용)
+QUIZ_ANSWER_MODES = {
+    "reveal":        "📖 Reveal",
+    "choice":        "🔢 Choice",
+    "typed_word":    "⌨ Type Word",      # 뜻을 보고 단어 입력
+    "typed_meaning": "⌨ Type Meaning",   # 단어를 보고 뜻 입력
+}
+quiz_answer_mode = "reveal"
+quiz_distractors = None         # 객관식 세션의 덱별 DistractorIndex (처음 나온 덱부터 생성)
+_quiz_choices = {"key": None, "options": [], "answered": None}
+_quiz_typed = {"key": None, "result": None}
 hide_meanings = False
 VISIBLE_ROWS = 100
 word_entry = pos_entry = meaning_entry = example_entry = None
@@ -77,9 +222,83 @@ def resource_path(relative_path):
     base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
     return os.path.join(base_path, relative_path)
 
-icon_unknown_img = ctk.CTkImage(Image.open(resource_path("assets/icon_unknown.png")), size=(24, 24))
-icon_partial_img = ctk.CTkImage(Image.open(resource_path("assets/icon_partial.png")), size=(24, 24))
-icon_known_img   = ctk.CTkImage(Image.open(resource_path("assets/icon_known.png")), size=(24, 24))
+# ==============================
+# Asset Cache (decode once, share CTkImage)
+# ==============================
+
+# name -> (상대 경로, 표시 크기)
+ASSET_MANIFEST = {
+    "icon_unknown": ("assets/icon_unknown.png", (24, 24)),
+    "icon_partial": ("assets/icon_partial.png", (24, 24)),
+    "icon_known":   ("assets/icon_known.png",   (24, 24)),
+    "logo":         ("assets/logo.png",         (100, 100)),
+}
+ASSET_MAX_SCALE = 2  # HiDPI 200%까지 커버할 해상도로만 디코딩해서 보관
+
+_asset_decoded = {}   # (path, size) -> PIL.Image
+_asset_images = {}    # (path, size) -> CTkImage
+_asset_key_locks = {}
+_asset_lock = threading.Lock()
+asset_stats = {"decodes": 0, "hits": 0, "misses": 0, "bytes": 0}
+
+def _decode_asset(path, size):
+    """PNG를 한 번만 디코딩 + 필요한 배율로 축소 (스레드 안전, 키별 잠금)"""
+    key = (path, size)
+    with _asset_lock:
+        lock = _asset_key_locks.setdefault(key, threading.Lock())
+    with lock:
+        img = _asset_decoded.get(key)
+        if img is not None:
+            return img
+        img = Image.open(resource_path(path))
+        img.load()
+        max_w, max_h = size[0] * ASSET_MAX_SCALE, size[1] * ASSET_MAX_SCALE
+        if img.width > max_w or img.height > max_h:
+            img.thumbnail((max_w, max_h), Image.LANCZOS)
+        with _asset_lock:
+            _asset_decoded[key] = img
+            asset_stats["decodes"] += 1
+            asset_stats["bytes"] += img.width * img.height * len(img.getbands())
+        return img
+
+def get_image(name, size=None):
+    """매니페스트 이름으로 공유 CTkImage 반환 (같은 이름/크기는 항상 같은 인스턴스)"""
+    path, default_size = ASSET_MANIFEST[name]
+    key = (path, size or default_size)
+    img = _asset_images.get(key)
+    if img is not None:
+        asset_stats["hits"] += 1
+        return img
+    asset_stats["misses"] += 1
+    pil = _decode_asset(*key)
+    img = ctk.CTkImage(pil, size=key[1])
+    _asset_images[key] = img
+    return img
+
+def preload_assets(names=None):
+    """매니페스트 이미지(기본: 전부)를 백그라운드 스레드에서 미리 디코딩 (CTkImage 생성은 get_image에서).
+    이미 디코딩된 것은 캐시에서 바로 건너뜀"""
+    def worker():
+        for n in (names or ASSET_MANIFEST):
+            try:
+                _decode_asset(*ASSET_MANIFEST[n])
+            except Exception:
+                pass  # 파일 문제는 get_image에서 실제로 쓸 때 드러남
+    threading.Thread(target=worker, daemon=True).start()
+
+def get_asset_stats():
+    """디코딩 횟수 / 캐시 hit·miss / 디코딩된 픽셀 메모리(bytes)"""
+    with _asset_lock:
+        return {**asset_stats, "images": len(_asset_images), "decoded": len(_asset_decoded)}
+
+icon_unknown_img = get_image("icon_unknown")
+icon_partial_img = get_image("icon_partial")
+icon_known_img   = get_image("icon_known")
+STATUS_ICONS = {
+    "unknown": icon_unknown_img,
+    "partial": icon_partial_img,
+    "known":   icon_known_img,
+}
 
 def ui_font(name, size, weight=None):
     # Avoid tkfont.families() before root; CTkFont will fallback automatically if font missing.
@@ -155,6 +374,22 @@ def open_help_modal():
             command=lambda: (overlay.destroy(), reset_app())
         ).pack(pady=SPACING["sm"])
 
+        # 🔊 목소리 선택 (엔진 재생성 없이 적용)
+        voices = get_tts_voices()
+        if voices:
+            vi = min(TTS_SETTINGS["voice_index"], len(voices)-1)
+            ctk.CTkOptionMenu(
+                parent,
+                variable=tk.StringVar(value=voices[vi]),
+                values=voices,
+                width=200,
+                fg_color=THEME["panel"],
+                button_color=THEME["gold"],
+                button_hover_color=THEME["gold_dim"],
+                text_color=THEME["text"],
+                command=lambda name: set_tts_voice(voices.index(name))
+            ).pack(pady=SPACING["sm"])
+
         ctk.CTkButton(
             parent,
             text="Close",
@@ -165,16 +400,194 @@ def open_help_modal():
 
     show_modal("", build, show_close=False)
 
-def _start_tts_worker(voice_index_preferred=1, rate=130):
-    """pyttsx3 엔진을 워커 스레드 안에서 생성하고, 큐를 소비하며 speak를 수행"""
+# ==============================
+# TTS (single engine + interruptible queue)
+# ==============================
+
+TTS_SETTINGS = {"voice_index": 1, "rate": 130}
+_tts_generation = 0     # speak 요청마다 +1 → 진행 중인 발화는 값이 바뀌면 중단
+_tts_current = {"gen": -1, "t0": 0.0, "mode": None}
+_tts_voices = []        # 엔진 생성 시 한 번만 조회
+tts_stats = {"requests": 0, "spoken": 0, "interrupted": 0, "last_ms": 0.0, "avg_ms": 0.0}
+
+# ----- 발음 오디오 디스크 캐시 (text, voice, rate) -> wav -----
+TTS_CACHE_DIR = "tts_cache"
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+TTS_PRERENDER_MAX = 300         # 덱을 열 때 미리 렌더링할 최대 단어 수
+RENDER_PRIO_PREFETCH = 0        # 퀴즈 다음 카드 (숫자가 작을수록 먼저 렌더링)
+RENDER_PRIO_PLAYLIST = 1        # 🎧 Listen 앞쪽 구간 (epoch도 우선순위별이라 퀴즈 예약을 취소하지 않음)
+RENDER_PRIO_DECK = 10
+
+_tts_render_queue = queue.PriorityQueue()   # (prio, seq, text, epoch)
+_tts_render_seq = itertools.count()
+_tts_render_epoch = {}          # prio -> epoch (새 덱을 열면 이전 덱의 대기 작업은 무시)
+_tts_cache_index = None         # OrderedDict(filename -> bytes), 오래된 것부터 (LRU)
+_tts_cache_bytes = 0
+tts_cache_stats = {"hits": 0, "misses": 0, "rendered": 0, "evicted": 0}
+tts_source_stats = {}           # source("quiz" 등) -> {"hits", "misses"}
+_clip_player = None             # (kind, module) / False (재생기 없음)
+_clip_playing = {"obj": None}
+
+def _get_clip_player():
+    """캐시된 wav 재생기: Windows는 winsound, 그 외에는 simpleaudio(설치된 경우). 없으면 False"""
+    global _clip_player
+    if _clip_player is None:
+        try:
+            import winsound
+            _clip_player = ("winsound", winsound)
+        except ImportError:
+            try:
+                _clip_player = ("simpleaudio", _lazy_import("simpleaudio"))
+            except ImportError:
+                _clip_player = False
+    return _clip_player
+
+def _play_clip(path):
+    """워커 스레드에서 동기 재생 (끝날 때까지 대기). _stop_clip()으로 중단"""
+    kind, mod = _get_clip_player()
+    if kind == "winsound":
+        mod.PlaySound(path, mod.SND_FILENAME | mod.SND_NODEFAULT)
+    else:
+        play = mod.WaveObject.from_wave_file(path).play()
+        _clip_playing["obj"] = play
+        play.wait_done()
+        _clip_playing["obj"] = None
+
+def _stop_clip():
+    player = _get_clip_player()
+    if not player:
+        return
+    kind, mod = player
+    if kind == "winsound":
+        mod.PlaySound(None, 0)
+    elif _clip_playing["obj"] is not None:
+        _clip_playing["obj"].stop()
+
+def _tts_cache_name(text):
+    """현재 목소리/속도까지 포함한 캐시 파일 이름 (워커 스레드에서 호출)"""
+    voice = ""
+    if _tts_voices:
+        voice = _tts_voices[min(TTS_SETTINGS["voice_index"], len(_tts_voices)-1)].id
+    key = f"{voice}\0{TTS_SETTINGS['rate']}\0{text}".encode("utf-8")
+    return hashlib.sha1(key).hexdigest() + ".wav"
+
+def _tts_cache_load_index():
+    global _tts_cache_index, _tts_cache_bytes
+    if _tts_cache_index is not None:
+        return
+    _tts_cache_index = OrderedDict()
+    _tts_cache_bytes = 0
+    os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+    entries = []
+    for e in os.scandir(TTS_CACHE_DIR):
+        if e.is_file() and e.name.endswith(".wav") and not e.name.endswith(".tmp.wav"):
+            st = e.stat()
+            entries.append((st.st_mtime, e.name, st.st_size))
+    for _, name, size in sorted(entries):
+        _tts_cache_index[name] = size
+        _tts_cache_bytes += size
+
+def _tts_cache_lookup(text):
+    """캐시 hit면 파일 경로 반환 + 최근 사용으로 갱신"""
+    _tts_cache_load_index()
+    name = _tts_cache_name(text)
+    if name not in _tts_cache_index:
+        return None
+    path = os.path.join(TTS_CACHE_DIR, name)
+    _tts_cache_index.move_to_end(name)
+    try:
+        os.utime(path)  # 재시작 후에도 LRU 순서 유지
+    except OSError:
+        _tts_cache_index.pop(name, None)
+        return None
+    return path
+
+def _tts_cache_add(name, size):
+    global _tts_cache_bytes
+    _tts_cache_index[name] = size
+    _tts_cache_bytes += size
+    while _tts_cache_bytes > TTS_CACHE_MAX_BYTES and len(_tts_cache_index) > 1:
+        old, old_size = _tts_cache_index.popitem(last=False)
+        _tts_cache_bytes -= old_size
+        tts_cache_stats["evicted"] += 1
+        try:
+            os.remove(os.path.join(TTS_CACHE_DIR, old))
+        except OSError:
+            pass
+
+def _tts_render(eng, text):
+    """save_to_file로 wav 생성 (임시 파일 → os.replace). 워커 스레드 전용"""
+    _tts_cache_load_index()
+    name = _tts_cache_name(text)
+    if name in _tts_cache_index:
+        return
+    path = os.path.join(TTS_CACHE_DIR, name)
+    tmp = path[:-4] + ".tmp.wav"
+    _tts_current["mode"] = "render"
+    try:
+        eng.save_to_file(text, tmp)
+        eng.runAndWait()
+        if os.path.exists(tmp) and os.path.getsize(tmp) > 0:
+            os.replace(tmp, path)
+            _tts_cache_add(name, os.path.getsize(path))
+            tts_cache_stats["rendered"] += 1
+    finally:
+        _tts_current["mode"] = None
+
+def _tts_render_next(eng):
+    """대기 중인 렌더 작업 하나 처리. 처리할 게 없으면 False"""
+    while True:
+        try:
+            prio, _, text, epoch = _tts_render_queue.get_nowait()
+        except queue.Empty:
+            return False
+        if epoch == _tts_render_epoch.get(prio, 0):
+            break
+    try:
+        _tts_render(eng, text)
+    except Exception:
+        pass
+    return True
+
+def tts_prerender(texts, prio=RENDER_PRIO_DECK, replace=False):
+    """백그라운드 렌더 예약. replace=True면 같은 우선순위의 이전 예약은 취소"""
+    if not _get_clip_player():
+        return  # 재생기가 없으면 캐시를 써먹을 수 없음
+    if replace:
+        _tts_render_epoch[prio] = _tts_render_epoch.get(prio, 0) + 1
+    epoch = _tts_render_epoch.get(prio, 0)
+    for t in texts:
+        if t:
+            _tts_render_queue.put((prio, next(_tts_render_seq), t, epoch))
+    _start_tts_worker()
+    _tts_queue.put(("wake",))
+
+def prerender_deck(deck_name):
+    """덱을 열 때 단어 발음을 미리 렌더링 (모르는 단어 우선, 최대 TTS_PRERENDER_MAX개)"""
+    order = {"unknown": 0, "partial": 1, "known": 2}
+    deck = decks.get(deck_name, {})
+    words = sorted(deck, key=lambda w: order.get(deck[w].get("status", "unknown"), 0))
+    tts_prerender(words[:TTS_PRERENDER_MAX], RENDER_PRIO_DECK, replace=True)
+
+def _tts_record_latency(t0):
+    ms = (time.perf_counter() - t0) * 1000
+    tts_stats["spoken"] += 1
+    tts_stats["last_ms"] = ms
+    tts_stats["avg_ms"] += (ms - tts_stats["avg_ms"]) / tts_stats["spoken"]
+
+def _apply_tts_settings(eng):
+    if _tts_voices:
+        vi = min(TTS_SETTINGS["voice_index"], len(_tts_voices)-1)
+        eng.setProperty('voice', _tts_voices[vi].id)
+    eng.setProperty('rate', TTS_SETTINGS["rate"])
+
+def _start_tts_worker():
+    """pyttsx3 엔진을 워커 스레드 안에서 한 번만 생성하고, 큐를 소비하며 speak / 렌더링 수행"""
     def worker():
         try:
-            eng = pyttsx3.init()
-            voices = eng.getProperty('voices')
-            if voices:
-                vi = min(voice_index_preferred, len(voices)-1)
-                eng.setProperty('voice', voices[vi].id)
-            eng.setProperty('rate', rate)
+            eng = _lazy_import("pyttsx3").init()
+            _tts_voices[:] = eng.getProperty('voices') or []
+            _apply_tts_settings(eng)
         except Exception as e:
             try:
                 root.after(0, lambda m=f"❌ TTS init error:\n{e}": modal_error(m))
@@ -182,78 +595,103 @@ def _start_tts_worker(voice_index_preferred=1, rate=130):
                 pass
             return
 
+        def on_started(name):
+            # 누른 시점 → 첫 소리까지 지연 기록 (렌더링 중 이벤트는 무시)
+            if _tts_current["mode"] == "say":
+                _tts_record_latency(_tts_current["t0"])
+
+        def on_word(name, location, length):
+            # 더 새로운 요청이 들어왔으면 현재 발화 중단
+            if _tts_current["mode"] == "say" and _tts_current["gen"] != _tts_generation:
+                tts_stats["interrupted"] += 1
+                eng.stop()
+
+        eng.connect('started-utterance', on_started)
+        eng.connect('started-word', on_word)
+
         while True:
-            text = _tts_queue.get()
-            if text is None:
-                break
+            # speak 요청이 없을 때만 백그라운드 렌더링
             try:
-                # 큐를 비우고 가장 최신 요청만 말하도록 설정 (중복 클릭 대비)
-                while True:
-                    try:
-                        nxt = _tts_queue.get_nowait()
-                        if nxt is None:
-                            text = None
-                            break
-                        text = nxt
-                    except queue.Empty:
-                        break
-                if not text:
+                job = _tts_queue.get_nowait()
+            except queue.Empty:
+                if _tts_render_next(eng):
                     continue
+                job = _tts_queue.get()
+            if job is None:
+                break
+            if job[0] == "wake":
+                continue
+            if job[0] == "settings":
+                _apply_tts_settings(eng)
+                continue
 
-                eng.say(text)
-                eng.runAndWait()
+            _, text, gen, t0, source, on_done = job
+            if gen != _tts_generation:
+                # 이미 더 새로운 요청이 있음 (중복 클릭 대비, 최신 요청만)
+                if on_done:
+                    root.after(0, on_done, False)
+                continue
+            _tts_current.update(gen=gen, t0=t0)
+            try:
+                path = _tts_cache_lookup(text) if _get_clip_player() else None
+                counters = tts_source_stats.setdefault(source, {"hits": 0, "misses": 0})
+                if path:
+                    tts_cache_stats["hits"] += 1
+                    counters["hits"] += 1
+                    _tts_current["mode"] = "clip"
+                    _tts_record_latency(t0)
+                    _play_clip(path)
+                else:
+                    tts_cache_stats["misses"] += 1
+                    counters["misses"] += 1
+                    _tts_current["mode"] = "say"
+                    eng.say(text)
+                    eng.runAndWait()
+                    tts_prerender([text], RENDER_PRIO_DECK)  # 다음 재생부터는 캐시 사용
             except Exception as e:
                 try:
                     root.after(0, lambda m=f"❌ TTS Error:\n{e}": modal_error(m))
                 except Exception:
                     pass
+            finally:
+                _tts_current["mode"] = None
+            if on_done:
+                # 끝까지 재생됐는지(중간에 더 새 요청으로 끊기지 않았는지) 메인 스레드에 알림
+                root.after(0, on_done, gen == _tts_generation)
 
     global _tts_thread
     if _tts_thread is None or not _tts_thread.is_alive():
         _tts_thread = threading.Thread(target=worker, daemon=True)
         _tts_thread.start()
 
-# 전역 변수 추가
-current_engine = None
-current_engine_lock = threading.Lock()
-
-def speak_text(text: str):
+def speak_text(text: str, source=None, on_done=None):
+    """on_done(completed)는 재생이 끝나거나 더 새 요청에 밀렸을 때 메인 스레드에서 호출"""
     if not text:
         return
-
-    def worker(t):
-        global current_engine
-        with current_engine_lock:
-            try:
-                # 이전 재생 중이면 중단
-                if current_engine is not None:
-                    try:
-                        current_engine.stop()
-                    except Exception:
-                        pass
-                    current_engine = None
-
-                # 새 엔진 생성
-                eng = pyttsx3.init()
-                voices = eng.getProperty('voices')
-                if voices:
-                    vi = min(1, len(voices)-1)
-                    eng.setProperty('voice', voices[vi].id)
-                eng.setProperty('rate', 130)
-
-                current_engine = eng
-                eng.say(t)
-                eng.runAndWait()
-
-            except Exception as e:
-                try:
-                    root.after(0, lambda m=f"❌ TTS Error:\n{e}": modal_error(m))
-                except Exception:
-                    pass
-            finally:
-                current_engine = None
-
-    threading.Thread(target=worker, args=(text,), daemon=True).start()
+    stop_speaking()
+    tts_stats["requests"] += 1
+    _start_tts_worker()
+    _tts_queue.put(("say", text, _tts_generation, time.perf_counter(), source, on_done))
+
+def stop_speaking():
+    """진행 중인 발화/클립 중단 (대기 중인 speak 요청도 모두 무효화)"""
+    global _tts_generation
+    _tts_generation += 1
+    if _tts_current["mode"] == "clip":
+        _stop_clip()  # 재생 중인 캐시 클립 중단
+
+def set_tts_voice(index=None, rate=None):
+    """엔진 재생성 없이 목소리/속도 변경 (워커가 다음 작업 전에 적용)"""
+    if index is not None:
+        TTS_SETTINGS["voice_index"] = index
+    if rate is not None:
+        TTS_SETTINGS["rate"] = rate
+    _start_tts_worker()
+    _tts_queue.put(("settings",))
+
+def get_tts_voices():
+    """엔진이 준비된 뒤 사용할 수 있는 목소리 이름 목록 (준비 전이면 빈 리스트)"""
+    return [getattr(v, "name", v.id) for v in _tts_voices]
 
 # ==============================
 # Data I/O
@@ -265,8 +703,53 @@ def _atomic_write_json(path, data):
         json.dump(data, f, ensure_ascii=False, indent=2)
     os.replace(tmp, path)
 
+# ----- copy-on-write 단어 레코드 + 변경 저널 -----
+# 덱 복사는 레코드를 공유하는 얕은 복사. 레코드를 고치는 곳은 반드시 mutable_word()로 먼저 복제.
+# 덱 복사처럼 전체 저장이 필요 없는 변경은 decks.journal에 한 줄만 추가하고,
+# 다음 save_decks()가 decks.json을 통째로 쓰면서 저널을 비움.
+_journal_base = None    # 저널이 기준으로 삼는 decks.json의 (mtime_ns, size)
+
+def mutable_word(deck_name, word):
+    """고치기 직전의 단어 레코드를 이 덱 전용 사본으로 교체해 반환 (다른 덱과 공유 중일 수 있음)"""
+    info = dict(decks[deck_name][word])
+    decks[deck_name][word] = info
+    return info
+
+def _decks_file_base():
+    try:
+        st = os.stat(VOCAB_FILE)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+def _apply_journal_op(op):
+    if op["op"] == "copy":
+        if op["src"] in decks and op["dst"] not in decks:
+            decks[op["dst"]] = dict(decks[op["src"]])
+
+def journal_append(op):
+    """변경 하나를 저널에 추가 (실패하면 전체 저장으로 대신)"""
+    try:
+        with open(DECKS_JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps({**op, "base": _journal_base}, ensure_ascii=False) + "\n")
+    except Exception:
+        save_decks()
+
+def _replay_journal():
+    """decks.json 기준이 같은 항목만 순서대로 적용 (전체 저장 직후 저널 삭제 전에 꺼졌으면 예전 항목은 무시)"""
+    if not os.path.exists(DECKS_JOURNAL_FILE):
+        return
+    with open(DECKS_JOURNAL_FILE, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                op = json.loads(line)
+            except ValueError:
+                break  # 쓰다 만 마지막 줄
+            if op.get("base") == _journal_base:
+                _apply_journal_op(op)
+
 def load_decks():
-    global decks
+    global decks, _journal_base
     if os.path.exists(VOCAB_FILE):
         try:
             with open(VOCAB_FILE, "r", encoding="utf-8") as f:
@@ -275,10 +758,19 @@ def load_decks():
             decks = {}
     if not decks:
         decks = {"Default": {}}
+    _journal_base = _decks_file_base()
+    try:
+        _replay_journal()
+    except Exception:
+        pass
 
 def save_decks():
+    global _journal_base
     try:
         _atomic_write_json(VOCAB_FILE, decks)
+        _journal_base = _decks_file_base()
+        if os.path.exists(DECKS_JOURNAL_FILE):
+            os.remove(DECKS_JOURNAL_FILE)
     except Exception as e:
         modal_error(f"Deck save failed:\n{e}")
 
@@ -294,45 +786,28 @@ saved_random_words = []
 # ===== Custom Modal Utilities =====
 
 def _modal_template(_title, _message, _color, _on_yes=None, _confirm=False):
-    def build(parent, overlay):
-        ctk.CTkLabel(parent, text=_message, font=FONTS["body"], text_color=_color,
-                     justify="center", wraplength=360).pack(pady=SPACING["md"])
+    """미리 만들어 둔 message / confirm 카드에 내용만 채워서 표시"""
+    def fill(w, handle):
+        w["message"].configure(text=_message, text_color=_color)
         if _confirm:
-            row = ctk.CTkFrame(parent, fg_color="transparent"); row.pack(pady=SPACING["sm"])
-            ctk.CTkButton(row, text="Yes", command=lambda: (overlay.destroy(), _on_yes() if _on_yes else None), **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
-            ctk.CTkButton(row, text="No", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+            w["yes"].configure(command=lambda: (handle.destroy(), _on_yes() if _on_yes else None))
+            w["no"].configure(command=handle.destroy)
         else:
-            ctk.CTkButton(parent, text="OK", command=overlay.destroy, **BTN_SOLID).pack(pady=SPACING["sm"])
-    show_modal(_title, build, show_close=False)
+            w["ok"].configure(command=handle.destroy)
+    _modal_request("confirm" if _confirm else "message", _title, fill)
 
-def modal_warn(message):
-    _modal_template("Warning", message, THEME["muted"])
+def modal_warn(message, title="Warning"):
+    _modal_template(title, message, THEME["muted"])
 
-def modal_info(message):
-    _modal_template("Info", message, THEME["muted"])
+def modal_info(message, title="Info"):
+    _modal_template(title, message, THEME["muted"])
 
-def modal_error(message):
-    _modal_template("Error", message, THEME["danger"])
+def modal_error(message, title="Error"):
+    _modal_template(title, message, THEME["danger"])
 
 def modal_confirm(message, on_yes):
     _modal_template("Confirm", message, THEME["muted"], _on_yes=on_yes, _confirm=True)
 
-    def build(parent, overlay):
-        ctk.CTkLabel(parent, text=message, font=FONTS["body"], text_color=THEME["danger"],
-                     justify="center", wraplength=360).pack(pady=SPACING["md"])
-        ctk.CTkButton(parent, text="OK", command=overlay.destroy, **BTN_SOLID).pack(pady=SPACING["sm"])
-    show_modal("Error", build, show_close=False)
-
-    def build(parent, overlay):
-        ctk.CTkLabel(parent, text=message, font=FONTS["body"], text_color=THEME["muted"],
-                     justify="center", wraplength=360).pack(pady=SPACING["md"])
-        row = ctk.CTkFrame(parent, fg_color="transparent"); row.pack(pady=SPACING["sm"])
-        ctk.CTkButton(row, text="Yes", command=lambda: (overlay.destroy(), on_yes()), **BTN_SOLID)\
-            .pack(side="left", padx=SPACING["sm"])
-        ctk.CTkButton(row, text="No", command=overlay.destroy, **BTN_GHOST)\
-            .pack(side="left", padx=SPACING["sm"])
-    show_modal("Confirm", build, show_close=False)
-
 # Utilities
 # ==============================
 
@@ -344,8 +819,13 @@ def center_root_window(window, width=960, height=680):
     y = (sh // 2) - (height // 2)
     window.geometry(f"{width}x{height}+{x}+{y}")
 
+_shown_frame = None     # 마지막으로 show_frame한 화면 (undo 후 갱신 대상)
+
 def show_frame(frame):
+    global _shown_frame
+    _shown_frame = frame
     frame.tkraise()
+    _modal_lift()
     # clear all keybinds that might interfere
     for key in ("<Left>", "<Right>", "<Up>", "<Down>", "<Delete>"):
         try: root.unbind(key)
@@ -369,12 +849,6 @@ def build_deck_header(parent, title_text, deck_name):
     # 전역 레퍼런스: Word List 헤더 갱신용
     global header_total_label, header_known_count_label, header_partial_count_label, header_unknown_count_label, header_progress_bar
 
-    status_icons = {
-        "unknown": icon_unknown_img,
-        "partial": icon_partial_img,
-        "known":   icon_known_img
-    }
-
     header_card = ctk.CTkFrame(
         parent,
         fg_color=THEME["panel"],
@@ -411,21 +885,21 @@ def build_deck_header(parent, title_text, deck_name):
     header_total_label.pack(side="left")
 
     # Known
-    ctk.CTkLabel(stats_row, image=status_icons["known"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["known"], text="").pack(side="left", padx=(0, 4))
     header_known_count_label = ctk.CTkLabel(
         stats_row, text=str(counts.get("known", 0)), font=FONTS["body"], text_color=THEME["muted"]
     )
     header_known_count_label.pack(side="left", padx=(0, 12))
 
     # Partial
-    ctk.CTkLabel(stats_row, image=status_icons["partial"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["partial"], text="").pack(side="left", padx=(0, 4))
     header_partial_count_label = ctk.CTkLabel(
         stats_row, text=str(counts.get("partial", 0)), font=FONTS["body"], text_color=THEME["muted"]
     )
     header_partial_count_label.pack(side="left", padx=(0, 12))
 
     # Unknown
-    ctk.CTkLabel(stats_row, image=status_icons["unknown"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["unknown"], text="").pack(side="left", padx=(0, 4))
     header_unknown_count_label = ctk.CTkLabel(
         stats_row, text=str(counts.get("unknown", 0)), font=FONTS["body"], text_color=THEME["muted"]
     )
@@ -460,49 +934,165 @@ def refresh_word_list_header():
         header_progress_bar.set(ratio)
 
 # ==============================
-# Modal (overlay + card)
+# Modal (single overlay + card pool)
 # ==============================
 
-def show_modal(title, build_func, show_close=True):
-    overlay = ctk.CTkFrame(root, fg_color="#000000")
-    overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
-
-    modal = ctk.CTkFrame(overlay, fg_color="#1E1E1E", corner_radius=20)
-    modal.place(relx=0.5, rely=0.5, anchor="center")
-
-    title_label = ctk.CTkLabel(modal, text=title, font=("Arial", 20, "bold"))
-    title_label.pack(pady=(10, 5))
-
-    build_func(modal, overlay)  # 내부 UI 빌드
-
-    def close():
-        overlay.destroy()
-
-    if show_close:
-        close_btn = ctk.CTkButton(modal, text="Close", command=close)
-        close_btn.pack(pady=(10, 10))
-
-    overlay.bind("<Button-1>", lambda e: close())
-    modal.bind("<Button-1>", lambda e: "break")
-    overlay.bind("<Escape>", lambda e: close())
-
+MODAL_ANIMATE = False   # True면 0.9 → 1.0 확대 애니메이션 (표시 전 레이아웃 계산 1회 추가)
+MODAL_KINDS = ("message", "confirm", "form")
+
+_modal_overlay = None
+_modal_cards = {}       # kind -> 미리 만든 카드 위젯들
+_modal_stack = []       # 현재 떠 있는 모달 handle (마지막이 맨 위)
+_modal_queue = []       # 같은 종류 카드가 사용 중일 때 대기: (kind, title, fill)
+modal_stats = {"shown": 0, "queued": 0, "last_ms": 0.0, "avg_ms": 0.0, "max_ms": 0.0}
+
+class _ModalHandle:
+    """build 함수에 넘기는 overlay 대용. destroy()는 카드만 숨기고 대기 중인 다음 모달을 띄움"""
+    def __init__(self, kind):
+        self.kind = kind
+        self.closed = False
+        self.on_close = None    # 닫힐 때 호출 (오버레이 클릭 / Esc 포함)
+
+    def destroy(self):
+        _modal_close(self)
+
+def _modal_ensure_pool():
+    """overlay 1개 + 종류별 카드 1개씩을 처음 한 번만 생성"""
+    global _modal_overlay
+    if _modal_overlay is not None:
+        return
+    _modal_overlay = ctk.CTkFrame(root, fg_color="#000000")
+    _modal_overlay.bind("<Button-1>", lambda e: _modal_close_top())
+    root.bind("<Escape>", lambda e: _modal_close_top())
+
+    for kind in MODAL_KINDS:
+        card = ctk.CTkFrame(_modal_overlay, fg_color="#1E1E1E", corner_radius=20)
+        card.bind("<Button-1>", lambda e: "break")
+        title = ctk.CTkLabel(card, text="", font=("Arial", 20, "bold"))
+        title.pack(pady=(10, 5), padx=SPACING["md"])
+        w = {"card": card, "title": title}
+
+        if kind == "form":
+            w["body"] = ctk.CTkFrame(card, fg_color="transparent")
+            w["body"].pack(padx=SPACING["md"])
+            w["close"] = ctk.CTkButton(card, text="Close")
+        else:
+            w["message"] = ctk.CTkLabel(card, text="", font=FONTS["body"], justify="center",
+                                        wraplength=360, width=360)
+            w["message"].pack(pady=SPACING["md"], padx=SPACING["md"])
+            row = ctk.CTkFrame(card, fg_color="transparent")
+            row.pack(pady=(0, SPACING["md"]))
+            if kind == "confirm":
+                w["yes"] = ctk.CTkButton(row, text="Yes", **BTN_SOLID)
+                w["yes"].pack(side="left", padx=SPACING["sm"])
+                w["no"] = ctk.CTkButton(row, text="No", **BTN_GHOST)
+                w["no"].pack(side="left", padx=SPACING["sm"])
+            else:
+                w["ok"] = ctk.CTkButton(row, text="OK", **BTN_SOLID)
+                w["ok"].pack()
+        _modal_cards[kind] = w
+
+def _modal_request(kind, title, fill):
+    """같은 종류 카드가 이미 떠 있으면 큐에 넣고, 아니면 바로 표시"""
+    t0 = time.perf_counter()
+    _modal_ensure_pool()
+    if any(h.kind == kind for h in _modal_stack):
+        _modal_queue.append((kind, title, fill))
+        modal_stats["queued"] += 1
+        return
+    _modal_present(kind, title, fill, t0)
+
+def _modal_present(kind, title, fill, t0):
+    w = _modal_cards[kind]
+    handle = _ModalHandle(kind)
+    w["title"].configure(text=title)
+    fill(w, handle)
+    _modal_stack.append(handle)
+
+    _modal_overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
+    _modal_overlay.lift()
+    card = w["card"]
+    card.place(relx=0.5, rely=0.5, anchor="center")
+    card.lift()
+    if MODAL_ANIMATE:
+        _modal_animate(card)
+    root.after_idle(lambda: _modal_record_latency(t0))
+
+def _modal_record_latency(t0):
+    """호출 → 화면 표시(첫 idle)까지 걸린 시간 기록"""
+    ms = (time.perf_counter() - t0) * 1000
+    modal_stats["shown"] += 1
+    modal_stats["last_ms"] = ms
+    modal_stats["avg_ms"] += (ms - modal_stats["avg_ms"]) / modal_stats["shown"]
+    modal_stats["max_ms"] = max(modal_stats["max_ms"], ms)
+
+def get_modal_stats():
+    return dict(modal_stats, visible=len(_modal_stack), pending=len(_modal_queue))
+
+def _modal_animate(card):
     # target size and subtle grow animation
-    root.update_idletasks()
-    tw = max(360, modal.winfo_reqwidth() + 24)
-    th = max(100, modal.winfo_reqheight() + 24)
+    card.update_idletasks()
+    tw = max(360, card.winfo_reqwidth() + 24)
+    th = max(100, card.winfo_reqheight() + 24)
     start = 0.9
     steps = 8
     dur = 120
-    modal.place_configure(width=int(tw*start), height=int(th*start))
+    card.place_configure(width=int(tw*start), height=int(th*start))
     def animate(step=0):
+        if not card.winfo_ismapped():
+            return
         scale = start + (1-start) * (step/steps)
-        modal.place_configure(width=int(tw*scale), height=int(th*scale))
+        card.place_configure(width=int(tw*scale), height=int(th*scale))
         if step < steps:
             root.after(dur//steps, lambda: animate(step+1))
         else:
-            modal.place_configure(width=tw, height=th)
+            card.place_configure(width=tw, height=th)
     animate()
 
+def _modal_close(handle):
+    if handle.closed:
+        return
+    handle.closed = True
+    if handle.on_close:
+        handle.on_close()
+    if handle in _modal_stack:
+        _modal_stack.remove(handle)
+    w = _modal_cards[handle.kind]
+    w["card"].place_forget()
+    if handle.kind == "form":
+        for child in w["body"].winfo_children():
+            child.destroy()
+
+    # 비어 있는 카드 종류의 대기 모달을 순서대로 표시
+    for i, (kind, title, fill) in enumerate(_modal_queue):
+        if not any(h.kind == kind for h in _modal_stack):
+            del _modal_queue[i]
+            _modal_present(kind, title, fill, time.perf_counter())
+            break
+
+    if not _modal_stack:
+        _modal_overlay.place_forget()
+
+def _modal_close_top():
+    if _modal_stack:
+        _modal_stack[-1].destroy()
+
+def _modal_lift():
+    """화면 전환(tkraise) 후에도 떠 있는 모달이 위에 오도록"""
+    if _modal_stack:
+        _modal_overlay.lift()
+
+def show_modal(title, build_func, show_close=True):
+    """form 카드의 본문만 build_func로 다시 채워서 표시 (overlay / 카드는 재사용)"""
+    def fill(w, handle):
+        build_func(w["body"], handle)  # 내부 UI 빌드
+        if show_close:
+            w["close"].configure(command=handle.destroy)
+            w["close"].pack(pady=(10, 10))
+        else:
+            w["close"].pack_forget()
+    _modal_request("form", title, fill)
+
 # Click binding utility
 # ==============================
 def bind_all_children_click(widget, on_click, skip_types=(ctk.CTkButton,)):
@@ -548,10 +1138,164 @@ list_frame        = ctk.CTkFrame(root, fg_color=THEME["bg"])
 quiz_filter_frame = ctk.CTkFrame(root, fg_color=THEME["bg"])
 random_word_frame = ctk.CTkFrame(root, fg_color=THEME["bg"])
 random_word_frame.grid(row=0, column=0, sticky="nsew")
+dashboard_frame   = ctk.CTkFrame(root, fg_color=THEME["bg"])
 
-for f in (deck_select_frame, menu_frame, add_frame, quiz_frame, list_frame, quiz_filter_frame):
+for f in (deck_select_frame, menu_frame, add_frame, quiz_frame, list_frame, quiz_filter_frame, dashboard_frame):
     f.grid(row=0, column=0, sticky="nsew")
 
+# ==============================
+# Undo / Redo
+# ==============================
+# 한 단계 = 패치 목록 (kind, deck, word, before, after)
+#   "word": 단어 레코드 하나 / "deck": 덱 하나 / "all": 덱 전체 (before / after = None이면 없음)
+#   "rollup": 덱 삭제 / 초기화로 지운 대시보드 롤업 (before = rollups_forget()이 돌려준 항목)
+# 레코드는 copy-on-write(mutable_word)라 이전 레코드 / 덱 객체의 참조만 들고 있어도 그대로 스냅샷.
+# 단계별 메모리는 바뀐 레코드 수에 비례 (추정치), 전체는 UNDO_MEMORY_BUDGET / UNDO_MAX_STEPS로 제한.
+UNDO_MAX_STEPS = 200
+UNDO_MEMORY_BUDGET = 64 << 20
+UNDO_RECORD_BYTES = 512     # 단어 레코드 하나의 대략적인 크기 (dict + 문자열)
+
+_undo_stack, _redo_stack = [], []
+_undo_bytes = 0            # undo + redo 스택 전체의 추정 메모리
+_toast = {"label": None, "job": None}
+
+def _patch_cost(patch):
+    kind, _, _, before, after = patch
+    if kind == "word":
+        return UNDO_RECORD_BYTES * ((before is not None) + (after is not None))
+    if kind == "rollup":
+        return UNDO_RECORD_BYTES // 4 * (1 + sum(len(t) for per_deck in before.values() for t in per_deck.values()))
+    sides = [x for x in (before, after) if x]
+    if kind == "deck":
+        return UNDO_RECORD_BYTES * (1 + sum(len(d) for d in sides))
+    return UNDO_RECORD_BYTES * (1 + sum(len(d) for side in sides for d in side.values()))
+
+def undo_record(label, patches, current=None):
+    """방금 적용한 변경을 한 단계로 기록. current = (이전 current_deck, 이후 current_deck)"""
+    global _undo_bytes
+    cost = sum(_patch_cost(p) for p in patches)
+    _undo_bytes -= sum(step["cost"] for step in _redo_stack)
+    _redo_stack.clear()
+    _undo_stack.append({"label": label, "patches": patches, "current": current, "cost": cost})
+    _undo_bytes += cost
+    # 가장 최근 단계는 예산을 넘어도 남김 (초기화 직후에도 되돌릴 수 있게)
+    while len(_undo_stack) > 1 and (len(_undo_stack) > UNDO_MAX_STEPS or _undo_bytes > UNDO_MEMORY_BUDGET):
+        _undo_bytes -= _undo_stack.pop(0)["cost"]
+
+def undo_rename_deck(old, new):
+    """덱 이름 변경 시 기록된 패치의 덱 이름도 따라 바꿈"""
+    for step in _undo_stack + _redo_stack:
+        step["patches"] = [(k, new if d == old else d, w, b, a) for k, d, w, b, a in step["patches"]]
+        for k, _, _, b, _ in step["patches"]:
+            if k == "rollup":
+                for per_deck in b.values():
+                    if old in per_deck:
+                        per_deck[new] = per_deck.pop(old)
+        if step["current"]:
+            step["current"] = tuple(new if c == old else c for c in step["current"])
+
+def _apply_patches(patches, undo):
+    """패치 적용. redo에서 다시 지운 롤업은 그 시점의 내용으로 before를 갱신 → 갱신된 패치 목록"""
+    global decks
+    patches = list(patches)
+    for i in (reversed(range(len(patches))) if undo else range(len(patches))):
+        kind, deck_name, word, before, after = patches[i]
+        value = before if undo else after
+        if kind == "word":
+            deck = decks.setdefault(deck_name, {})
+            if value is None:
+                deck.pop(word, None)
+            else:
+                deck[word] = value
+        elif kind == "deck":
+            if value is None:
+                decks.pop(deck_name, None)
+            else:
+                decks[deck_name] = dict(value)
+        elif kind == "rollup":
+            if undo:
+                rollups_restore(before)
+            else:
+                # 되돌린 뒤 쌓인 기록까지 지우므로, 다음 undo가 복원할 내용도 지금 지운 것으로
+                patches[i] = (kind, deck_name, word, rollups_forget(deck_name), after)
+        else:
+            decks = {n: dict(d) for n, d in value.items()}
+    return patches
+
+def _undo_step(from_stack, to_stack, undo):
+    global current_deck, _undo_bytes
+    if not from_stack:
+        _show_toast("Nothing to undo" if undo else "Nothing to redo")
+        return
+    step = from_stack.pop()
+    to_stack.append(step)
+    step["patches"] = _apply_patches(step["patches"], undo)
+    cost = sum(_patch_cost(p) for p in step["patches"])
+    _undo_bytes += cost - step["cost"]
+    step["cost"] = cost
+    srs_forget()
+    if step["current"]:
+        current_deck = step["current"][0 if undo else 1]
+    if not decks:
+        decks["Default"] = {}
+    if current_deck not in decks:
+        current_deck = next(iter(decks))
+    save_decks()
+    _refresh_after_undo()
+    _show_toast(f"{'↩ Undo' if undo else '↪ Redo'}: {step['label']}")
+
+def undo():
+    _undo_step(_undo_stack, _redo_stack, True)
+
+def redo():
+    _undo_step(_redo_stack, _undo_stack, False)
+
+def _refresh_after_undo():
+    # 퀴즈 세션은 덱 단어 순서 기준 위치라, 순서가 바뀌면(단어 이름 변경 / 삭제 되돌림 등) 이어갈 수 없음
+    quiz_reset = quiz_session is not None and not quiz_session.is_valid()
+    if quiz_reset:
+        quiz_session_discard()
+    if _shown_frame is list_frame:
+        build_word_list()
+    elif _shown_frame is deck_select_frame:
+        build_deck_select()
+    elif _shown_frame is menu_frame:
+        build_main_menu()
+    elif _shown_frame is add_frame:
+        build_add_vocab()
+    elif _shown_frame is quiz_filter_frame:
+        build_quiz_filter()
+    elif _shown_frame is dashboard_frame:
+        build_dashboard()
+    elif _shown_frame is quiz_frame:
+        if quiz_session is None:
+            build_quiz_filter()
+            show_frame(quiz_filter_frame)
+            if quiz_reset:
+                modal_info("The quiz was stopped because its deck changed.")
+        else:
+            _quiz_sync()
+            build_quiz()
+
+def _show_toast(text, ms=1600):
+    """화면 아래쪽에 잠깐 떴다 사라지는 알림 (라벨 하나를 재사용)"""
+    if _toast["label"] is None:
+        _toast["label"] = ctk.CTkLabel(root, text="", font=FONTS["body_bold"], fg_color=THEME["panel"],
+                                       text_color=THEME["text"], corner_radius=RADIUS["sm"])
+    if _toast["job"]:
+        root.after_cancel(_toast["job"])
+    _toast["label"].configure(text=f"  {text}  ")
+    _toast["label"].place(relx=0.5, rely=0.97, anchor="s")
+    _toast["label"].lift()
+    _toast["job"] = root.after(ms, lambda: (_toast["label"].place_forget(), _toast.update(job=None)))
+
+def _on_undo_key(event, action):
+    # 입력칸 안에서는 무시, 모달이 떠 있으면 (편집 중인 값과 어긋나지 않게) 무시
+    if isinstance(event.widget, (tk.Entry, tk.Text)) or _modal_stack:
+        return
+    action()
+    return "break"
+
 # ==============================
 # Deck Management
 # ==============================
@@ -561,6 +1305,7 @@ def select_deck(deck_name):
     current_deck = deck_name
     build_main_menu()
     show_frame(menu_frame)
+    prerender_deck(deck_name)  # 발음 미리 렌더링 (백그라운드)
 
 def open_deck_popup():
     def build(parent, overlay):
@@ -608,6 +1353,10 @@ def rename_deck(deck_name):
                 return
 
             decks[new] = decks.pop(deck_name)
+            srs_forget(deck_name)
+            rollups_rename(deck_name, new)
+            history_rename_deck(deck_name, new)
+            undo_rename_deck(deck_name, new)
             global current_deck
             if current_deck == deck_name:
                 current_deck = new
@@ -624,16 +1373,21 @@ def confirm_delete_deck(deck_name):
     def build(parent, overlay):
         ctk.CTkLabel(
             parent,
-            text=f"Delete deck '{deck_name}'?\nThis cannot be undone.",
+            text=f"Delete deck '{deck_name}'?\n(Ctrl+Z to undo)",
             text_color=THEME["muted"], justify="center"
         ).pack(pady=SPACING["sm"])
         def do_delete():
             global current_deck
-            decks.pop(deck_name, None)
+            prev_current = current_deck
+            patches = [("deck", deck_name, None, decks.pop(deck_name, None), None)]
+            srs_forget(deck_name)
+            patches.append(("rollup", deck_name, None, rollups_forget(deck_name), None))
             if not decks:
                 decks["Default"] = {}
+                patches.append(("deck", "Default", None, None, {}))
             if current_deck == deck_name:
                 current_deck = list(decks.keys())[0]
+            undo_record(f"Delete deck '{deck_name}'", patches, (prev_current, current_deck))
             save_decks()
             overlay.destroy()
             build_deck_select()
@@ -658,9 +1412,10 @@ def copy_deck(deck_name):
             if new in decks:
                 modal_info(f"ℹ️ '{new}' already exists.")
                 return
-            # deep copy via JSON serialization
-            decks[new] = json.loads(json.dumps(decks[deck_name], ensure_ascii=False))
-            save_decks()
+            # 얕은 복사: 단어 레코드는 공유, 고칠 때 mutable_word()가 그 레코드만 복제
+            decks[new] = dict(decks[deck_name])
+            srs_forget(new)
+            journal_append({"op": "copy", "src": deck_name, "dst": new})
             overlay.destroy()
             build_deck_select()
         row = ctk.CTkFrame(parent, fg_color="transparent")
@@ -673,43 +1428,157 @@ def copy_deck(deck_name):
 # Excel Import
 # ==============================
 
-def import_excel_to_deck(filepath, deck_name="Imported"):
-    try:
-        # 1) 기존 덱 이름 중복 체크
-        if deck_name in decks:
-            modal_warn(f"⚠️ Deck '{deck_name}' already exists.\nPlease choose a different name.")
-            return
+def merge_words_into_deck(deck_name, new_words):
+    """가져온 단어들을 기존 덱에 한 번에 반영 (추가 + 변경만, 삭제 없음). 병합 규칙은 Merge 대화상자와 같음
+    (merge_word: 비어 있지 않은 칸만 갱신, 상태/복습 기록 유지). 저장은 호출한 쪽에서 한 번. → (추가 수, 갱신 수)"""
+    deck = decks.setdefault(deck_name, {})
+    diff = diff_deck(deck, new_words)
+    apply_deck_diff(deck_name, new_words, diff, remove=False)
+    return len(diff["add"]), len(diff["change"])
+
+def apply_deck_diff(deck_name, incoming, diff, remove=True):
+    """diff_deck 결과 중 추가 / 변경 / (선택) 삭제만 반영. 변경된 단어는 merge_word로 합침 (상태 / 복습 기록 유지)"""
+    deck = decks[deck_name]
+    if remove:
+        for w in diff["remove"]:
+            deck.pop(w, None)
+    for w in diff["add"]:
+        deck[w] = incoming[w]
+    for w in diff["change"]:
+        deck[w] = merge_word(deck[w], incoming[w])
+    srs_forget(deck_name)
+
+def _confirm_merge(deck_name, incoming):
+    """변경 요약(추가 / 변경 / 삭제 / 동일)을 보여주고 Apply를 누르면 한 번에 반영 + 한 번 저장"""
+    diff = diff_deck(decks[deck_name], incoming)
+    remove_var = tk.BooleanVar(value=True)
+
+    def preview(words):
+        shown = ", ".join(words[:5])
+        return shown + (f", … (+{len(words) - 5:,})" if len(words) > 5 else "")
 
-        df = pd.read_excel(filepath, header=None)
-        if len(df) > 100:
-            modal_error("A deck can contain at most 100 words.\nPlease reduce rows in Excel.")
-            return
+    def build(parent, overlay):
+        for mark, key, label, color in (("+", "add", "new", THEME["success"]),
+                                        ("~", "change", "changed", THEME["warn"]),
+                                        ("−", "remove", "not in file", THEME["danger"])):
+            words = diff[key]
+            text = f"{mark} {len(words):,} {label}" + (f":  {preview(words)}" if words else "")
+            ctk.CTkLabel(parent, text=text, font=FONTS["body"], text_color=color, anchor="w",
+                         wraplength=420, justify="left").pack(fill="x", padx=SPACING["md"], pady=1)
+        ctk.CTkLabel(parent, text=f"= {diff['same']:,} unchanged", font=FONTS["body"], text_color=THEME["muted"],
+                     anchor="w").pack(fill="x", padx=SPACING["md"], pady=1)
+        if diff["remove"]:
+            ctk.CTkCheckBox(parent, text=f"Remove {len(diff['remove']):,} words not in the file", variable=remove_var,
+                            checkbox_width=16, checkbox_height=16, font=FONTS["body"], border_width=2)\
+                .pack(anchor="w", padx=SPACING["md"], pady=(SPACING["sm"], 0))
 
-        new_deck = {}
-        for _, row in df.iterrows():
-            word    = str(row.iloc[0]).strip() if len(row) > 0 and not pd.isna(row.iloc[0]) else ""
-            if not word:
-                continue
-            pos     = str(row.iloc[1]).strip() if len(row) > 1 and not pd.isna(row.iloc[1]) else "null"
-            meaning = str(row.iloc[2]).strip() if len(row) > 2 and not pd.isna(row.iloc[2]) else ""
-            example = str(row.iloc[3]).strip() if len(row) > 3 and not pd.isna(row.iloc[3]) else ""
-            new_deck[word] = {
-                "part_of_speech": pos,
-                "meaning": meaning,
-                "example": example,
-                "status": "unknown"
-            }
+        def apply():
+            apply_deck_diff(deck_name, incoming, diff, remove=remove_var.get())
+            save_decks()
+            overlay.destroy()
+            build_deck_select()
+            show_frame(deck_select_frame)
+            modal_info(f"✅ '{deck_name}' updated.")
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["md"])
+        ctk.CTkButton(row, text="Apply", command=apply, **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
+        ctk.CTkButton(row, text="Cancel", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+
+    show_modal(f"Merge • {deck_name}", build, show_close=False)
+
+def import_excel_to_deck(filepath, deck_name="Imported", merge=False, columns=DEFAULT_COLUMNS):
+    """워커 스레드에서 파싱 → 진행 상황은 root.after로 모달에 표시 → 끝나면 메인 스레드에서 한 번에 반영.
+    Cancel / 모달 닫기 시 덱은 추가되지 않음. merge=True면 같은 이름의 덱에 변경분만 병합.
+    columns = (word, pos, meaning, example)를 읽을 원본 열 번호 (미리보기에서 지정)"""
+    # 1) 기존 덱 이름 중복 체크
+    if deck_name in decks and not merge:
+        modal_warn(f"⚠️ Deck '{deck_name}' already exists.\nChoose a different name or turn on Merge.")
+        return
+
+    cancel = threading.Event()
+    ui = {}
+
+    def shown():
+        return "handle" in ui and not ui["handle"].closed
+
+    def on_total(total):
+        ui["total"] = total
+        if shown() and total:
+            ui["bar"].stop()
+            ui["bar"].configure(mode="determinate")
+            ui["bar"].set(0)
 
+    def on_progress(read, accepted, skipped):
+        if not shown():
+            return
+        ui["label"].configure(text=f"Read {read:,}   •   Accepted {accepted:,}   •   Skipped {skipped:,}")
+        if ui.get("total"):
+            ui["bar"].set(min(read / ui["total"], 1))
+
+    def finish(new_deck, error):
+        ui["done"] = True
+        if shown():
+            ui["handle"].on_close = None
+            ui["handle"].destroy()
+        if error is not None:
+            modal_error(f"Import Error\n{error}")
+            return
+        if new_deck is None:
+            modal_info("Import cancelled.")
+            return
+        if deck_name in decks:
+            if merge:
+                _confirm_merge(deck_name, new_deck)
+            else:
+                modal_warn(f"⚠️ Deck '{deck_name}' already exists.\nChoose a different name or turn on Merge.")
+            return
+        # 2) 완성된 덱을 한 번에 추가 + 한 번 저장
         decks[deck_name] = new_deck
+        srs_forget(deck_name)
         save_decks()
         global current_deck
         current_deck = deck_name
         build_deck_select()
         show_frame(deck_select_frame)
-        modal_info(f"✅ '{deck_name}' deck imported.")
+        modal_info(f"✅ '{deck_name}' deck imported ({len(new_deck):,} words).")
 
-    except Exception as e:
-        modal_error(f"Import Error\n{e}")
+    def worker():
+        rows = None
+        try:
+            rows = iter_import_rows(filepath, on_total=lambda total: root.after(0, on_total, total), columns=columns)
+            new_deck = rows_to_deck(rows, lambda *c: root.after(0, on_progress, *c), cancel)
+            root.after(0, finish, new_deck, None)
+        except Exception as e:
+            root.after(0, finish, None, e)
+        finally:
+            if rows is not None:
+                rows.close()  # 취소돼도 워크북은 닫음
+
+    def build(parent, overlay):
+        if ui.get("done"):
+            root.after(0, overlay.destroy)  # 모달이 뜨기 전에 이미 끝남
+            return
+        ui["handle"] = overlay
+        overlay.on_close = cancel.set
+        ctk.CTkLabel(parent, text=os.path.basename(filepath), font=FONTS["body_bold"]).pack(pady=(0, SPACING["xs"]))
+        ui["bar"] = ctk.CTkProgressBar(parent, width=300, height=10, fg_color=THEME["card"], progress_color=THEME["gold"])
+        ui["bar"].pack(pady=SPACING["xs"])
+        if ui.get("total"):
+            ui["bar"].set(0)
+        else:
+            ui["bar"].configure(mode="indeterminate")
+            ui["bar"].start()
+        ui["label"] = ctk.CTkLabel(parent, text="Reading…", font=FONTS["body"], text_color=THEME["muted"])
+        ui["label"].pack(pady=(0, SPACING["sm"]))
+
+        def do_cancel():
+            cancel.set()
+            ui["label"].configure(text="Cancelling…")
+        ctk.CTkButton(parent, text="Cancel", command=do_cancel, **BTN_GHOST).pack(pady=(0, SPACING["sm"]))
+
+    show_modal(f"Importing • {deck_name}", build, show_close=False)
+    threading.Thread(target=worker, daemon=True).start()
 
 def open_excel_import_popup():
     def build(parent, overlay):
@@ -718,11 +1587,13 @@ def open_excel_import_popup():
 
         row = ctk.CTkFrame(parent, fg_color="transparent")
         row.pack(pady=(SPACING["xs"], 0))
-        ctk.CTkEntry(row, textvariable=path_var, width=260, placeholder_text="Select .xlsx").pack(side="left")
+        ctk.CTkEntry(row, textvariable=path_var, width=260, placeholder_text="Select .xlsx / .csv").pack(side="left")
         def browse():
             fp = filedialog.askopenfilename(
-                title="Select Excel",
-                filetypes=[("Excel files","*.xlsx *.xls")]
+                title="Select Excel / CSV",
+                filetypes=[("Spreadsheets", "*.xlsx *.xls *.csv *.tsv *.txt"),
+                           ("Excel files", "*.xlsx *.xls"),
+                           ("CSV / TSV", "*.csv *.tsv *.txt")]
             )
             if fp: path_var.set(fp)
         ctk.CTkButton(row, text="Browse", command=browse, **BTN_SMALL).pack(side="left", padx=SPACING["sm"])
@@ -730,7 +1601,12 @@ def open_excel_import_popup():
         ctk.CTkLabel(parent, text="Deck Name", font=FONTS["body"]).pack(pady=(SPACING["sm"], SPACING["xs"]))
         ctk.CTkEntry(parent, textvariable=name_var, width=260).pack()
 
-        hint = "Format: A=Word | B=Part of Speech | C=Meaning | D=Example\n(Up to 100 rows)"
+        merge_var = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(parent, text="Merge into existing deck (keeps learning status)", variable=merge_var,
+                        checkbox_width=16, checkbox_height=16, font=FONTS["body"], border_width=2)\
+            .pack(pady=(SPACING["sm"], 0))
+
+        hint = "Format: A=Word | B=Part of Speech | C=Meaning | D=Example"
         ctk.CTkLabel(parent, text=hint, text_color=THEME["muted"]).pack(pady=SPACING["sm"])
 
         def go():
@@ -738,13 +1614,383 @@ def open_excel_import_popup():
                 modal_warn("⚠️ File path and deck name required.")
                 return
             overlay.destroy()
-            import_excel_to_deck(path_var.get().strip(), name_var.get().strip())
+            open_import_preview(path_var.get().strip(), name_var.get().strip(), merge_var.get())
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["md"])
+        ctk.CTkButton(row, text="Preview", command=go, **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
+        ctk.CTkButton(row, text="Cancel", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+    show_modal("Import Deck (Excel / CSV)", open_excel_import_popup_inner := build, show_close=False)
+
+# ----- 가져오기 미리보기 + 열 매핑 -----
+IMPORT_FIELDS = (("Word", 150), ("Part of Speech", 90), ("Meaning", 170), ("Example", 170))
+NO_COLUMN = "—"
+
+def _column_letter(i):
+    return chr(ord("A") + i)
+
+def open_import_preview(filepath, deck_name, merge=False):
+    """앞 PREVIEW_ROWS행 + 행 수만 워커 스레드에서 읽어 표시 → 열 매핑(A~D) 조정 후 Import"""
+    if deck_name in decks and not merge:
+        modal_warn(f"⚠️ Deck '{deck_name}' already exists.\nChoose a different name or turn on Merge.")
+        return
+    ui = {}
+
+    def loaded(preview, error):
+        ui["done"] = True
+        if "handle" in ui:
+            if ui["handle"].closed:
+                return  # 읽는 중에 닫음 = 취소
+            ui["handle"].destroy()
+        if error is not None:
+            modal_error(f"Import Error\n{error}")
+        else:
+            _show_import_preview(filepath, deck_name, merge, preview)
+
+    def worker():
+        try:
+            root.after(0, loaded, preview_import_file(filepath), None)
+        except Exception as e:
+            root.after(0, loaded, None, e)
+
+    def build(parent, overlay):
+        if ui.get("done"):
+            root.after(0, overlay.destroy)
+            return
+        ui["handle"] = overlay
+        ctk.CTkLabel(parent, text="Reading first rows…", font=FONTS["body"], text_color=THEME["muted"])\
+            .pack(padx=SPACING["lg"], pady=SPACING["md"])
+
+    show_modal(f"Preview • {deck_name}", build)
+    threading.Thread(target=worker, daemon=True).start()
+
+def _show_import_preview(filepath, deck_name, merge, preview):
+    rows = preview["rows"]
+    letters = [_column_letter(i) for i in range(max(preview["columns"], 1))]
+    col_vars = [tk.StringVar(value=(letters[c] if c < len(letters) else NO_COLUMN)) for c in DEFAULT_COLUMNS]
+
+    def mapping():
+        return tuple(None if v.get() == NO_COLUMN else letters.index(v.get()) for v in col_vars)
+
+    def build(parent, overlay):
+        total = preview["total"]
+        if total is None:
+            count = f"first {len(rows)} rows"
+        else:
+            count = f"first {min(len(rows), total)} of {'~' if preview['approx'] else ''}{total:,} rows"
+        ctk.CTkLabel(parent, text=f"{os.path.basename(filepath)}  •  {count}", font=FONTS["body"],
+                     text_color=THEME["muted"]).pack(pady=(0, SPACING["xs"]))
+
+        table = ctk.CTkScrollableFrame(parent, fg_color=THEME["card"], width=600, height=220)
+        for i, (label, width) in enumerate(IMPORT_FIELDS):
+            table.grid_columnconfigure(i, minsize=width)
+            ctk.CTkLabel(table, text=label, font=FONTS["body_bold"]).grid(row=0, column=i, sticky="w", padx=SPACING["xs"])
+            ctk.CTkOptionMenu(
+                table,
+                variable=col_vars[i],
+                values=letters + ([] if i == 0 else [NO_COLUMN]),   # 단어 열은 필수
+                width=70,
+                fg_color=THEME["panel"],
+                button_color=THEME["gold"],
+                button_hover_color=THEME["gold_dim"],
+                text_color=THEME["text"],
+                command=lambda _v: fill()
+            ).grid(row=1, column=i, sticky="w", padx=SPACING["xs"], pady=(0, SPACING["xs"]))
+        cells = []
+
+        def fill():
+            for c in cells:
+                c.destroy()
+            cells.clear()
+            cols = mapping()
+            for r, row in enumerate(rows, start=2):
+                for i, c in enumerate(cols):
+                    text = row[c] if c is not None and c < len(row) else ""
+                    color = THEME["text"] if i or text else THEME["danger"]   # 단어가 비면 건너뛸 행
+                    cell = ctk.CTkLabel(table, text=text if len(text) <= 40 else text[:39] + "…",
+                                        font=FONTS["body"], text_color=color, anchor="w")
+                    cell.grid(row=r, column=i, sticky="w", padx=SPACING["xs"])
+                    cells.append(cell)
+
+        fill()
+        table.pack(padx=SPACING["md"], pady=SPACING["xs"])
+        if not rows:
+            ctk.CTkLabel(parent, text="⚠️ No rows found.", text_color=THEME["danger"]).pack()
+
+        def go():
+            overlay.destroy()
+            import_excel_to_deck(filepath, deck_name, merge=merge, columns=mapping())
 
         row = ctk.CTkFrame(parent, fg_color="transparent")
         row.pack(pady=SPACING["md"])
-        ctk.CTkButton(row, text="Import", command=go, **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
+        ctk.CTkButton(row, text="Import", command=go, state=("normal" if rows else "disabled"),
+                      **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
         ctk.CTkButton(row, text="Cancel", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
-    show_modal("Import Excel Deck", open_excel_import_popup_inner := build, show_close=False)
+
+    show_modal(f"Preview • {deck_name}", build, show_close=False)
+
+# ----- 여러 파일 한 번에 가져오기 (프로세스 풀) -----
+IMPORT_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+def _start_import_pool(paths):
+    """spawn 프로세스 풀에 파일별 parse_import_file 제출.
+    spawn 자식은 부모의 __main__(이 GUI 스크립트)을 다시 실행하므로, 제출(=자식 생성)하는 동안만
+    __main__.__spec__을 vocab_io로 바꿔 자식이 GUI 없이 vocab_io만 import하게 함."""
+    import importlib.util
+    cf = _lazy_import("concurrent.futures")
+    mp = _lazy_import("multiprocessing")
+    pool = cf.ProcessPoolExecutor(max_workers=min(len(paths), IMPORT_MAX_WORKERS), mp_context=mp.get_context("spawn"))
+    main = sys.modules["__main__"]
+    saved = getattr(main, "__spec__", None)
+    main.__spec__ = importlib.util.find_spec("vocab_io")
+    try:
+        futures = [pool.submit(parse_import_file, p) for p in paths]
+    finally:
+        main.__spec__ = saved
+    return pool, futures
+
+def batch_import_files(paths):
+    """여러 파일을 프로세스 풀에서 동시에 파싱 → 파일별 시간/오류 보고 → 확인하면 한 번에 반영 + 한 번 저장"""
+    results = []
+    cancel = threading.Event()
+    ui = {}
+
+    def shown():
+        return "handle" in ui and not ui["handle"].closed
+
+    def on_result(res):
+        results.append(res)
+        if shown():
+            ui["bar"].set(len(results) / len(paths))
+            ui["label"].configure(text=f"Parsed {len(results)} / {len(paths)} files")
+
+    def finish(error, wall):
+        ui["done"] = True
+        if shown():
+            ui["handle"].on_close = None
+            ui["handle"].destroy()
+        if error is not None:
+            modal_error(f"Import Error\n{error}")
+        elif cancel.is_set():
+            modal_info("Import cancelled.")
+        else:
+            _batch_import_report(results, wall)
+
+    def worker():
+        t0 = time.perf_counter()
+        pool = None
+        try:
+            pool, futures = _start_import_pool(paths)
+            for fut in _lazy_import("concurrent.futures").as_completed(futures):
+                if cancel.is_set():
+                    break
+                root.after(0, on_result, fut.result())
+            root.after(0, finish, None, time.perf_counter() - t0)
+        except Exception as e:
+            root.after(0, finish, e, 0)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def build(parent, overlay):
+        if ui.get("done"):
+            root.after(0, overlay.destroy)
+            return
+        ui["handle"] = overlay
+        overlay.on_close = cancel.set
+        ui["bar"] = ctk.CTkProgressBar(parent, width=300, height=10, fg_color=THEME["card"], progress_color=THEME["gold"])
+        ui["bar"].pack(pady=SPACING["xs"])
+        ui["bar"].set(len(results) / len(paths))
+        ui["label"] = ctk.CTkLabel(parent, text=f"Parsing {len(paths)} files…", font=FONTS["body"], text_color=THEME["muted"])
+        ui["label"].pack(pady=(0, SPACING["sm"]))
+
+        def do_cancel():
+            cancel.set()
+            ui["label"].configure(text="Cancelling…")
+        ctk.CTkButton(parent, text="Cancel", command=do_cancel, **BTN_GHOST).pack(pady=(0, SPACING["sm"]))
+
+    show_modal("Batch Import", build, show_close=False)
+    threading.Thread(target=worker, daemon=True).start()
+
+def _batch_import_report(results, wall):
+    """파일별 결과(단어 수 / 건너뛴 행 / 파싱 시간 / 오류) 표시 → Import 누르면 성공한 파일만 한 번에 반영.
+    시트가 여러 개인 통합 문서는 시트마다 덱 하나"""
+    results = sorted(results, key=lambda r: r["path"])
+    ok = [r for r in results if r["decks"] is not None]
+
+    def build(parent, overlay):
+        box = ctk.CTkScrollableFrame(parent, width=520, height=220, fg_color=THEME["card"])
+        box.pack(pady=(0, SPACING["sm"]))
+        for r in results:
+            base = os.path.basename(r["path"])
+            if r["error"]:
+                text, color = f"❌ {base}  —  {r['error']}", THEME["danger"]
+            else:
+                targets = ", ".join(f"{name} ({'merge' if name in decks else 'new deck'})" for name, _ in r["decks"])
+                count = sum(len(words) for _, words in r["decks"])
+                text = (f"✅ {base}  →  {targets or 'nothing to import'}  •  {count:,} words  •  "
+                        f"{r['skipped']:,} skipped  •  {r['seconds']:.2f}s")
+                color = THEME["text"]
+            ctk.CTkLabel(box, text=text, font=FONTS["body"], text_color=color, anchor="w",
+                         wraplength=500, justify="left").pack(fill="x", pady=1)
+
+        cpu = sum(r["seconds"] for r in results)
+        ctk.CTkLabel(
+            parent,
+            text=(f"{len(ok)} / {len(results)} files  •  {sum(len(words) for r in ok for _, words in r['decks']):,} words  •  "
+                  f"wall {wall:.2f}s  •  parse total {cpu:.2f}s"),
+            font=FONTS["body"], text_color=THEME["muted"]
+        ).pack(pady=(0, SPACING["sm"]))
+
+        def commit():
+            # 모든 파일을 한 번에 반영하고 저장도 한 번 (같은 덱 이름이면 차례로 병합)
+            for r in ok:
+                for name, words in r["decks"]:
+                    merge_words_into_deck(name, words)
+            save_decks()
+            overlay.destroy()
+            build_deck_select()
+            show_frame(deck_select_frame)
+            modal_info(f"✅ Imported {len(ok)} file(s).")
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["sm"])
+        ctk.CTkButton(row, text="Import", command=commit, state=("normal" if ok else "disabled"), **BTN_SOLID)\
+            .pack(side="left", padx=SPACING["sm"])
+        ctk.CTkButton(row, text="Cancel", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+
+    show_modal("Batch Import", build, show_close=False)
+
+def open_batch_import():
+    paths = filedialog.askopenfilenames(
+        title="Select Excel / CSV files",
+        filetypes=[("Spreadsheets", "*.xlsx *.xls *.csv *.tsv *.txt")]
+    )
+    if paths:
+        batch_import_files(list(paths))
+
+# ----- 내보내기 (덱 하나 / 현재 필터 결과 / 전체) -----
+EXPORT_SCOPES = {"deck": "This Deck", "filtered": "Filtered View", "all": "All Decks"}
+
+def _iter_deck_items(deck_name):
+    """덱 단어를 워커 스레드에서 하나씩 꺼냄 (키 목록만 복사, 그 사이 지워진 단어는 건너뜀)"""
+    deck = decks.get(deck_name, {})
+    for w in list(deck):
+        info = deck.get(w)
+        if info is not None:
+            yield w, info
+
+def _export_sections(scope):
+    """scope → ([(덱 이름, (word, info) 이터러블, 행 수 상한)], 총 단어 수)"""
+    if scope == "filtered":
+        return [(current_deck, filtered_words, len(filtered_words))], len(filtered_words)
+    names = list(decks) if scope == "all" else [current_deck]
+    return [(n, _iter_deck_items(n), len(decks[n])) for n in names], sum(len(decks[n]) for n in names)
+
+def export_to_file(filepath, scope):
+    """워커 스레드에서 export_words로 스트리밍 기록, 진행 상황은 root.after로 모달에 표시"""
+    sections, total = _export_sections(scope)
+    cancel = threading.Event()
+    ui = {}
+
+    def shown():
+        return "handle" in ui and not ui["handle"].closed
+
+    def on_progress(count):
+        if shown():
+            ui["bar"].set(count / total if total else 1)
+            ui["label"].configure(text=f"{count:,} / {total:,} words")
+
+    def finish(count, error):
+        ui["done"] = True
+        if shown():
+            ui["handle"].on_close = None
+            ui["handle"].destroy()
+        if error is not None:
+            modal_error(f"Export Error\n{error}")
+        elif count is None:
+            modal_info("Export cancelled.")
+        else:
+            modal_info(f"✅ Exported {count:,} words\n{os.path.basename(filepath)}")
+
+    def worker():
+        try:
+            count = export_words(filepath, sections, lambda c: root.after(0, on_progress, c), cancel)
+            root.after(0, finish, count, None)
+        except Exception as e:
+            root.after(0, finish, None, e)
+
+    def build(parent, overlay):
+        if ui.get("done"):
+            root.after(0, overlay.destroy)
+            return
+        ui["handle"] = overlay
+        overlay.on_close = cancel.set
+        ctk.CTkLabel(parent, text=os.path.basename(filepath), font=FONTS["body_bold"]).pack(pady=(0, SPACING["xs"]))
+        ui["bar"] = ctk.CTkProgressBar(parent, width=300, height=10, fg_color=THEME["card"], progress_color=THEME["gold"])
+        ui["bar"].pack(pady=SPACING["xs"])
+        ui["bar"].set(0)
+        ui["label"] = ctk.CTkLabel(parent, text="Writing…", font=FONTS["body"], text_color=THEME["muted"])
+        ui["label"].pack(pady=(0, SPACING["sm"]))
+
+        def do_cancel():
+            cancel.set()
+            ui["label"].configure(text="Cancelling…")
+        ctk.CTkButton(parent, text="Cancel", command=do_cancel, **BTN_GHOST).pack(pady=(0, SPACING["sm"]))
+
+    show_modal("Exporting", build, show_close=False)
+    threading.Thread(target=worker, daemon=True).start()
+
+def open_export_popup(scope="deck"):
+    """범위(덱 / 필터 결과 / 전체)와 형식(xlsx / csv / jsonl) 선택 → 저장 위치 선택 → export_to_file"""
+    if not decks:
+        modal_info("No decks available.")
+        return
+    scopes = {k: v for k, v in EXPORT_SCOPES.items()
+              if (k != "filtered" or scope == "filtered") and (k == "all" or current_deck in decks)}
+    scope_var = tk.StringVar(value=scopes.get(scope, EXPORT_SCOPES["all"]))
+    fmt_var = tk.StringVar(value=EXPORT_FORMATS["xlsx"])
+
+    def build(parent, overlay):
+        for var, values in ((scope_var, list(scopes.values())), (fmt_var, list(EXPORT_FORMATS.values()))):
+            ctk.CTkSegmentedButton(
+                parent,
+                values=values,
+                variable=var,
+                width=300,
+                font=FONTS["body_bold"],
+                selected_color=THEME["gold"],
+                selected_hover_color=THEME["gold_dim"],
+                unselected_color=THEME["panel"],
+                unselected_hover_color=THEME["card_hover"],
+                text_color=THEME["text"]
+            ).pack(pady=(SPACING["xs"], SPACING["sm"]))
+        hint = ("Excel: one sheet per deck, A=Word | B=Part of Speech | C=Meaning | D=Example\n"
+                "(Batch Import restores every sheet as its own deck; Import reads the first sheet only)")
+        ctk.CTkLabel(parent, text=hint, text_color=THEME["muted"], wraplength=320).pack(pady=SPACING["xs"])
+
+        def go():
+            chosen = next(k for k, v in scopes.items() if v == scope_var.get())
+            fmt = next(k for k, v in EXPORT_FORMATS.items() if v == fmt_var.get())
+            fp = filedialog.asksaveasfilename(
+                title="Export",
+                defaultextension=f".{fmt}",
+                initialfile=f"{'VocabKing' if chosen == 'all' else current_deck}.{fmt}",
+                filetypes=[(EXPORT_FORMATS[fmt], f"*.{fmt}")]
+            )
+            if not fp:
+                return
+            if not fp.lower().endswith(f".{fmt}"):
+                fp += f".{fmt}"
+            overlay.destroy()
+            export_to_file(fp, chosen)
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["md"])
+        ctk.CTkButton(row, text="Export", command=go, **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
+        ctk.CTkButton(row, text="Cancel", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+
+    show_modal("Export", build, show_close=False)
 
 def show_rank_info():
     rank_info = (
@@ -801,7 +2047,7 @@ def build_deck_select():
     hero_row = ctk.CTkFrame(hero, fg_color="transparent")
     hero_row.pack(anchor="center")
 
-    logo_img = ctk.CTkImage(Image.open(resource_path("assets/logo.png")), size=(100, 100))
+    logo_img = get_image("logo")
     logo_lbl = ctk.CTkLabel(hero_row, image=logo_img, text="")
     logo_lbl.pack(side="left", padx=(0, SPACING["md"]))
 
@@ -903,12 +2149,6 @@ def build_deck_select():
 
         ctk.CTkLabel(left, text=name, font=FONTS["h2"]).pack(anchor="w")
 
-        status_icons = {
-            "unknown": icon_unknown_img,
-            "partial": icon_partial_img,
-            "known": icon_known_img
-        }
-
         stats_row = ctk.CTkFrame(left, fg_color="transparent")
         stats_row.pack(anchor="w", pady=(SPACING["xs"], 0))
 
@@ -921,17 +2161,17 @@ def build_deck_select():
         ).pack(side="left")
 
         # Known
-        ctk.CTkLabel(stats_row, image=status_icons["known"], text="").pack(side="left", padx=(0, 4))
+        ctk.CTkLabel(stats_row, image=STATUS_ICONS["known"], text="").pack(side="left", padx=(0, 4))
         ctk.CTkLabel(stats_row, text=str(counts["known"]), font=FONTS["body"], text_color=THEME["muted"]).pack(
             side="left", padx=(0, 8))
 
         # Partial
-        ctk.CTkLabel(stats_row, image=status_icons["partial"], text="").pack(side="left", padx=(0, 4))
+        ctk.CTkLabel(stats_row, image=STATUS_ICONS["partial"], text="").pack(side="left", padx=(0, 4))
         ctk.CTkLabel(stats_row, text=str(counts["partial"]), font=FONTS["body"], text_color=THEME["muted"]).pack(
             side="left", padx=(0, 8))
 
         # Unknown
-        ctk.CTkLabel(stats_row, image=status_icons["unknown"], text="").pack(side="left", padx=(0, 4))
+        ctk.CTkLabel(stats_row, image=STATUS_ICONS["unknown"], text="").pack(side="left", padx=(0, 4))
         ctk.CTkLabel(stats_row, text=str(counts["unknown"]), font=FONTS["body"], text_color=THEME["muted"]).pack(
             side="left")
 
@@ -965,6 +2205,8 @@ def build_deck_select():
     footer = ctk.CTkFrame(deck_select_frame, fg_color="transparent")
     footer.pack(pady=(0, SPACING["xl"]))
     ctk.CTkButton(footer, text="Import", command=open_excel_import_popup, width=180, **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
+    ctk.CTkButton(footer, text="Batch Import", command=open_batch_import, width=180, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+    ctk.CTkButton(footer, text="Export", command=lambda: open_export_popup("all"), width=180, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
     ctk.CTkButton(footer, text="Add Deck", command=open_deck_popup, width=180, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
 
 # ==============================
@@ -1000,12 +2242,6 @@ def build_main_menu():
     ctk.CTkLabel(card, text=f"Deck • {cd}", font=FONTS["h1"], text_color=THEME["gold"]).pack(pady=(SPACING["md"],0), padx=SPACING["xl"], anchor="w")
     total, counts, progress, _ = get_deck_stats(decks[cd])
 
-    status_icons = {
-        "unknown": icon_unknown_img,
-        "partial": icon_partial_img,
-        "known": icon_known_img
-    }
-
     stats_row = ctk.CTkFrame(card, fg_color="transparent")
     stats_row.pack(pady=(0, SPACING["md"]), padx=SPACING["xl"], anchor="w")
 
@@ -1018,17 +2254,17 @@ def build_main_menu():
     ).pack(side="left")
 
     # Known
-    ctk.CTkLabel(stats_row, image=status_icons["known"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["known"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts["known"]), font=FONTS["body"], text_color=THEME["muted"]).pack(side="left",
                                                                                                            padx=(0, 12))
 
     # Partial
-    ctk.CTkLabel(stats_row, image=status_icons["partial"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["partial"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts["partial"]), font=FONTS["body"], text_color=THEME["muted"]).pack(
         side="left", padx=(0, 12))
 
     # Unknown
-    ctk.CTkLabel(stats_row, image=status_icons["unknown"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["unknown"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts["unknown"]), font=FONTS["body"], text_color=THEME["muted"]).pack(
         side="left")
 
@@ -1050,13 +2286,20 @@ def build_main_menu():
         command=lambda: (build_random_word_challenge(), show_frame(random_word_frame)),
         **BTN_GHOST
     ).grid(row=3, column=0, padx=SPACING["md"], pady=SPACING["sm"])
+    ctk.CTkButton(
+        actions,
+        text="📈  Dashboard",
+        width=240,
+        command=lambda: (build_dashboard(), show_frame(dashboard_frame)),
+        **BTN_GHOST
+    ).grid(row=4, column=0, padx=SPACING["md"], pady=SPACING["sm"])
     ctk.CTkButton(
         actions,
         text="🔙  Deck Select",
         width=240,
         command=lambda: (build_deck_select(), show_frame(deck_select_frame)),
         **BTN_GHOST
-    ).grid(row=4, column=0, padx=SPACING["md"], pady=SPACING["sm"])
+    ).grid(row=5, column=0, padx=SPACING["md"], pady=SPACING["sm"])
 
 # ==============================
 # Add / Edit Word
@@ -1107,12 +2350,6 @@ def build_add_vocab():
     # 덱 통계 + 진행바 (Choose Quiz처럼)
     total, counts, progress, _ = get_deck_stats(decks.get(cd, {}))
 
-    status_icons = {
-        "unknown": icon_unknown_img,
-        "partial": icon_partial_img,
-        "known":   icon_known_img
-    }
-
     stats_row = ctk.CTkFrame(header_card, fg_color="transparent")
     stats_row.pack(pady=(0, SPACING["md"]), padx=SPACING["xl"], anchor="w")
 
@@ -1123,13 +2360,13 @@ def build_add_vocab():
         text_color=THEME["muted"]
     ).pack(side="left")
 
-    ctk.CTkLabel(stats_row, image=status_icons["known"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["known"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts.get("known", 0)), font=FONTS["body"], text_color=THEME["muted"]).pack(side="left", padx=(0, 12))
 
-    ctk.CTkLabel(stats_row, image=status_icons["partial"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["partial"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts.get("partial", 0)), font=FONTS["body"], text_color=THEME["muted"]).pack(side="left", padx=(0, 12))
 
-    ctk.CTkLabel(stats_row, image=status_icons["unknown"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["unknown"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts.get("unknown", 0)), font=FONTS["body"], text_color=THEME["muted"]).pack(side="left")
 
     pb = ctk.CTkProgressBar(header_card, height=10, fg_color=THEME["card"], progress_color=THEME["gold"])
@@ -1171,19 +2408,7 @@ def build_add_vocab():
 
         # 필수값 체크
         if not w or not m:
-            def build_warn(parent, overlay):
-                ctk.CTkLabel(
-                    parent,
-                    text="⚠️ Please enter both word and meaning.",
-                    font=FONTS["body"],
-                    text_color=THEME["muted"],
-                    justify="center",
-                    wraplength=360
-                ).pack(pady=SPACING["md"])
-                ctk.CTkButton(parent, text="OK", command=overlay.destroy, **BTN_SOLID) \
-                    .pack(pady=SPACING["sm"])
-
-            show_modal("Warning", build_warn, show_close=False)
+            modal_warn("⚠️ Please enter both word and meaning.")
             return
 
         # 수정 모드에서 단어명이 변경된 경우 기존 키 삭제
@@ -1192,27 +2417,18 @@ def build_add_vocab():
 
         # 단어 수 제한 체크
         if not editing_word and len(decks[cd2]) >= 100:
-            def build_full(parent, overlay):
-                ctk.CTkLabel(
-                    parent,
-                    text="⚠️ This deck already has 100 words.",
-                    font=FONTS["body"],
-                    text_color=THEME["muted"],
-                    justify="center"
-                ).pack(pady=SPACING["md"])
-                ctk.CTkButton(parent, text="OK", command=overlay.destroy, **BTN_SOLID) \
-                    .pack(pady=SPACING["sm"])
-
-            show_modal("Warning", build_full, show_close=False)
+            modal_warn("⚠️ This deck already has 100 words.")
             return
 
-        # 단어 저장 (status는 기본 unknown)
+        # 단어 저장 (status는 기본 unknown, 복습 스케줄 등 나머지 필드는 유지)
         decks[cd2][w] = {
+            **decks[cd2].get(w, {}),
             "part_of_speech": pos_entry.get().strip(),
             "meaning": m,
             "example": example_entry.get().strip(),
             "status": decks[cd2].get(w, {}).get("status", "unknown")
         }
+        srs_touch(cd2, w)
         save_decks()
         editing_word = None
 
@@ -1225,19 +2441,8 @@ def build_add_vocab():
         # ✅ 화면 전체 리빌드 → 헤더 통계/진행바 즉시 반영
         build_add_vocab()
 
-        # 저장 완료 모달
-        def build_saved(parent, overlay):
-            ctk.CTkLabel(
-                parent,
-                text=f"✅ '{w}' has been saved.",
-                font=FONTS["body"],
-                text_color=THEME["muted"],
-                justify="center"
-            ).pack(pady=SPACING["md"])
-            ctk.CTkButton(parent, text="OK", command=overlay.destroy, **BTN_SOLID) \
-                .pack(pady=SPACING["sm"])
-
-        show_modal("Saved", build_saved, show_close=False)
+        # 저장 완료 모달 (미리 만든 message 카드 재사용)
+        modal_info(f"✅ '{w}' has been saved.", title="Saved")
 
     ctk.CTkButton(
         row,
@@ -1247,6 +2452,15 @@ def build_add_vocab():
         **BTN_SOLID
     ).pack(pady=(0, SPACING["sm"]))  # 위쪽 → 아래쪽 간격
 
+    # 여러 줄 붙여넣기 (CSV / TSV 한 번에 추가)
+    ctk.CTkButton(
+        row,
+        text="📋  Paste Many",
+        command=open_paste_words_modal,
+        width=240,
+        **BTN_GHOST
+    ).pack(pady=(0, SPACING["sm"]))
+
     # Menu 버튼
     ctk.CTkButton(
         row,
@@ -1256,10 +2470,1054 @@ def build_add_vocab():
         **BTN_GHOST
     ).pack()
 
+def open_paste_words_modal():
+    """여러 줄 붙여넣기 → 한 번의 덱 반영 + 한 번의 저장 (엑셀에서 복사한 표는 탭 구분으로 들어옴)"""
+    cd = current_deck if current_deck in decks else (list(decks.keys())[0] if decks else None)
+    if not cd:
+        modal_warn("⚠️ No deck available.")
+        return
+
+    def build(parent, overlay):
+        ctk.CTkLabel(parent, text="Paste Many Lines", font=FONTS["h1"], text_color=THEME["gold"]).pack(pady=SPACING["sm"])
+        ctk.CTkLabel(parent, text="word, part of speech, meaning, example  (comma or tab separated)",
+                     text_color=THEME["muted"]).pack(pady=(0, SPACING["xs"]))
+        box = ctk.CTkTextbox(parent, width=480, height=220, fg_color=THEME["card"])
+        box.pack()
+        box.focus_set()
+        msg = ctk.CTkLabel(parent, text="", font=FONTS["body"], text_color=THEME["danger"])
+        msg.pack()
+
+        def add_lines():
+            text = box.get("1.0", "end").strip()
+            # 탭이 있으면 엑셀에서 복사한 표 → 탭으로만 나눔 (뜻 / 예문 안의 쉼표는 그대로)
+            delimiter = "\t" if "\t" in text else None
+            new_words = rows_to_deck(iter_delimited_rows(io.StringIO(text), delimiter=delimiter)) if text else {}
+            if not new_words:
+                msg.configure(text="⚠️ No words found in the pasted text.")
+                return
+            added, updated = merge_words_into_deck(cd, new_words)
+            save_decks()
+            overlay.destroy()
+            build_add_vocab()
+            modal_info(f"✅ {added} added, {updated} updated.", title="Saved")
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["sm"])
+        ctk.CTkButton(row, text="Add", command=add_lines, **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
+        ctk.CTkButton(row, text="Cancel", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+
+    show_modal(f"📋 Paste • {cd}", build, show_close=False)
+
+# ==============================
+# Spaced Repetition (SM-2 + per-deck min-heap)
+# ==============================
+
+# 퀴즈 버튼 → SM-2 품질 점수 (unknown=실패, partial=어렵게 맞춤, known=맞춤)
+SRS_GRADES = {"unknown": 1, "partial": 3, "known": 5}
+SRS_DEFAULT_EASE = 2.5
+SRS_MIN_EASE = 1.3
+SRS_RELEARN_DAYS = 10 / 1440    # 틀리면 10분 뒤 다시
+
+_srs_heaps = {}     # deck -> [(due, word)] (lazy deletion: word의 현재 due와 다르면 무효)
+_srs_parked = {}    # deck -> 이번 due 세션에서 이미 낸 항목 (힙에서 빼 둠, 다음 세션 시작 때 되돌림)
+SRS_COUNT_LIMIT = 1000      # due 개수는 이 수까지만 셈 (새 단어는 due=0이라 큰 덱에서 전부 걸림)
+
+def _srs_heap(deck_name):
+    """덱의 due 힙 (처음 쓸 때 O(n) heapify, 이후 push/pop은 O(log n))"""
+    heap = _srs_heaps.get(deck_name)
+    if heap is None:
+        heap = [(info.get("due", 0), w) for w, info in decks.get(deck_name, {}).items()]
+        heapq.heapify(heap)
+        _srs_heaps[deck_name] = heap
+    return heap
+
+def _srs_valid(deck_name, entry):
+    info = decks.get(deck_name, {}).get(entry[1])
+    return info is not None and info.get("due", 0) == entry[0]
+
+def srs_touch(deck_name, word):
+    """단어 추가/이름 변경 후 힙에 현재 due 등록 (힙이 아직 없으면 나중에 통째로 생성)"""
+    heap = _srs_heaps.get(deck_name)
+    info = decks.get(deck_name, {}).get(word)
+    if heap is None or info is None:
+        return
+    heapq.heappush(heap, (info.get("due", 0), word))
+    if len(heap) > 2 * len(decks[deck_name]) + 64:
+        _srs_heaps.pop(deck_name, None)  # 무효 항목이 너무 많으면 다음에 다시 생성
+
+def srs_forget(deck_name=None):
+    """덱 이름 변경/삭제/초기화 시 힙 버리기 (None이면 전체)"""
+    if deck_name is None:
+        _srs_heaps.clear()
+        _srs_parked.clear()
+    else:
+        _srs_heaps.pop(deck_name, None)
+        _srs_parked.pop(deck_name, None)
+
+def srs_release(deck_name):
+    """빼 두었던 항목 중 아직 유효한 것(채점 안 된 단어)만 힙에 되돌림 (due 세션 시작 시)"""
+    heap = _srs_heaps.get(deck_name)
+    for entry in _srs_parked.pop(deck_name, ()):
+        if heap is not None and _srs_valid(deck_name, entry):
+            heapq.heappush(heap, entry)
+
+def srs_grade(deck_name, word, status, now=None):
+    """SM-2로 interval / ease / due 갱신 후 힙에 다시 넣기"""
+    if word not in decks.get(deck_name, {}):
+        return
+    info = mutable_word(deck_name, word)
+    now = time.time() if now is None else now
+    q = SRS_GRADES.get(status, 1)
+    ease = info.get("ease", SRS_DEFAULT_EASE)
+    reps = info.get("reps", 0)
+    interval = info.get("interval", 0)
+
+    if q < 3:
+        reps = 0
+        interval = SRS_RELEARN_DAYS
+        info["lapses"] = info.get("lapses", 0) + 1
+    else:
+        reps += 1
+        if reps == 1:
+            interval = 1
+        elif reps == 2:
+            interval = 6 if q == 5 else 3
+        else:
+            interval = interval * ease
+        ease = max(SRS_MIN_EASE, ease + 0.1 - (5 - q) * (0.08 + (5 - q) * 0.02))
+
+    info.update(ease=round(ease, 3), reps=reps, interval=round(interval, 4),
+                due=int(now + interval * 86400))
+    if deck_name in _srs_heaps:
+        heapq.heappush(_srs_heaps[deck_name], (info["due"], word))
+
+def srs_next_due(deck_name, exclude=(), now=None):
+    """due가 지난 단어 중 가장 급한 것 (exclude 제외).
+    꺼낸 유효 항목은 힙에 다시 넣지 않고 _srs_parked에 빼 둠 → 세션 내내 호출당 O(log n)"""
+    now = time.time() if now is None else now
+    heap = _srs_heap(deck_name)
+    parked = _srs_parked.setdefault(deck_name, [])
+    while heap and heap[0][0] <= now:
+        entry = heapq.heappop(heap)
+        if not _srs_valid(deck_name, entry):
+            continue  # 이미 다시 채점된 예전 항목
+        parked.append(entry)
+        if entry[1] not in exclude:
+            return entry[1]
+    return None
+
+def srs_due_count(deck_name, cutoff=None, limit=SRS_COUNT_LIMIT):
+    """cutoff(기본: 오늘 자정)까지 due인 단어 수. 힙에서 cutoff 이하 부분만 탐색 → O(min(due 수, limit))
+    limit에 도달하는 즉시 멈춤 (표시용 / 진행 분모용, None이면 전부)"""
+    if cutoff is None:
+        t = time.localtime()
+        cutoff = time.mktime((t.tm_year, t.tm_mon, t.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    heap = _srs_heap(deck_name)
+    seen = {e[1] for e in _srs_parked.get(deck_name, ()) if e[0] <= cutoff and _srs_valid(deck_name, e)}
+    stack = [0]
+    while stack and (limit is None or len(seen) < limit):
+        i = stack.pop()
+        if i >= len(heap) or heap[i][0] > cutoff:
+            continue  # 힙 성질: 자식들은 더 늦음
+        if _srs_valid(deck_name, heap[i]):
+            seen.add(heap[i][1])
+        stack.extend((2*i + 1, 2*i + 2))
+    return len(seen) if limit is None else min(len(seen), limit)
+
+# ==============================
+# Weighted Mix Sampling (alias method)
+# ==============================
+
+MIX_STATUS_WEIGHTS = {"unknown": 5.0, "partial": 3.0, "known": 1.0}
+MIX_ERROR_WEIGHT = 0.5      # 오답(lapses) 1회당 가중치 +50% (0이면 오답 수 무시)
+MIX_ERROR_CAP = 4           # 오답 가중치 상한 → 버킷 수가 작게 유지됨
+
+def _alias_table(weights):
+    """Vose alias method: O(k) 생성, O(1) 추출용 (prob, alias) 테이블"""
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob, alias = [1.0] * n, list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s_i, l_i = small.pop(), large.pop()
+        prob[s_i], alias[s_i] = scaled[s_i], l_i
+        scaled[l_i] += scaled[s_i] - 1.0
+        (small if scaled[l_i] < 1.0 else large).append(l_i)
+    return prob, alias
+
+class WeightedWordSampler:
+    """상태 × 오답 횟수 가중치로 단어를 O(1) 추출.
+    가중치가 같은 단어끼리 버킷에 모으고 alias 테이블은 버킷 단위로만 만든다.
+    가중치 변경 = O(1) 버킷 이동 + 버킷 수(최대 3 × 5)만큼 테이블 재생성."""
+
+    def __init__(self, deck):
+        self.buckets = {}   # weight key -> [word]
+        self.where = {}     # word -> (key, bucket 내 index)
+        for w, info in deck.items():
+            self._add(w, self._key(info))
+        self._rebuild()
+
+    @staticmethod
+    def _key(info):
+        errors = min(info.get("lapses", 0), MIX_ERROR_CAP) if MIX_ERROR_WEIGHT else 0
+        return (info.get("status", "unknown"), errors)
+
+    @staticmethod
+    def _weight(key):
+        status, errors = key
+        return MIX_STATUS_WEIGHTS.get(status, 1.0) * (1 + MIX_ERROR_WEIGHT * errors)
+
+    def _add(self, w, key):
+        bucket = self.buckets.setdefault(key, [])
+        self.where[w] = (key, len(bucket))
+        bucket.append(w)
+
+    def _remove(self, w):
+        key, i = self.where.pop(w)
+        bucket = self.buckets[key]
+        last = bucket.pop()
+        if i < len(bucket):
+            bucket[i] = last
+            self.where[last] = (key, i)
+        if not bucket:
+            del self.buckets[key]
+
+    def _rebuild(self):
+        self.keys = list(self.buckets)
+        weights = [self._weight(k) * len(self.buckets[k]) for k in self.keys]
+        self.prob, self.alias = _alias_table(weights) if weights else ([], [])
+
+    def update(self, w, info):
+        """update_status 후 호출: 가중치가 바뀐 단어만 버킷 이동 (info=None이면 제거)"""
+        key = self._key(info) if info is not None else None
+        old = self.where.get(w)
+        if old is not None and old[0] == key:
+            return
+        if old is not None:
+            self._remove(w)
+        if key is not None:
+            self._add(w, key)
+        self._rebuild()
+
+    def sample(self, avoid=None, rng=random):
+        """가중치 비례 추출 (avoid와 같은 단어는 몇 번 다시 뽑기)"""
+        if not self.keys:
+            return None
+        for _ in range(3):
+            i = rng.randrange(len(self.keys))
+            key = self.keys[i] if rng.random() < self.prob[i] else self.keys[self.alias[i]]
+            bucket = self.buckets[key]
+            w = bucket[rng.randrange(len(bucket))]
+            if w != avoid or len(self.where) == 1:
+                break
+        return w
+
+# ==============================
+# Multiple Choice (distractor index)
+# ==============================
+
+MC_DISTRACTORS = 3          # 오답 보기 수 (정답 포함 4지선다)
+MC_LENGTH_WINDOW = 12       # 뜻 길이가 비슷한 후보를 찾을 범위 (정렬 위치 기준 ±)
+
+def _pos_key(info):
+    pos = info.get("part_of_speech", "").strip().lower()
+    return "" if pos == "null" else pos
+
+class DistractorIndex:
+    """품사별 (뜻 길이, 뜻) 정렬 리스트. 퀴즈 세션마다 한 번 만들고 카드마다 bisect로 조회.
+    덱이 너무 작으면 다른 덱까지 포함한 인덱스를 (필요할 때 한 번) 만들어 보충."""
+
+    def __init__(self, deck_names, fallback=True):
+        self.by_pos = {}
+        meanings = set()
+        for dn in deck_names:
+            for info in decks.get(dn, {}).values():
+                m = info.get("meaning", "").strip()
+                if m:
+                    self.by_pos.setdefault(_pos_key(info), set()).add((len(m), m))
+                    meanings.add((len(m), m))
+        self.by_pos = {pos: sorted(items) for pos, items in self.by_pos.items()}
+        self.all = sorted(meanings)
+        self.deck_names = set(deck_names)
+        self.use_fallback = fallback
+        self._fallback = None
+
+    def _near(self, items, meaning, k, exclude, rng):
+        """items(정렬됨)에서 뜻 길이가 가까운 후보 k개 (무작위)"""
+        i = bisect.bisect_left(items, (len(meaning), meaning))
+        lo, hi = max(0, i - MC_LENGTH_WINDOW), min(len(items), i + MC_LENGTH_WINDOW + 1)
+        pool = [m for _, m in items[lo:hi] if m not in exclude]
+        return rng.sample(pool, min(k, len(pool)))
+
+    def pick(self, info, k=MC_DISTRACTORS, rng=random):
+        """같은 품사 + 비슷한 길이 → 같은 덱 전체 → 다른 덱 순으로 오답 보기 k개"""
+        meaning = info.get("meaning", "").strip()
+        exclude = {meaning}
+        picked = []
+        for items in (self.by_pos.get(_pos_key(info), []), self.all):
+            picked += self._near(items, meaning, k - len(picked), exclude, rng)
+            exclude.update(picked)
+            if len(picked) >= k:
+                return picked
+        if self.use_fallback:
+            if self._fallback is None:
+                others = [d for d in decks if d not in self.deck_names]
+                self._fallback = DistractorIndex(others, fallback=False)
+            picked += self._fallback.pick(info, k - len(picked), rng) if self._fallback.all else []
+        return [m for m in picked if m != meaning][:k]
+
+# ==============================
+# Typed Answer Grading (Myers bit-parallel edit distance)
+# ==============================
+
+TYPED_KNOWN_RATIO = 0.15     # 정규화 편집거리 ≤ 15% → known (사소한 오타 허용)
+TYPED_PARTIAL_RATIO = 0.35   # ≤ 35% → partial, 그 이상 → unknown
+
+# 정규화 테이블: 라틴 악센트 제거 + 구두점 → 공백 (처음 쓸 때 한 번만 생성)
+_NORM_RANGES = ((0x00C0, 0x0250), (0x1E00, 0x1F00))
+_PUNCT_RANGES = ((0x2000, 0x2070), (0x3000, 0x3040), (0xFF01, 0xFF66))
+_norm_table = None
+
+def _get_norm_table():
+    global _norm_table
+    if _norm_table is None:
+        table = {ord(c): " " for c in string.punctuation}
+        for lo, hi in _NORM_RANGES:
+            for cp in range(lo, hi):
+                base = "".join(ch for ch in unicodedata.normalize("NFKD", chr(cp))
+                               if not unicodedata.combining(ch))
+                if base and base != chr(cp):
+                    table[cp] = base.casefold()
+        for lo, hi in _PUNCT_RANGES:
+            for cp in range(lo, hi):
+                if unicodedata.category(chr(cp)).startswith(("P", "Z")):
+                    table[cp] = " "
+        _norm_table = table
+    return _norm_table
+
+def normalize_answer(text):
+    """대소문자 / 악센트 / 구두점 / 공백 차이 무시"""
+    return " ".join(text.casefold().translate(_get_norm_table()).split())
+
+def edit_distance(a, b):
+    """Levenshtein 거리 (Myers/Hyyrö bit-vector). O(len(a)·len(b)/워드 크기)"""
+    if len(a) > len(b):
+        a, b = b, a  # 짧은 쪽을 패턴(비트 벡터)으로
+    m = len(a)
+    if m == 0:
+        return len(b)
+    peq = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for c in b:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+    return score
+
+def grade_typed_answer(typed, expected):
+    """(status, 거리) — status는 update_status에 그대로 넘길 값"""
+    a, b = normalize_answer(typed), normalize_answer(expected)
+    if not a:
+        return "unknown", len(b)
+    dist = edit_distance(a, b)
+    ratio = dist / max(len(a), len(b))
+    if ratio <= TYPED_KNOWN_RATIO:
+        return "known", dist
+    if ratio <= TYPED_PARTIAL_RATIO:
+        return "partial", dist
+    return "unknown", dist
+
+# ==============================
+# Multi-deck Quiz (lazy merged stream)
+# ==============================
+QUIZ_INTERLEAVE = {
+    "weighted":    "⚖ By Size",       # 남은 카드 수에 비례해서 덱 선택
+    "round_robin": "🔄 Round-robin",  # 덱을 돌아가며 한 장씩
+}
+
+class LazyDeckStream:
+    """덱 하나를 lazy Fisher–Yates로 섞으면서 한 장씩 꺼냄.
+    단어 목록은 처음 꺼낼 때 만들고(keys), 꺼낸 만큼만 섞음. skip = 이미 낸 위치 (세션 재개용)."""
+
+    def __init__(self, deck_name, scope="all", keys=None, skip=()):
+        self.deck_name = deck_name
+        self.scope = scope
+        self._keys_fn = keys or (lambda: list(decks.get(deck_name, {})))
+        self.keys = None
+        self.order = None
+        self.skip = set(skip)
+        self.remaining = max(0, len(decks.get(deck_name, {})) - len(self.skip))  # 범위 필터 전
+
+    def next(self, rng=random):
+        """범위(scope)에 맞는 다음 단어의 위치 (keys 인덱스), 다 뽑았으면 None"""
+        deck = decks.get(self.deck_name, {})
+        if self.keys is None:
+            self.keys = self._keys_fn()
+            self.order = [i for i in range(len(self.keys)) if i not in self.skip] if self.skip else list(range(len(self.keys)))
+            self.remaining = len(self.order)
+        order = self.order
+        while self.remaining:
+            j = rng.randrange(self.remaining)
+            self.remaining -= 1
+            n = self.remaining
+            order[j], order[n] = order[n], order[j]
+            info = deck.get(self.keys[order[n]])  # 세션 중 삭제된 단어는 건너뜀
+            if info is not None and (self.scope == "all" or info.get("status") == self.scope):
+                return order[n]
+        return None
+
+def merged_quiz_source(streams, interleave="weighted", rng=random):
+    """여러 덱 스트림을 하나로 섞는 카드 공급 함수. 호출마다 (스트림 번호, 단어 위치) 또는 None.
+    시작 비용은 덱 수에 비례 (단어 목록은 덱별로 처음 뽑을 때 만듦)."""
+    live = [(no, st) for no, st in enumerate(streams) if st.remaining]
+    turn = 0
+
+    def next_card():
+        nonlocal turn
+        while live:
+            if interleave == "round_robin":
+                i = turn % len(live)
+            else:
+                r = rng.randrange(sum(st.remaining for _, st in live))
+                for i, (_, st) in enumerate(live):
+                    r -= st.remaining
+                    if r < 0:
+                        break
+            no, stream = live[i]
+            idx = stream.next(rng)
+            if stream.remaining == 0:
+                live.pop(i)
+            else:
+                turn = i + 1
+            if idx is not None:
+                return no, idx
+        return None
+
+    return next_card
+
+# ==============================
+# Quiz Session (checkpoint / resume)
+# ==============================
+QUIZ_SESSION_FILE = "quiz_session.bin"
+QUIZ_RESULT_CODES = {"unknown": 0, "partial": 1, "known": 2}  # results 배열 값, -1 = 아직 채점 안 함
+
+def _keys_fingerprint(keys):
+    """덱 단어 순서 지문 [개수, crc32]. 저장된 인덱스가 지금도 같은 단어를 가리키는지 확인용"""
+    return [len(keys), zlib.crc32("\x00".join(keys).encode("utf-8"))]
+
+class QuizSession:
+    """퀴즈 한 판. 카드 순서는 (덱 번호, 덱 안 단어 위치) 인덱스 배열 + 카드별 채점 결과.
+    위치는 세션이 처음 본 덱 단어 순서(list(deck)) 기준이라 체크포인트를 그대로 읽어서 재개
+    (다시 필터링/셔플하지 않음). kind: list(미리 섞은 목록) / due / mixed / merged(여러 덱)."""
+
+    def __init__(self, deck_names, kind="list", scope="all", interleave="weighted"):
+        self.deck_names = list(deck_names)
+        self.kind = kind
+        self.scope = scope
+        self.interleave = interleave
+        self.answer_mode = quiz_answer_mode
+        self.card_decks = array.array("H")
+        self.card_words = array.array("I")
+        self.results = array.array("b")
+        self.index = 0
+        self.total_hint = 0
+        self.sampler = None     # Weighted Mix의 WeightedWordSampler
+        self._keys = {}         # 덱 번호 -> 단어 목록 (처음 필요할 때)
+        self._fp = {}           # 덱 번호 -> 지문
+        self._pos = {}          # 덱 번호 -> {단어: 위치} (단어로 카드를 받는 due / mixed용)
+        self._source = None     # 지연 세션의 다음 카드 추가 함수
+
+    @classmethod
+    def create(cls, deck_names, kind="list", scope="all", interleave="weighted"):
+        s = cls(deck_names, kind, scope, interleave)
+        if kind == "list":
+            deck = decks[s.deck_names[0]]
+            order = [i for i, w in enumerate(s.keys(0)) if scope == "all" or deck[w].get("status") == scope]
+            random.shuffle(order)
+            s.card_decks = array.array("H", [0]) * len(order)
+            s.card_words = array.array("I", order)
+            s.results = array.array("b", [-1]) * len(order)
+            s.total_hint = len(order)
+        else:
+            if kind == "due":
+                s.total_hint = srs_due_count(s.deck_names[0], cutoff=time.time())
+            else:
+                s.total_hint = sum(len(decks[d]) for d in s.deck_names)  # 범위 필터 전 상한
+            s.start_source()
+            s.fill_ahead()
+        return s
+
+    def __len__(self):
+        return len(self.card_words)
+
+    def keys(self, dn):
+        if dn not in self._keys:
+            keys = list(decks.get(self.deck_names[dn], {}))
+            self._keys[dn] = keys
+            self._fp[dn] = _keys_fingerprint(keys)
+        return self._keys[dn]
+
+    def card(self, i):
+        """i번째 카드의 (덱, 단어)"""
+        dn = self.card_decks[i]
+        return self.deck_names[dn], self.keys(dn)[self.card_words[i]]
+
+    @property
+    def current(self):
+        return self.card(self.index)
+
+    def add_index(self, dn, pos):
+        self.card_decks.append(dn)
+        self.card_words.append(pos)
+        self.results.append(-1)
+
+    def add_word(self, dn, word):
+        pos = self._pos.get(dn)
+        if pos is None:
+            pos = self._pos[dn] = {w: i for i, w in enumerate(self.keys(dn))}
+        self.add_index(dn, pos[word])
+
+    def start_source(self):
+        """지연 세션의 카드 공급 함수 생성 (새 세션 / 재개 공통, 이미 낸 카드는 다시 안 냄)"""
+        if self.kind == "due":
+            deck_name = self.deck_names[0]
+            srs_release(deck_name)  # 이전 세션에서 빼 둔 항목 되돌림
+            seen = {self.card(i)[1] for i in range(len(self))}
+            def next_due():
+                w = srs_next_due(deck_name, exclude=seen)
+                if w is not None:
+                    seen.add(w)
+                    self.add_word(0, w)
+            self._source = next_due
+        elif self.kind == "mixed":
+            # 상태별 가중치로 무한 추출 (모르는 단어가 더 자주)
+            self.sampler = WeightedWordSampler(decks[self.deck_names[0]])
+            def next_mixed():
+                w = self.sampler.sample(avoid=self.card(len(self) - 1)[1] if len(self) else None)
+                if w is not None:
+                    self.add_word(0, w)
+            self._source = next_mixed
+        elif self.kind == "merged":
+            drawn = {}
+            for dn, pos in zip(self.card_decks, self.card_words):
+                drawn.setdefault(dn, set()).add(pos)
+            streams = [LazyDeckStream(name, self.scope, keys=lambda dn=dn: self.keys(dn), skip=drawn.get(dn, ()))
+                       for dn, name in enumerate(self.deck_names)]
+            pull = merged_quiz_source(streams, self.interleave)
+            def next_merged():
+                card = pull()
+                if card is not None:
+                    self.add_index(*card)
+            self._source = next_merged
+
+    def fill_ahead(self, depth=None):
+        """지연 세션: 현재 카드 뒤로 depth장(기본 QUIZ_PREFETCH_DEPTH)까지 미리 가져옴 → 발음 prefetch가 볼 수 있게.
+        공급이 끝났으면(더 안 늘어나면) 중단"""
+        depth = QUIZ_PREFETCH_DEPTH if depth is None else depth
+        while self._source is not None and len(self) - 1 - self.index < depth:
+            n = len(self)
+            self._source()
+            if len(self) == n:
+                break
+
+    def forward(self):
+        """다음 카드로 (지연 세션이면 앞쪽 버퍼를 다시 채움). 이동했으면 True"""
+        self.fill_ahead(max(1, QUIZ_PREFETCH_DEPTH))
+        if self.index < len(self) - 1:
+            self.index += 1
+            self.fill_ahead()
+            return True
+        return False
+
+    def back(self):
+        if self.index > 0:
+            self.index -= 1
+            return True
+        return False
+
+    def grade(self, status):
+        self.results[self.index] = QUIZ_RESULT_CODES.get(status, -1)
+
+    def graded_count(self):
+        return len(self.results) - self.results.count(-1)
+
+    def is_valid(self):
+        """세션이 본 덱들의 단어 순서가 그대로인지 (덱 편집/삭제 후 재개 방지)"""
+        return all(self.deck_names[dn] in decks and _keys_fingerprint(list(decks[self.deck_names[dn]])) == fp
+                   for dn, fp in self._fp.items())
+
+    def snapshot(self):
+        """체크포인트 바이트: JSON 한 줄(메타) + 카드 덱/위치/결과 배열 (UI 스레드에서 복사만)"""
+        meta = {
+            "v": 1, "decks": self.deck_names, "kind": self.kind, "scope": self.scope,
+            "interleave": self.interleave, "answer_mode": self.answer_mode,
+            "index": self.index, "total_hint": self.total_hint, "n": len(self),
+            "fp": {str(dn): fp for dn, fp in self._fp.items()}, "byteorder": sys.byteorder,
+        }
+        head = json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n"
+        return head + self.card_decks.tobytes() + self.card_words.tobytes() + self.results.tobytes()
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """snapshot() 복원. 덱 단어 순서가 바뀌었으면 ValueError"""
+        head, _, body = data.partition(b"\n")
+        meta = json.loads(head.decode("utf-8"))
+        s = cls(meta["decks"], meta["kind"], meta["scope"], meta["interleave"])
+        s.answer_mode = meta.get("answer_mode", "reveal")
+        n, body = meta["n"], memoryview(body)
+        for arr in (s.card_decks, s.card_words, s.results):
+            arr.frombytes(body[:n * arr.itemsize])
+            body = body[n * arr.itemsize:]
+        if len(s.results) != n:
+            raise ValueError("truncated quiz checkpoint")
+        if meta.get("byteorder", sys.byteorder) != sys.byteorder:
+            s.card_decks.byteswap()
+            s.card_words.byteswap()
+        for dn, fp in meta["fp"].items():
+            dn = int(dn)
+            if s.deck_names[dn] not in decks:
+                raise ValueError("deck removed since the quiz was saved")
+            s.keys(dn)
+            if s._fp[dn] != fp:
+                raise ValueError("deck changed since the quiz was saved")
+        s.index = min(meta["index"], n - 1)
+        s.total_hint = meta["total_hint"]
+        s.start_source()
+        s.fill_ahead()
+        return s
+
+# ----- 체크포인트 writer (파일 쓰기는 백그라운드, 밀린 체크포인트는 최신 것만) -----
+_session_write_queue = queue.Queue()
+_session_writer = None
+
+def _start_session_writer():
+    def worker():
+        while True:
+            jobs = [_session_write_queue.get()]
+            while True:
+                try:
+                    jobs.append(_session_write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            last = next((j for j in reversed(jobs) if j[0] != "flush"), None)
+            try:
+                if last and last[0] == "write":
+                    tmp = QUIZ_SESSION_FILE + ".tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(last[1])
+                    os.replace(tmp, QUIZ_SESSION_FILE)
+                elif last and os.path.exists(QUIZ_SESSION_FILE):
+                    os.remove(QUIZ_SESSION_FILE)
+            except OSError:
+                pass  # 체크포인트 실패는 퀴즈 진행에 영향 없음
+            for j in jobs:
+                if j[0] == "flush":
+                    j[1].set()
+
+    global _session_writer
+    if _session_writer is None or not _session_writer.is_alive():
+        _session_writer = threading.Thread(target=worker, daemon=True)
+        _session_writer.start()
+
+def quiz_checkpoint():
+    """현재 세션을 체크포인트 (카드 이동 / 채점마다 호출)"""
+    if quiz_session is not None:
+        _start_session_writer()
+        _session_write_queue.put(("write", quiz_session.snapshot()))
+
+def quiz_session_discard():
+    global quiz_session
+    quiz_session = None
+    _start_session_writer()
+    _session_write_queue.put(("clear",))
+
+def quiz_session_flush(timeout=2.0):
+    """종료 전 대기 중인 체크포인트를 디스크에 기록"""
+    if _session_writer is None:
+        return
+    done = threading.Event()
+    _session_write_queue.put(("flush", done))
+    done.wait(timeout)
+
+def load_quiz_session():
+    """메모리에 세션이 없으면 체크포인트 파일에서 복원. 복원할 수 없으면 None"""
+    global quiz_session
+    if quiz_session is None and os.path.exists(QUIZ_SESSION_FILE):
+        try:
+            with open(QUIZ_SESSION_FILE, "rb") as f:
+                quiz_session = QuizSession.from_snapshot(f.read())
+        except (OSError, ValueError, KeyError, IndexError):
+            quiz_session_discard()
+    return quiz_session
+
+# ==============================
+# Review History (binary log + vectorized stats)
+# ==============================
+HISTORY_DIR = "history"
+HISTORY_IDS_FILE = os.path.join(HISTORY_DIR, "ids.jsonl")  # 한 줄 = ["w"|"d", 이름], 줄 순서가 id (append-only)
+                                                            # ["d=", 옛 이름, 새 이름] = 덱 이름 변경 (id 유지)
+HISTORY_SEGMENT_MAX = 1 << 16   # 세그먼트 파일 하나당 기록 수 (넘으면 다음 파일로)
+# 기록 하나 = 18바이트: 단어 id, 덱 id, 시각(초), 이전 상태, 새 상태, 응답 시간(ms)
+HISTORY_RECORD = struct.Struct("<IIIbbI")
+HISTORY_DTYPE = [("word", "<u4"), ("deck", "<u4"), ("ts", "<u4"), ("old", "i1"), ("new", "i1"), ("ms", "<u4")]
+
+_history = {"loaded": False, "ids": {"w": {}, "d": {}}, "names": {"w": [], "d": []},
+            "seg": 0, "count": 0, "file": None}
+
+def _history_segment_path(no):
+    return os.path.join(HISTORY_DIR, f"seg_{no:06d}.bin")
+
+def _history_segments():
+    if not os.path.isdir(HISTORY_DIR):
+        return []
+    return sorted(os.path.join(HISTORY_DIR, n) for n in os.listdir(HISTORY_DIR)
+                  if n.startswith("seg_") and n.endswith(".bin"))
+
+def _history_load():
+    """id 테이블과 마지막 세그먼트 위치를 한 번만 읽음"""
+    if _history["loaded"]:
+        return
+    _history["loaded"] = True
+    if os.path.exists(HISTORY_IDS_FILE):
+        with open(HISTORY_IDS_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 쓰다 끊긴 마지막 줄
+                if entry[0] == "d=":
+                    _history_apply_rename(*entry[1:])
+                    continue
+                kind, name = entry
+                _history["ids"][kind][name] = len(_history["names"][kind])
+                _history["names"][kind].append(name)
+    segs = _history_segments()
+    if segs:
+        _history["seg"] = int(os.path.basename(segs[-1])[4:-4])
+        _history["count"] = os.path.getsize(segs[-1]) // HISTORY_RECORD.size
+
+def _history_id(kind, name):
+    """단어("w") / 덱("d") 이름 → 정수 id (처음 보면 ids.jsonl에 추가)"""
+    ids = _history["ids"][kind]
+    if name not in ids:
+        with open(HISTORY_IDS_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps([kind, name], ensure_ascii=False) + "\n")
+        ids[name] = len(_history["names"][kind])
+        _history["names"][kind].append(name)
+    return ids[name]
+
+def _history_apply_rename(old, new):
+    did = _history["ids"]["d"].pop(old, None)
+    if did is not None:
+        _history["ids"]["d"][new] = did
+        _history["names"]["d"][did] = new
+
+def history_rename_deck(old, new):
+    """덱 이름 변경: 기존 기록의 덱 id가 새 이름을 가리키게 (ids.jsonl에 변경 줄 추가)"""
+    _history_load()
+    if old not in _history["ids"]["d"]:
+        return
+    try:
+        with open(HISTORY_IDS_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(["d=", old, new], ensure_ascii=False) + "\n")
+    except OSError:
+        return  # 기록하지 못하면 이번 실행에서도 바꾸지 않음 (다음 실행과 어긋나지 않게)
+    _history_apply_rename(old, new)
+
+def record_review(deck_name, word, old_status, new_status, response_ms=0, now=None):
+    """채점 한 번을 현재 세그먼트 끝에 추가 (가득 차면 다음 세그먼트로)"""
+    try:
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        _history_load()
+        f = _history["file"]
+        if f is not None and _history["count"] >= HISTORY_SEGMENT_MAX:
+            f.close()
+            f = None
+            _history.update(seg=_history["seg"] + 1, count=0)
+        if f is None:
+            path = _history_segment_path(_history["seg"])
+            f = open(path, "ab")
+            f.truncate(_history["count"] * HISTORY_RECORD.size)  # 쓰다 끊긴 기록 조각 제거
+            _history["file"] = f
+        f.write(HISTORY_RECORD.pack(
+            _history_id("w", word), _history_id("d", deck_name), int(now or time.time()),
+            QUIZ_RESULT_CODES.get(old_status, -1), QUIZ_RESULT_CODES.get(new_status, -1),
+            min(max(int(response_ms), 0), 0xFFFFFFFF)))
+        f.flush()
+        _history["count"] += 1
+    except (OSError, struct.error):
+        pass  # 기록 실패는 채점에 영향 없음
+
+def load_history(deck_name=None):
+    """모든 세그먼트를 numpy 구조화 배열 하나로 (deck_name을 주면 그 덱만)"""
+    np = _lazy_import("numpy")
+    _history_load()
+    dtype = np.dtype(HISTORY_DTYPE)
+    parts = [np.fromfile(p, dtype=dtype, count=os.path.getsize(p) // dtype.itemsize) for p in _history_segments()]
+    rec = np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+    if deck_name is not None:
+        did = _history["ids"]["d"].get(deck_name)
+        rec = rec[rec["deck"] == did] if did is not None else rec[:0]
+    return rec
+
+def history_word_stats(deck_name=None):
+    """단어별 복습 수 / 정답률(known 비율) / 현재 연속 정답 / 마스터까지 걸린 시간(초) / 평균 응답 ms.
+    (덱, 단어)·시각으로 정렬한 뒤 reduceat으로 그룹별 집계 → pandas DataFrame"""
+    np = _lazy_import("numpy")
+    pd = _lazy_import("pandas")
+    rec = load_history(deck_name)
+    columns = ["deck", "word", "reviews", "accuracy", "streak", "mastery_sec", "avg_ms", "last_ts"]
+    if not len(rec):
+        return pd.DataFrame(columns=columns)
+
+    key = (rec["deck"].astype(np.uint64) << np.uint64(32)) | rec["word"].astype(np.uint64)
+    order = np.lexsort((rec["ts"], key))
+    rec, key = rec[order], key[order]
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    counts = np.diff(np.r_[starts, len(rec)])
+    ends = starts + counts
+
+    known = rec["new"] == QUIZ_RESULT_CODES["known"]
+    ts = rec["ts"].astype(np.int64)
+    pos = np.arange(len(rec))
+    last_miss = np.maximum.reduceat(np.where(known, -1, pos), starts)
+    never = np.iinfo(np.int64).max
+    first_known = np.minimum.reduceat(np.where(known, ts, never), starts)
+
+    return pd.DataFrame({
+        "deck": np.array(_history["names"]["d"], dtype=object)[rec["deck"][starts]],
+        "word": np.array(_history["names"]["w"], dtype=object)[rec["word"][starts]],
+        "reviews": counts,
+        "accuracy": np.add.reduceat(known.astype(np.int64), starts) / counts,
+        "streak": np.where(last_miss < 0, counts, ends - 1 - last_miss),
+        "mastery_sec": np.where(first_known == never, np.nan, first_known - ts[starts]),
+        "avg_ms": np.add.reduceat(rec["ms"].astype(np.int64), starts) / counts,
+        "last_ts": ts[ends - 1],
+    }, columns=columns)
+
+# ----- 대시보드용 일별 롤업 (채점마다 증분 갱신, 열 때는 그대로 그림) -----
+ROLLUP_FILE = os.path.join(HISTORY_DIR, "rollups.json")
+ROLLUP_SAVE_DELAY_MS = 2000     # 연속 채점은 모아서 한 번에 저장
+
+# days:  덱 -> "YYYY-MM-DD" -> [복습 수, known 응답 수, 그날 마지막 known 단어 수]
+# words: 덱 -> 단어 -> [복습 수, 틀린 수(known 아님)]
+_rollups = None
+_rollup_save_pending = False
+
+def _rollups_data():
+    global _rollups
+    if _rollups is None:
+        _rollups = {"days": {}, "words": {}}
+        if os.path.exists(ROLLUP_FILE):
+            try:
+                with open(ROLLUP_FILE, "r", encoding="utf-8") as f:
+                    _rollups.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+    return _rollups
+
+def rollup_review(deck_name, word, old_status, new_status, now=None):
+    """채점 한 번을 오늘 행 / 단어 행에 반영 (상태는 이미 new_status로 바뀐 뒤 호출)"""
+    r = _rollups_data()
+    day = time.strftime("%Y-%m-%d", time.localtime(now or time.time()))
+    days = r["days"].setdefault(deck_name, {})
+    row = days.get(day)
+    if row is None:
+        # 그날 첫 채점: known 단어 수를 한 번 세어 기준값으로 (이후는 증감만)
+        known = sum(1 for i in decks.get(deck_name, {}).values() if i.get("status") == "known")
+        row = days[day] = [0, 0, known]
+    else:
+        row[2] += (new_status == "known") - (old_status == "known")
+    row[0] += 1
+    row[1] += new_status == "known"
+    w = r["words"].setdefault(deck_name, {}).setdefault(word, [0, 0])
+    w[0] += 1
+    w[1] += new_status != "known"
+    _rollups_schedule_save()
+
+def rollups_sync_known(now=None):
+    """오늘의 known 단어 수를 실제 덱 상태로 맞춤 (대시보드를 그릴 때).
+    퀴즈 채점 말고도 편집 / 일괄 변경 / 가져오기 / 삭제 / undo로 상태가 바뀌므로 증감만으로는 어긋남.
+    마지막 기록값과 다를 때만 오늘 행을 만들거나 고침."""
+    r = _rollups_data()
+    day = time.strftime("%Y-%m-%d", time.localtime(now or time.time()))
+    changed = False
+    for deck_name, deck in decks.items():
+        known = sum(1 for i in deck.values() if i.get("status") == "known")
+        table = r["days"].get(deck_name, {})
+        past = [d for d in table if d <= day]
+        if (table[max(past)][2] if past else 0) != known:
+            r["days"].setdefault(deck_name, {}).setdefault(day, [0, 0, known])[2] = known
+            changed = True
+    if changed:
+        _rollups_schedule_save()
+
+def _rollups_schedule_save():
+    global _rollup_save_pending
+    if not _rollup_save_pending:
+        _rollup_save_pending = True
+        root.after(ROLLUP_SAVE_DELAY_MS, rollups_flush)
+
+def rollups_flush():
+    global _rollup_save_pending
+    _rollup_save_pending = False
+    if _rollups is None:
+        return
+    try:
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        _atomic_write_json(ROLLUP_FILE, _rollups)
+    except OSError:
+        pass
+
+def rollups_rename(old, new):
+    r = _rollups_data()
+    for table in (r["days"], r["words"]):
+        if old in table:
+            table[new] = table.pop(old)
+    _rollups_schedule_save()
+
+def rollups_forget(deck_name=None):
+    """덱 삭제 / 앱 초기화 시 롤업 제거 (None이면 전부).
+    → 지운 항목 {"days": {덱: ...}, "words": {덱: ...}} (undo 때 rollups_restore로 되돌림)"""
+    r = _rollups_data()
+    removed = {}
+    for key in ("days", "words"):
+        table = r[key]
+        if deck_name is None:
+            removed[key] = dict(table)
+            table.clear()
+        else:
+            removed[key] = {deck_name: table.pop(deck_name)} if deck_name in table else {}
+    _rollups_schedule_save()
+    return removed
+
+def rollups_restore(removed):
+    r = _rollups_data()
+    for key, per_deck in removed.items():
+        r[key].update(per_deck)
+    _rollups_schedule_save()
+
+def rollup_series(deck_name=None, days=30, today=None):
+    """최근 days일의 (날짜, 복습 수, known 응답 수, known 단어 수) 목록. deck_name=None이면 전체 덱 합계.
+    known 단어 수는 채점이 없던 날은 직전 값을 이어서 사용."""
+    r = _rollups_data()
+    names = [deck_name] if deck_name is not None else list(r["days"])
+    today = today or time.time()
+    dates = [time.strftime("%Y-%m-%d", time.localtime(today - 86400 * i)) for i in range(days - 1, -1, -1)]
+    reviews, correct, known = [0] * days, [0] * days, [0] * days
+    for name in names:
+        table = r["days"].get(name, {})
+        before = [d for d in table if d < dates[0]]
+        carry = table[max(before)][2] if before else 0
+        for i, d in enumerate(dates):
+            row = table.get(d)
+            if row:
+                reviews[i] += row[0]
+                correct[i] += row[1]
+                carry = row[2]
+            known[i] += carry
+    return list(zip(dates, reviews, correct, known))
+
+def hardest_words(deck_name=None, k=10, min_reviews=3):
+    """틀린 비율이 높은 단어 k개 [(덱, 단어, 틀린 비율, 복습 수)] (복습 min_reviews회 이상만)"""
+    r = _rollups_data()
+    names = [deck_name] if deck_name is not None else list(r["words"])
+    rows = ((name, w, miss / n, n) for name in names
+            for w, (n, miss) in r["words"].get(name, {}).items() if n >= min_reviews)
+    return heapq.nlargest(k, rows, key=lambda t: (t[2], t[3]))
+
 # ==============================
 # Quiz (scope -> quiz)
 # ==============================
 
+def open_multi_deck_quiz():
+    """여러 덱(또는 전체)을 골라 하나의 퀴즈 세션으로"""
+    names = [d for d in decks if decks[d]]
+    if not names:
+        modal_info("No words available.")
+        return
+    deck_vars = {d: tk.BooleanVar(value=(d == current_deck)) for d in names}
+    all_var = tk.BooleanVar(value=False)
+    scope_var = tk.StringVar(value="all")
+    interleave_var = tk.StringVar(value=QUIZ_INTERLEAVE["weighted"])
+
+    def toggle_all():
+        for v in deck_vars.values():
+            v.set(all_var.get())
+
+    def build(parent, overlay):
+        ctk.CTkLabel(parent, text="🗂  Multi-Deck Quiz", font=FONTS["h1"], text_color=THEME["gold"]).pack(pady=SPACING["sm"])
+
+        ctk.CTkCheckBox(parent, text="All decks", variable=all_var, command=toggle_all,
+                        checkbox_width=16, checkbox_height=16, font=FONTS["body_bold"], border_width=2)\
+            .pack(anchor="w", padx=SPACING["xl"])
+        box = ctk.CTkScrollableFrame(parent, fg_color=THEME["card"], width=300, height=160)
+        box.pack(padx=SPACING["xl"], pady=(SPACING["xs"], SPACING["sm"]))
+        for d in names:
+            ctk.CTkCheckBox(box, text=f"{d} ({len(decks[d])})", variable=deck_vars[d],
+                            checkbox_width=16, checkbox_height=16, font=FONTS["body"], border_width=2)\
+                .pack(anchor="w", pady=2)
+
+        ctk.CTkLabel(parent, text="Scope", font=FONTS["body_bold"]).pack(anchor="center")
+        ctk.CTkOptionMenu(
+            parent,
+            variable=scope_var,
+            values=["all", "unknown", "partial", "known"],
+            width=300,
+            fg_color=THEME["panel"],
+            button_color=THEME["gold"],
+            button_hover_color=THEME["gold_dim"],
+            text_color=THEME["text"]
+        ).pack(pady=(0, SPACING["sm"]))
+
+        ctk.CTkSegmentedButton(
+            parent,
+            values=list(QUIZ_INTERLEAVE.values()),
+            variable=interleave_var,
+            width=300,
+            font=FONTS["body_bold"],
+            selected_color=THEME["gold"],
+            selected_hover_color=THEME["gold_dim"],
+            unselected_color=THEME["panel"],
+            unselected_hover_color=THEME["card_hover"],
+            text_color=THEME["text"]
+        ).pack(pady=(0, SPACING["sm"]))
+
+        msg = ctk.CTkLabel(parent, text="", font=FONTS["body"], text_color=THEME["danger"])
+        msg.pack()
+
+        def start():
+            chosen = [d for d in names if deck_vars[d].get()]
+            if not chosen:
+                msg.configure(text="⚠️ Select at least one deck.")
+                return
+            interleave = next(k for k, v in QUIZ_INTERLEAVE.items() if v == interleave_var.get())
+            overlay.destroy()
+            start_quiz_mode(scope_var.get(), deck_names=chosen, interleave=interleave)
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["sm"])
+        ctk.CTkButton(row, text="Start", command=start, **BTN_SOLID).pack(side="left", padx=SPACING["sm"])
+        ctk.CTkButton(row, text="Cancel", command=overlay.destroy, **BTN_GHOST).pack(side="left", padx=SPACING["sm"])
+
+    show_modal("", build, show_close=False)
+
 def build_quiz_filter():
     for w in quiz_filter_frame.winfo_children():
         w.destroy()
@@ -1289,11 +3547,6 @@ def build_quiz_filter():
 
     # 덱 통계
     total, counts, progress, _ = get_deck_stats(decks[cd])
-    status_icons = {
-        "unknown": icon_unknown_img,
-        "partial": icon_partial_img,
-        "known": icon_known_img
-    }
 
     stats_row = ctk.CTkFrame(header, fg_color="transparent")
     stats_row.pack(pady=(0, SPACING["md"]), padx=SPACING["xl"], anchor="w")
@@ -1305,13 +3558,13 @@ def build_quiz_filter():
         text_color=THEME["muted"]
     ).pack(side="left")
 
-    ctk.CTkLabel(stats_row, image=status_icons["known"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["known"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts["known"]), font=FONTS["body"], text_color=THEME["muted"]).pack(side="left", padx=(0, 12))
 
-    ctk.CTkLabel(stats_row, image=status_icons["partial"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["partial"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts["partial"]), font=FONTS["body"], text_color=THEME["muted"]).pack(side="left", padx=(0, 12))
 
-    ctk.CTkLabel(stats_row, image=status_icons["unknown"], text="").pack(side="left", padx=(0, 4))
+    ctk.CTkLabel(stats_row, image=STATUS_ICONS["unknown"], text="").pack(side="left", padx=(0, 4))
     ctk.CTkLabel(stats_row, text=str(counts["unknown"]), font=FONTS["body"], text_color=THEME["muted"]).pack(side="left")
 
     # 진행바 (카드 폭에 맞춤)
@@ -1319,6 +3572,38 @@ def build_quiz_filter():
     pb.pack(fill="x", padx=SPACING["xl"], pady=(0, SPACING["lg"]))
     pb.set(progress if progress <= 1 else 1)
 
+    # ===== 답 방식 (Reveal / Multiple Choice) =====
+    def set_answer_mode(label):
+        global quiz_answer_mode
+        quiz_answer_mode = next(k for k, v in QUIZ_ANSWER_MODES.items() if v == label)
+    ctk.CTkSegmentedButton(
+        quiz_filter_frame,
+        values=list(QUIZ_ANSWER_MODES.values()),
+        variable=tk.StringVar(value=QUIZ_ANSWER_MODES[quiz_answer_mode]),
+        command=set_answer_mode,
+        width=480,
+        font=FONTS["body_bold"],
+        selected_color=THEME["gold"],
+        selected_hover_color=THEME["gold_dim"],
+        unselected_color=THEME["panel"],
+        unselected_hover_color=THEME["card_hover"],
+        text_color=THEME["text"]
+    ).pack(pady=(0, SPACING["sm"]))
+
+    # ===== 이어하기 (Back / 앱 종료로 멈춘 세션) =====
+    if quiz_session is not None or os.path.exists(QUIZ_SESSION_FILE):
+        resume_text = "▶  Resume Quiz"
+        if quiz_session is not None:
+            total = max(len(quiz_session), quiz_session.total_hint)
+            resume_text += f" ({quiz_session.index + 1}/{total})"
+        ctk.CTkButton(
+            quiz_filter_frame,
+            text=resume_text,
+            width=240,
+            command=resume_quiz,
+            **BTN_SOLID
+        ).pack(pady=(SPACING["sm"], 0))
+
     # ===== Scope Buttons =====
     scopes = [
         ("📚  All Words", "all", THEME["gold"], None, BTN_SOLID),
@@ -1339,6 +3624,35 @@ def build_quiz_filter():
         )
         btn.pack(pady=(SPACING["sm"], 0))
 
+    # 상태별 가중치 혼합 (모르는 단어일수록 자주 출제)
+    ctk.CTkButton(
+        quiz_filter_frame,
+        text="🎯  Weighted Mix",
+        width=240,
+        command=lambda: start_quiz_mode("mixed"),
+        **BTN_GHOST
+    ).pack(pady=(SPACING["sm"], 0))
+
+    # 여러 덱을 섞어서 한 세션으로
+    ctk.CTkButton(
+        quiz_filter_frame,
+        text="🗂  Multi-Deck",
+        width=240,
+        command=open_multi_deck_quiz,
+        **BTN_GHOST
+    ).pack(pady=(SPACING["sm"], 0))
+
+    # 복습 예정 (SM-2 스케줄, 오늘 자정까지 due인 단어 수는 힙에서 계산)
+    due = srs_due_count(cd, limit=SRS_COUNT_LIMIT + 1)  # 한 개 더 세서 정확히 SRS_COUNT_LIMIT개와 초과를 구분
+    due_label = f"{SRS_COUNT_LIMIT}+" if due > SRS_COUNT_LIMIT else str(due)
+    ctk.CTkButton(
+        quiz_filter_frame,
+        text=f"⏰  Due Today ({due_label})",
+        width=240,
+        command=lambda: start_quiz_mode("due"),
+        **BTN_GHOST
+    ).pack(pady=(SPACING["sm"], 0))
+
     # ===== Back Button =====
     ctk.CTkButton(
         quiz_filter_frame,
@@ -1348,7 +3662,8 @@ def build_quiz_filter():
         **BTN_GHOST
     ).pack(pady=SPACING["xl"])
 
-def start_quiz_mode(filter_type="all"):
+def start_quiz_mode(filter_type="all", deck_names=None, interleave="weighted"):
+    """deck_names를 주면 여러 덱을 하나의 세션으로 (덱별 지연 셔플 스트림을 interleave)"""
     cd = current_deck if current_deck in decks else (list(decks.keys())[0] if decks else None)
     if not decks:
         modal_info("No decks available.")
@@ -1357,56 +3672,208 @@ def start_quiz_mode(filter_type="all"):
         modal_info("No words available.")
         return
 
-    # 필터링
-    if filter_type == "all":
-        filtered = list(decks[cd].keys())
+    # 세션 생성 (목록형은 위치 인덱스를 한 번 섞고, 나머지는 카드를 그때그때 가져옴)
+    if deck_names:
+        names = [d for d in deck_names if decks.get(d)]
+        session = QuizSession.create(names, "merged", filter_type, interleave)
+    elif filter_type in ("due", "mixed"):
+        session = QuizSession.create([cd], filter_type)
     else:
-        filtered = [w for w, info in decks[cd].items() if info.get("status") == filter_type]
+        session = QuizSession.create([cd], "list", filter_type)
 
-    if not filtered:
-        modal_info("No words for this scope.")
+    if not len(session):
+        modal_info("No words due for review." if filter_type == "due" else "No words for this scope.")
         return
 
-    # ✅ 퀴즈 시작 시 단어 순서 섞기
-    random.shuffle(filtered)
+    global quiz_session
+    quiz_session = session
+    enter_quiz()
 
-    # 전역 상태 세팅
-    global sorted_words, quiz_index, current_word
-    sorted_words = filtered
-    quiz_index = 0
-    current_word = sorted_words[quiz_index]
+def enter_quiz():
+    """quiz_session의 현재 카드로 퀴즈 화면 진입 (새 세션 / 재개 공통)"""
+    global quiz_answer_mode, quiz_distractors, _quiz_last_spoken
+    quiz_answer_mode = quiz_session.answer_mode
+
+    # 객관식이면 덱별 오답 인덱스를 처음 필요할 때 한 번만 생성
+    quiz_distractors = {} if quiz_answer_mode == "choice" else None
+    _quiz_choices.update(key=None, options=[], answered=None)
+    _quiz_typed.update(key=None, result=None)
+    _quiz_last_spoken = None
+
+    _quiz_sync()
+    quiz_checkpoint()
 
     # 퀴즈 화면 빌드 및 전환
     build_quiz()
     show_frame(quiz_frame)
 
-    # 키 바인딩
-    root.bind("<Left>",  lambda e: quiz_prev())
-    root.bind("<Right>", lambda e: quiz_next())
+    # 키 바인딩 (입력창에서 커서 이동할 때는 무시)
+    root.bind("<Left>",  lambda e: None if isinstance(e.widget, tk.Entry) else quiz_prev())
+    root.bind("<Right>", lambda e: None if isinstance(e.widget, tk.Entry) else quiz_next())
+
+def resume_quiz():
+    """Back / 앱 종료로 멈춘 세션을 그 카드부터 이어서 (필터링 / 셔플 없이)"""
+    session = load_quiz_session()
+    if session is None or not session.is_valid():
+        quiz_session_discard()
+        modal_info("The saved quiz can't be resumed because its decks have changed.")
+        build_quiz_filter()
+        return
+    enter_quiz()
+
+def _quiz_sync():
+    global current_word, quiz_deck, _quiz_shown_at
+    quiz_deck, current_word = quiz_session.current
+    _quiz_shown_at = time.perf_counter()  # 응답 시간 기준 (카드가 바뀐 시점)
+
+def quiz_distractor_index(deck_name):
+    """객관식 오답 인덱스 (덱별, 세션 중 처음 나온 덱만 생성)"""
+    if deck_name not in quiz_distractors:
+        quiz_distractors[deck_name] = DistractorIndex([deck_name])
+    return quiz_distractors[deck_name]
 
 def update_status(status):
-    cd = current_deck
+    cd = quiz_deck
     if cd in decks and current_word in decks[cd]:
-        decks[cd][current_word]["status"] = status
+        info = mutable_word(cd, current_word)
+        old_status = info.get("status", "unknown")
+        info["status"] = status
+        record_review(cd, current_word, old_status, status, (time.perf_counter() - _quiz_shown_at) * 1000)
+        rollup_review(cd, current_word, old_status, status)
+        srs_grade(cd, current_word, status)
+        if quiz_session.sampler is not None:
+            quiz_session.sampler.update(current_word, decks[cd][current_word])
+        quiz_session.grade(status)
+        quiz_checkpoint()
         save_decks()
         build_main_menu()
 
 def quiz_next():
-    global quiz_index, current_word
-    if 'sorted_words' not in globals() or not sorted_words: return
-    if quiz_index < len(sorted_words)-1:
-        quiz_index += 1
-        current_word = sorted_words[quiz_index]
+    if quiz_session is None: return
+    if quiz_session.forward():
+        _quiz_sync()
+        quiz_checkpoint()
         build_quiz()
 
 def quiz_prev():
-    global quiz_index, current_word
-    if 'sorted_words' not in globals() or not sorted_words: return
-    if quiz_index > 0:
-        quiz_index -= 1
-        current_word = sorted_words[quiz_index]
+    if quiz_session is None: return
+    if quiz_session.back():
+        _quiz_sync()
+        quiz_checkpoint()
         build_quiz()
 
+# ----- 퀴즈 발음 look-ahead -----
+QUIZ_PREFETCH_DEPTH = 5     # 현재 카드 뒤로 미리 렌더링할 카드 수
+quiz_auto_speak = False     # 카드가 바뀌면 자동으로 발음
+_quiz_last_spoken = None
+
+def quiz_prefetch_audio():
+    """현재 카드 + 다음 QUIZ_PREFETCH_DEPTH장을 최우선으로 렌더링 (이전 예약은 취소)"""
+    if quiz_session is None:
+        return
+    i = quiz_session.index
+    words = [quiz_session.card(j)[1] for j in range(i, min(i + 1 + QUIZ_PREFETCH_DEPTH, len(quiz_session)))]
+    tts_prerender(words, RENDER_PRIO_PREFETCH, replace=True)
+
+def get_quiz_audio_stats():
+    """퀴즈에서 🔊/자동 발음 요청의 캐시 hit / miss"""
+    c = tts_source_stats.get("quiz", {"hits": 0, "misses": 0})
+    total = c["hits"] + c["misses"]
+    return {"depth": QUIZ_PREFETCH_DEPTH, "hits": c["hits"], "misses": c["misses"],
+            "hit_rate": (c["hits"] / total) if total else 0.0}
+
+def toggle_quiz_auto_speak():
+    global quiz_auto_speak, _quiz_last_spoken
+    quiz_auto_speak = not quiz_auto_speak
+    _quiz_last_spoken = None
+    build_quiz()
+
+def build_quiz_choices(cd):
+    """정답 뜻 + 오답 보기 버튼. 같은 카드에서는 보기 순서 유지 (채점 후 다시 그려도 동일)"""
+    info = decks[cd][current_word]
+    key = (quiz_session.index, current_word)
+    if _quiz_choices["key"] != key:
+        options = [info.get("meaning", "").strip()] + quiz_distractor_index(cd).pick(info)
+        random.shuffle(options)
+        _quiz_choices.update(key=key, options=options, answered=None)
+
+    correct = info.get("meaning", "").strip()
+    answered = _quiz_choices["answered"]
+
+    def choose(option):
+        if _quiz_choices["answered"] is not None:
+            return
+        _quiz_choices["answered"] = option
+        update_status("known" if option == correct else "unknown")
+        build_quiz()
+        if option == correct:
+            root.after(700, advance)
+
+    def advance():
+        # 맞히면 잠시 뒤 다음 카드 (그 사이 직접 이동했으면 무시)
+        if (quiz_session.index, current_word) == key:
+            quiz_next()
+
+    box = ctk.CTkFrame(quiz_frame, fg_color="transparent")
+    box.pack(pady=(SPACING["sm"], 0))
+    for i, option in enumerate(_quiz_choices["options"]):
+        style = {**BTN_GHOST}
+        if answered is not None and option == correct:
+            style.update(fg_color=THEME["success"], hover_color=THEME["success"])
+        elif answered is not None and option == answered:
+            style.update(fg_color=THEME["danger"], hover_color=THEME["danger"])
+        label = option if len(option) <= 60 else option[:59] + "…"
+        ctk.CTkButton(box, text=f"{i + 1}. {label}", width=480, anchor="w",
+                      command=lambda o=option: choose(o), **style).pack(pady=2)
+
+def build_quiz_typed(cd):
+    """단어/뜻 직접 입력 → 편집거리로 채점 → update_status"""
+    info = decks[cd][current_word]
+    key = (quiz_session.index, current_word)
+    if _quiz_typed["key"] != key:
+        _quiz_typed.update(key=key, result=None)
+    typing_word = quiz_answer_mode == "typed_word"
+    expected = current_word if typing_word else info.get("meaning", "")
+
+    box = ctk.CTkFrame(quiz_frame, fg_color="transparent")
+    box.pack(pady=(SPACING["sm"], 0))
+    prompt = (f"({info.get('part_of_speech', '')}) {info.get('meaning', '')}" if typing_word
+              else "Type the meaning")
+    ctk.CTkLabel(box, text=prompt, font=FONTS["h3"], text_color=THEME["text"],
+                 wraplength=560, justify="center").pack(pady=(0, SPACING["sm"]))
+
+    entry = ctk.CTkEntry(box, width=480, placeholder_text="Your answer…")
+    entry.pack()
+    result_lbl = ctk.CTkLabel(box, text="", font=FONTS["body_bold"], wraplength=560, justify="center")
+    result_lbl.pack(pady=(SPACING["xs"], 0))
+
+    def show_result():
+        status, dist, typed = _quiz_typed["result"]
+        color = {"known": THEME["success"], "partial": THEME["warn"]}.get(status, THEME["danger"])
+        text = {"known": "✅ Correct", "partial": "🟡 Almost"}.get(status, "❌ Wrong")
+        if dist:
+            text += f"  →  {expected}"
+        result_lbl.configure(text=text, text_color=color)
+        entry.insert(0, typed)
+        entry.configure(state="disabled")
+
+    def check(event=None):
+        if _quiz_typed["result"] is not None:
+            quiz_next()  # 채점 후 Enter → 다음 카드
+            return
+        typed = entry.get()
+        status, dist = grade_typed_answer(typed, expected)
+        _quiz_typed["result"] = (status, dist, typed)
+        update_status(status)
+        build_quiz()
+
+    if _quiz_typed["result"] is not None:
+        show_result()
+    entry.bind("<Return>", check)
+    ctk.CTkButton(box, text=("▶  Next" if _quiz_typed["result"] else "✔  Check"), width=240,
+                  command=check, **BTN_SOLID).pack(pady=(SPACING["sm"], 0))
+    entry.focus_set()
+
 def build_quiz():
     for w in quiz_frame.winfo_children():
         w.destroy()
@@ -1450,9 +3917,9 @@ def build_quiz():
     btn_ghost_small = {**BTN_GHOST, "height": 36}
     btn_ghost_icon  = {**BTN_GHOST, "height": 50, "width": 50}
 
-    cd = current_deck
-    total = len(sorted_words)
-    progress = (quiz_index + 1) / total if total else 0
+    cd = quiz_deck
+    total = max(len(quiz_session), quiz_session.total_hint)
+    progress = (quiz_session.index + 1) / total if total else 0
     word_status = decks[cd][current_word].get("status", "unknown")
 
     # ===== 상단 카드 (폭 고정) =====
@@ -1470,17 +3937,14 @@ def build_quiz():
     header.pack(padx=SPACING["xl"])
 
     # 첫 줄: 상태 아이콘 + 단어(말줄임표) + 발음 버튼
-    status_icon_img = {
-        "unknown": icon_unknown_img,
-        "partial": icon_partial_img,
-        "known": icon_known_img,
-    }
     top_row = ctk.CTkFrame(header, fg_color="transparent")
     top_row.pack(pady=(SPACING["sm"], SPACING["xs"]))
 
-    ctk.CTkLabel(top_row, image=status_icon_img[word_status], text="").pack(side="left", padx=(0, SPACING["sm"]))
+    ctk.CTkLabel(top_row, image=STATUS_ICONS[word_status], text="").pack(side="left", padx=(0, SPACING["sm"]))
 
-    display_word = truncate_text(current_word, 15)
+    # 단어 입력 모드에서는 채점 전까지 정답(단어)을 가림 (툴팁 / 발음 / 예문 포함)
+    hide_word = quiz_answer_mode == "typed_word" and quiz_session.results[quiz_session.index] < 0
+    display_word = "❓" if hide_word else truncate_text(current_word, 15)
     word_label = ctk.CTkLabel(
         top_row,
         text=display_word,
@@ -1488,22 +3952,50 @@ def build_quiz():
         text_color=THEME["gold"]
     )
     word_label.pack(side="left")
-    create_tooltip(word_label, current_word)
+    if not hide_word:
+        create_tooltip(word_label, current_word)
 
-    ctk.CTkButton(top_row, text="🔊", width=36, command=lambda: speak_text(current_word), **btn_ghost_small)\
+    ctk.CTkButton(top_row, text="🔊", width=36, command=lambda: speak_text(current_word, source="quiz"),
+                  state=("disabled" if hide_word else "normal"), **btn_ghost_small)\
         .pack(side="left", padx=SPACING["sm"])
 
-    # 둘째 줄: 좌/우 이동 버튼
+    # 둘째 줄: 좌/우 이동 버튼 + 자동 발음
     nav_row = ctk.CTkFrame(header, fg_color="transparent")
     nav_row.pack(pady=(0, SPACING["xs"]))
     ctk.CTkButton(nav_row, text="◀", width=50, command=quiz_prev, **btn_ghost_small).pack(side="left", padx=SPACING["sm"])
     ctk.CTkButton(nav_row, text="▶", width=50, command=quiz_next, **btn_ghost_small).pack(side="left", padx=SPACING["sm"])
+    ctk.CTkButton(
+        nav_row,
+        text=("🔁 Auto-speak ON" if quiz_auto_speak else "🔁 Auto-speak OFF"),
+        width=140,
+        command=toggle_quiz_auto_speak,
+        **btn_ghost_small
+    ).pack(side="left", padx=SPACING["sm"])
 
     # 진행바
     pb = ctk.CTkProgressBar(header, height=8, fg_color=THEME["card"], progress_color=THEME["gold"])
     pb.pack(fill="x", padx=SPACING["xl"], pady=(0, SPACING["xs"]))
     pb.set(progress if progress <= 1 else 1)
 
+    # 발음 캐시 적중률 (look-ahead 렌더링 효과 확인용)
+    audio = get_quiz_audio_stats()
+    stats_text = f"Audio cache {audio['hits']}/{audio['hits'] + audio['misses']}   •   Prefetch {audio['depth']}"
+    if len(quiz_session.deck_names) > 1:
+        stats_text = f"📚 {truncate_text(cd, 24)}   •   " + stats_text  # 여러 덱 세션: 현재 카드의 덱
+    ctk.CTkLabel(
+        header,
+        text=stats_text,
+        font=FONTS["body"],
+        text_color=THEME["muted"]
+    ).pack(pady=(0, SPACING["xs"]))
+
+    # 자동 발음 (카드가 바뀐 경우에만) + 다음 카드들 미리 렌더링
+    global _quiz_last_spoken
+    if quiz_auto_speak and not hide_word and _quiz_last_spoken != (quiz_session.index, current_word):
+        _quiz_last_spoken = (quiz_session.index, current_word)
+        speak_text(current_word, source="quiz")
+    quiz_prefetch_audio()
+
     # ===== 상태 변경 버튼 =====
     st = ctk.CTkFrame(quiz_frame, fg_color="transparent")
     st.pack(pady=8)
@@ -1526,19 +4018,26 @@ def build_quiz():
     )
     answer.pack(pady=0)
 
+    # ===== 객관식 보기 =====
+    if quiz_answer_mode == "choice" and quiz_distractors is not None:
+        build_quiz_choices(cd)
+    elif quiz_answer_mode in ("typed_word", "typed_meaning"):
+        build_quiz_typed(cd)
+
     # ===== 액션 버튼 =====
     actions = ctk.CTkFrame(quiz_frame, fg_color="transparent")
     actions.pack(pady=(SPACING["lg"], SPACING["xl"]))
 
-    ctk.CTkButton(
-        actions,
-        text="📖  Show Answer",
-        width=240,
-        command=lambda: answer.configure(
-            text=f"({decks[cd][current_word].get('part_of_speech','')}) {decks[cd][current_word].get('meaning','')}"
-        ),
-        **BTN_SOLID
-    ).grid(row=0, column=0, padx=SPACING["md"], pady=SPACING["sm"])
+    if quiz_answer_mode == "reveal":
+        ctk.CTkButton(
+            actions,
+            text="📖  Show Answer",
+            width=240,
+            command=lambda: answer.configure(
+                text=f"({decks[cd][current_word].get('part_of_speech','')}) {decks[cd][current_word].get('meaning','')}"
+            ),
+            **BTN_SOLID
+        ).grid(row=0, column=0, padx=SPACING["md"], pady=SPACING["sm"])
 
     ctk.CTkButton(
         actions,
@@ -1547,6 +4046,7 @@ def build_quiz():
         command=lambda: answer.configure(
             text=f"Ex: {decks[cd][current_word].get('example','').strip() or 'No example saved.'}"
         ),
+        state=("disabled" if hide_word else "normal"),
         **BTN_GHOST
     ).grid(row=1, column=0, padx=SPACING["md"], pady=SPACING["sm"])
 
@@ -1593,6 +4093,7 @@ def update_word_list():
     if shuffle_enabled:
         random.shuffle(items)
     filtered_words = items
+    multi_selected.intersection_update(w for w, _ in items)  # 필터에서 빠진 단어는 다중 선택에서도 제외
     build_word_list_rows()
 
     # 선택 복원 (있고, 결과에 남아있으면 하이라이트 포함)
@@ -1600,10 +4101,10 @@ def update_word_list():
     if prev_selected:
         for idx, (w, _) in enumerate(filtered_words):
             if w == prev_selected:
-                set_selection(idx)
+                set_selection(idx, mode="keep")
                 break
         else:
-            set_selection(None)
+            set_selection(None, mode="keep")
 
     show_frame(list_frame)
 
@@ -1627,17 +4128,23 @@ def edit_word(word):
             overlay.destroy()
             root.after(10, lambda: modal_warn("⚠️ Please enter both word and meaning."))
             return
+        prev_target = decks[cd].get(new_word)  # 되돌릴 값 (이름을 바꿔 다른 단어를 덮어쓰는 경우 포함)
 
         # 단어 이름이 바뀌면 기존 키 삭제
+        patches = []
         if new_word != word:
-            decks[cd].pop(word, None)
+            patches.append(("word", cd, word, decks[cd].pop(word, None), None))
 
         decks[cd][new_word] = {
+            **d,  # 복습 스케줄 등 나머지 필드 유지
             "part_of_speech": pos_var.get().strip(),
             "meaning": m_var.get().strip(),
             "example": ex_var.get().strip(),
              "status": status_var.get()
         }
+        patches.append(("word", cd, new_word, prev_target, decks[cd][new_word]))
+        undo_record(f"Edit '{new_word}'", patches)
+        srs_touch(cd, new_word)
         save_decks()
         refresh_word_list_header()
         update_word_list()
@@ -1688,13 +4195,140 @@ def delete_word(word):
     modal_confirm(
         f"Delete '{word}'?",
         lambda: (
-            decks[current_deck].pop(word, None),
+            undo_record(f"Delete '{word}'", [("word", cd, word, decks[cd].pop(word, None), None)]),
             save_decks(),
             refresh_word_list_header(),  # ← 헤더 즉시 갱신
             update_word_list()
         )
     )
 
+# ----- 여러 단어 한 번에 (다중 선택 / 필터 결과 전체) -----
+# 작업마다 변경은 한 번에 적용 → undo 한 단계 + save_decks() 한 번 + 목록 갱신 한 번
+
+def _words_label(n):
+    return f"{n} word" + ("" if n == 1 else "s")
+
+def _bulk_commit(label, patches, decks_touched):
+    if not patches:
+        _show_toast("Nothing changed")
+        return
+    for d in decks_touched:
+        srs_forget(d)
+    undo_record(label, patches)
+    save_decks()
+    refresh_word_list_header()
+    update_word_list()
+    _show_toast(f"{label}  (Ctrl+Z to undo)")
+
+def bulk_set_status(deck_name, words, status):
+    deck = decks[deck_name]
+    patches = []
+    for w in words:
+        old = deck.get(w)
+        if old is None or old.get("status", "unknown") == status:
+            continue
+        info = mutable_word(deck_name, w)
+        info["status"] = status
+        patches.append(("word", deck_name, w, old, info))
+    _bulk_commit(f"{_words_label(len(patches))} → {status}", patches, ())
+
+def bulk_delete(deck_name, words):
+    deck = decks[deck_name]
+    patches = [("word", deck_name, w, deck.pop(w), None) for w in words if w in deck]
+    _bulk_commit(f"Deleted {_words_label(len(patches))}", patches, (deck_name,))
+
+def bulk_transfer(deck_name, words, target, move=False):
+    """다른 덱으로 복사 / 이동. 레코드는 공유(copy-on-write)하고, 대상에 같은 단어가 있으면 덮어씀"""
+    src, dst = decks[deck_name], decks[target]
+    patches = []
+    for w in words:
+        info = src.get(w)
+        if info is None:
+            continue
+        patches.append(("word", target, w, dst.get(w), info))
+        dst[w] = info
+        if move:
+            patches.append(("word", deck_name, w, src.pop(w), None))
+    n = len(patches) // 2 if move else len(patches)
+    _bulk_commit(f"{'Moved' if move else 'Copied'} {_words_label(n)} to '{target}'", patches, (deck_name, target))
+
+def open_bulk_modal():
+    cd = current_deck if current_deck in decks else None
+    if not cd or not filtered_words:
+        modal_info("No words in the list.")
+        return
+    visible = [w for w, _ in filtered_words]
+    chosen = [w for w in visible if w in multi_selected]
+    targets = {"selected": f"Selected ({len(chosen)})", "filtered": f"All in list ({len(visible)})"}
+    target_var = tk.StringVar(value=targets["selected"])   # 필터 전체는 직접 골랐을 때만
+    others = [d for d in decks if d != cd]
+    deck_var = tk.StringVar(value=others[0] if others else "")
+
+    def words():
+        return chosen if target_var.get() == targets["selected"] else visible
+
+    def build(parent, overlay):
+        def run(action):
+            ws = words()
+            if not ws:
+                msg.configure(text="⚠️ No words selected. Ctrl / Shift-click rows to select.")
+                return
+            overlay.destroy()
+            action(ws)
+
+        ctk.CTkSegmentedButton(
+            parent,
+            values=list(targets.values()),
+            variable=target_var,
+            width=320,
+            font=FONTS["body_bold"],
+            selected_color=THEME["gold"],
+            selected_hover_color=THEME["gold_dim"],
+            unselected_color=THEME["panel"],
+            unselected_hover_color=THEME["card_hover"],
+            text_color=THEME["text"]
+        ).pack(pady=(SPACING["xs"], SPACING["sm"]))
+
+        ctk.CTkLabel(parent, text="Set Status", font=FONTS["body_bold"]).pack()
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=(0, SPACING["sm"]))
+        for status, label in [("unknown", "Don't Know"), ("partial", "Kind of Know"), ("known", "Know")]:
+            ctk.CTkButton(row, text=label, width=100, **BTN_GHOST,
+                          command=lambda s=status: run(lambda ws: bulk_set_status(cd, ws, s)))\
+                .pack(side="left", padx=2)
+
+        if others:
+            ctk.CTkLabel(parent, text="Move / Copy to", font=FONTS["body_bold"]).pack()
+            row = ctk.CTkFrame(parent, fg_color="transparent")
+            row.pack(pady=(0, SPACING["sm"]))
+            ctk.CTkOptionMenu(
+                row,
+                variable=deck_var,
+                values=others,
+                width=160,
+                fg_color=THEME["panel"],
+                button_color=THEME["gold"],
+                button_hover_color=THEME["gold_dim"],
+                text_color=THEME["text"]
+            ).pack(side="left", padx=2)
+            for label, move in (("Move", True), ("Copy", False)):
+                ctk.CTkButton(row, text=label, width=70, **BTN_GHOST,
+                              command=lambda m=move: run(lambda ws: bulk_transfer(cd, ws, deck_var.get(), move=m)))\
+                    .pack(side="left", padx=2)
+
+        msg = ctk.CTkLabel(parent, text="", font=FONTS["body"], text_color=THEME["danger"])
+        msg.pack()
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["sm"])
+        ctk.CTkButton(row, text="🎧 Listen", command=lambda: run(open_listen_modal), **BTN_GHOST).pack(side="left", padx=SPACING["xs"])
+        ctk.CTkButton(row, text="🗑 Delete", command=lambda: run(lambda ws: modal_confirm(
+            f"Delete {_words_label(len(ws))} from '{cd}'?", lambda: bulk_delete(cd, ws))), **BTN_GHOST)\
+            .pack(side="left", padx=SPACING["xs"])
+        ctk.CTkButton(row, text="Close", command=overlay.destroy, **BTN_SOLID).pack(side="left", padx=SPACING["xs"])
+
+    show_modal(f"☑ Bulk • {cd}", build, show_close=False)
+
 def show_hint_popup(word):
     cd = current_deck
     if word not in decks[cd]: return
@@ -1708,6 +4342,174 @@ def show_hint_popup(word):
         ctk.CTkButton(parent, text="Close", command=overlay.destroy, **BTN_SOLID).pack(pady=SPACING["sm"])
     show_modal(f"Hint • {word}", b, show_close=False)
 
+# ----- 🎧 Listen to Deck (단어 → 뜻 → 예문 연속 재생) -----
+PLAYLIST_FIELDS = ("word", "meaning", "example")
+PLAYLIST_LOOKAHEAD = 6      # 재생 위치 앞쪽으로 미리 렌더링할 구간 수
+PLAYLIST_GAP_MS = 300       # 구간 사이 쉬는 시간
+
+playlist = {"deck": None, "words": [], "pos": (0, 0), "playing": False, "token": 0, "on_change": None,
+            "resume": True}
+_playlist_positions = {}    # deck -> (word_idx, field_idx), 다시 열면 이어듣기 (덱 전체 재생일 때만)
+
+def _playlist_remember(pos=None):
+    if playlist["resume"]:
+        if pos is None:
+            _playlist_positions.pop(playlist["deck"], None)
+        else:
+            _playlist_positions[playlist["deck"]] = pos
+
+def _playlist_text(pos):
+    wi, fi = pos
+    info = decks.get(playlist["deck"], {}).get(playlist["words"][wi], {})
+    if fi == 0:
+        return playlist["words"][wi]
+    return info.get(PLAYLIST_FIELDS[fi], "").strip()
+
+def _playlist_iter(pos):
+    """pos부터 내용이 있는 구간을 순서대로 (pos, text) 생성"""
+    wi, fi = pos
+    while wi < len(playlist["words"]):
+        text = _playlist_text((wi, fi))
+        if text:
+            yield (wi, fi), text
+        fi += 1
+        if fi == len(PLAYLIST_FIELDS):
+            wi, fi = wi + 1, 0
+
+def _playlist_notify():
+    if playlist["on_change"]:
+        playlist["on_change"]()
+
+def _playlist_play_current():
+    """현재 위치 구간을 재생하고, 그 뒤 구간들을 미리 렌더링"""
+    upcoming = _playlist_iter(playlist["pos"])
+    first = next(upcoming, None)
+    if first is None:
+        playlist_stop(finished=True)
+        return
+    playlist["pos"], text = first
+    playlist["token"] += 1
+    speak_text(text, source="playlist",
+               on_done=lambda ok, t=playlist["token"]: _playlist_on_done(t, ok))
+    ahead = [t for _, t in itertools.islice(upcoming, PLAYLIST_LOOKAHEAD)]
+    tts_prerender(ahead, RENDER_PRIO_PLAYLIST, replace=True)
+    _playlist_notify()
+
+def _playlist_on_done(token, completed):
+    if token != playlist["token"] or not playlist["playing"]:
+        return
+    if not completed:
+        # 다른 🔊 요청 등에 밀려 끊김 → 일시정지 (현재 구간부터 다시)
+        playlist["playing"] = False
+        _playlist_notify()
+        return
+    wi, fi = playlist["pos"]
+    playlist["pos"] = (wi, fi + 1) if fi + 1 < len(PLAYLIST_FIELDS) else (wi + 1, 0)
+    _playlist_remember(playlist["pos"])
+
+    def next_segment():
+        if token == playlist["token"] and playlist["playing"]:
+            _playlist_play_current()
+    root.after(PLAYLIST_GAP_MS, next_segment)
+
+def playlist_start(deck_name, words=None):
+    """word list의 상태 필터(filter_vars)를 적용한 덱을 이어듣기 위치부터 재생.
+    words를 주면(선택한 단어들) 그 순서대로 처음부터 재생하고 위치는 기억하지 않음."""
+    resume = words is None
+    if resume:
+        statuses = [s for s, v in filter_vars.items() if v.get()]
+        deck = decks.get(deck_name, {})
+        words = [w for w, i in deck.items() if not statuses or i.get("status") in statuses]
+    playlist.update(deck=deck_name, words=words, playing=bool(words), resume=resume)
+    pos = _playlist_positions.get(deck_name, (0, 0)) if resume else (0, 0)
+    playlist["pos"] = pos if pos[0] < len(words) else (0, 0)
+    if words:
+        _playlist_play_current()
+    else:
+        _playlist_notify()
+
+def playlist_toggle():
+    if playlist["playing"]:
+        playlist_pause()
+    elif playlist["words"]:
+        playlist["playing"] = True
+        _playlist_play_current()
+
+def playlist_pause():
+    playlist["playing"] = False
+    playlist["token"] += 1
+    stop_speaking()
+    _playlist_remember(playlist["pos"])
+    _playlist_notify()
+
+def playlist_skip(step=1):
+    """다음/이전 단어로 이동 (재생 중이면 바로 재생)"""
+    if not playlist["words"]:
+        return
+    wi = min(max(0, playlist["pos"][0] + step), len(playlist["words"]) - 1)
+    playlist["pos"] = (wi, 0)
+    _playlist_remember(playlist["pos"])
+    if playlist["playing"]:
+        _playlist_play_current()
+    else:
+        _playlist_notify()
+
+def playlist_stop(finished=False):
+    if playlist["playing"]:
+        playlist_pause()
+    if finished:
+        _playlist_remember(None)  # 끝까지 들었으면 처음부터
+    playlist["playing"] = False
+    _playlist_notify()
+
+def open_listen_modal(words=None):
+    cd = current_deck if current_deck in decks else None
+    if not cd:
+        return
+
+    def build(parent, overlay):
+        word_lbl = ctk.CTkLabel(parent, text="", font=FONTS["h2"], text_color=THEME["gold"])
+        word_lbl.pack(pady=(0, SPACING["xs"]))
+        text_lbl = ctk.CTkLabel(parent, text="", font=FONTS["body"], text_color=THEME["muted"],
+                                wraplength=360, justify="center")
+        text_lbl.pack(pady=(0, SPACING["xs"]))
+        pos_lbl = ctk.CTkLabel(parent, text="", font=FONTS["body"], text_color=THEME["muted"])
+        pos_lbl.pack(pady=(0, SPACING["sm"]))
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(pady=SPACING["sm"])
+        ctk.CTkButton(row, text="⏮", width=50, command=lambda: playlist_skip(-1), **BTN_GHOST).pack(side="left", padx=SPACING["xs"])
+        play_btn = ctk.CTkButton(row, text="", width=110, command=playlist_toggle, **BTN_SOLID)
+        play_btn.pack(side="left", padx=SPACING["xs"])
+        ctk.CTkButton(row, text="⏭", width=50, command=lambda: playlist_skip(1), **BTN_GHOST).pack(side="left", padx=SPACING["xs"])
+
+        ctk.CTkButton(parent, text="Close", command=overlay.destroy, **BTN_GHOST).pack(pady=(SPACING["sm"], 0))
+
+        def refresh():
+            words = playlist["words"]
+            if not words:
+                word_lbl.configure(text="No words for this filter.")
+                text_lbl.configure(text="")
+                pos_lbl.configure(text="")
+            else:
+                wi, fi = playlist["pos"]
+                wi = min(wi, len(words) - 1)
+                word_lbl.configure(text=words[wi])
+                text_lbl.configure(text=_playlist_text((wi, fi)) if fi else "")
+                pos_lbl.configure(text=f"{wi + 1} / {len(words)}")
+            play_btn.configure(text=("⏸ Pause" if playlist["playing"] else "▶ Play"))
+
+        def on_close():
+            playlist["on_change"] = None
+            playlist_stop()
+
+        playlist["on_change"] = refresh
+        overlay.on_close = on_close
+        playlist_start(cd, words)
+        refresh()
+
+    show_modal(f"🎧 Listen • {cd}", build, show_close=False)
+
 def toggle_meanings():
     global hide_meanings
     hide_meanings = not hide_meanings
@@ -1724,6 +4526,8 @@ def build_word_list():
 
     global search_var, row_widgets
     row_widgets = []
+    multi_selected.clear()
+    _select_anchor["idx"] = None
 
     cd = current_deck if current_deck in decks else (list(decks.keys())[0] if decks else "Default")
     build_deck_header(list_frame, "📋  Word List", cd)
@@ -1759,6 +4563,27 @@ def build_word_list():
     edit_btn.pack(side="left", padx=2)
     del_btn.pack(side="left", padx=2)
 
+    # 선택과 무관: 현재 필터로 덱 전체 듣기
+    ctk.CTkButton(
+        action_row, text="🎧 Listen", width=90,
+        command=open_listen_modal,
+        **BTN_GHOST
+    ).pack(side="left", padx=2)
+    ctk.CTkButton(
+        action_row, text="⬇ Export", width=90,
+        command=lambda: open_export_popup("filtered"),
+        **BTN_GHOST
+    ).pack(side="left", padx=2)
+
+    # 다중 선택(Ctrl / Shift-클릭) 또는 필터 결과 전체에 일괄 작업
+    bulk_btn = ctk.CTkButton(
+        action_row, text="☑ Bulk", width=100,
+        command=open_bulk_modal,
+        **BTN_GHOST
+    )
+    bulk_btn.pack(side="left", padx=2)
+    list_frame._bulk_btn = bulk_btn
+
     for b in (speak_btn, hint_btn, edit_btn, del_btn):
         b.configure(state="disabled")
     list_frame._action_buttons = (speak_btn, hint_btn, edit_btn, del_btn)
@@ -1930,6 +4755,7 @@ def build_random_word_challenge():
             "example": "",
             "status": "unknown"
         }
+        srs_touch(cd, w)
         save_decks()
 
         # === 저장 후 즉시 편집 모달 ===
@@ -1938,9 +4764,10 @@ def build_random_word_challenge():
         ex_var  = tk.StringVar()
 
         def apply_changes():
-            decks[cd][w]["part_of_speech"] = pos_var.get().strip()
-            decks[cd][w]["meaning"] = m_var.get().strip()
-            decks[cd][w]["example"] = ex_var.get().strip()
+            info = mutable_word(cd, w)
+            info["part_of_speech"] = pos_var.get().strip()
+            info["meaning"] = m_var.get().strip()
+            info["example"] = ex_var.get().strip()
             save_decks()
 
             # 편집 모달 닫기
@@ -2003,34 +4830,48 @@ def build_random_word_challenge():
     # ✅ 화면 진입 시 바로 첫 단어 표시
     show_random_word()
 # 공통 선택 헬퍼: 인덱스와(옵션) 행 위젯을 받아 선택/하이라이트/버튼 활성화까지 한 번에
-def set_selection(idx, row=None):
+# mode: None = 단일 선택 / "toggle" = Ctrl-클릭 / "range" = Shift-클릭 / "keep" = 다중 선택 유지 (목록 갱신 후 복원)
+def set_selection(idx, row=None, mode=None):
     if idx is None or idx < 0 or idx >= len(filtered_words):
         # 범위를 벗어나면 선택 해제
         selected_index["idx"] = None
         selected_word["text"] = None
-        for (rf, *_ ) in row_widgets:
-            try: rf.configure(fg_color="transparent")
-            except: pass
+        if mode != "keep":
+            multi_selected.clear()
+        _paint_selection()
         for b in getattr(list_frame, "_action_buttons", []):
             b.configure(state="disabled")
         return
 
+    word = filtered_words[idx][0]
+    if mode == "range" and _select_anchor["idx"] is not None:
+        lo, hi = sorted((min(_select_anchor["idx"], len(filtered_words) - 1), idx))
+        multi_selected.update(w for w, _ in filtered_words[lo:hi + 1])
+    elif mode == "toggle":
+        multi_selected.symmetric_difference_update((word,))
+        _select_anchor["idx"] = idx
+    elif mode != "keep":
+        multi_selected.clear()
+        multi_selected.add(word)
+        _select_anchor["idx"] = idx
     selected_index["idx"] = idx
-    selected_word["text"] = filtered_words[idx][0]
-
-    # 하이라이트 갱신
-    for (rf, *_ ) in row_widgets:
-        try: rf.configure(fg_color="transparent")
-        except: pass
-    if row is None:
-        row = row_widgets[idx][0]
-    try: row.configure(fg_color=THEME["card_hover"])
-    except: pass
+    selected_word["text"] = word
+    _paint_selection()
 
     # 액션 버튼 활성화
     for b in getattr(list_frame, "_action_buttons", []):
         b.configure(state="normal")
 
+def _paint_selection():
+    """보이는 행 하이라이트 (현재 행 + 다중 선택) + Bulk 버튼 개수 갱신"""
+    for i, (rf, *_) in enumerate(row_widgets):
+        on = i < len(filtered_words) and (i == selected_index["idx"] or filtered_words[i][0] in multi_selected)
+        try: rf.configure(fg_color=THEME["card_hover"] if on else "transparent")
+        except: pass
+    btn = getattr(list_frame, "_bulk_btn", None)
+    if btn is not None and btn.winfo_exists():
+        btn.configure(text=f"☑ Bulk ({len(multi_selected)})" if len(multi_selected) > 1 else "☑ Bulk")
+
 def build_word_list_rows():
     global row_widgets
     body = list_frame._rows_container
@@ -2059,13 +4900,8 @@ def build_word_list_rows():
     for i, (row, status_lbl, word_lbl, pos_lbl, meaning_lbl) in enumerate(row_widgets):
         if i < len(filtered_words):
             w, info = filtered_words[i]
-            status_icons = {
-                "unknown": icon_unknown_img,
-                "partial": icon_partial_img,
-                "known": icon_known_img
-            }
             status_lbl.configure(
-                image=status_icons.get(info.get("status", "unknown")),
+                image=STATUS_ICONS.get(info.get("status", "unknown")),
                 text=""
             )
             word_lbl.configure(text=w)
@@ -2074,18 +4910,125 @@ def build_word_list_rows():
             row.grid()
 
             # ✅ 클릭 바인딩 재설정
-            def on_select(idx=i, rf=row):
+            def on_select(idx=i, rf=row, mode=None):
                 if hasattr(root, "_search_job"):
                     try:
                         root.after_cancel(root._search_job)
                     except:
                         pass
-                set_selection(idx, rf)
+                set_selection(idx, rf, mode)
 
             for wdg in (row, status_lbl, word_lbl, pos_lbl, meaning_lbl):
                 wdg.bind("<Button-1>", lambda e, idx=i, rf=row: on_select(idx, rf=rf))
+                wdg.bind("<Control-Button-1>", lambda e, idx=i, rf=row: on_select(idx, rf, "toggle"))
+                wdg.bind("<Shift-Button-1>", lambda e, idx=i, rf=row: on_select(idx, rf, "range"))
         else:
             row.grid_remove()
+    _paint_selection()
+
+# ==============================
+# Dashboard (daily rollups)
+# ==============================
+DASHBOARD_DAYS = 30
+dashboard_scope = "deck"    # "deck" = 현재 덱, "all" = 전체 덱
+
+def _draw_chart(canvas, values, color, kind="bar", width=560, height=120, pad=8):
+    """값 목록을 막대 / 꺾은선으로 (최댓값 기준 세로 스케일)"""
+    top = max(values) or 1
+    step = (width - 2 * pad) / max(len(values), 1)
+    ys = [height - pad - (v / top) * (height - 2 * pad) for v in values]
+    if kind == "bar":
+        for i, y in enumerate(ys):
+            x = pad + i * step
+            canvas.create_rectangle(x + 1, y, x + step - 1, height - pad, fill=color, width=0)
+    else:
+        points = [c for i, y in enumerate(ys) for c in (pad + (i + 0.5) * step, y)]
+        if len(points) >= 4:
+            canvas.create_line(*points, fill=color, width=2)
+    canvas.create_text(width - pad, pad, text=str(max(values) if values else 0),
+                       anchor="ne", fill=THEME["muted"], font=FONTS["body"])
+
+def build_dashboard():
+    for w in dashboard_frame.winfo_children():
+        w.destroy()
+
+    cd = current_deck if current_deck in decks else None
+    scope = dashboard_scope if cd else "all"
+    deck_name = cd if scope == "deck" else None
+    rollups_sync_known()
+    series = rollup_series(deck_name, DASHBOARD_DAYS)
+    reviews = [r for _, r, _, _ in series]
+    correct = sum(c for _, _, c, _ in series)
+
+    body = ctk.CTkScrollableFrame(dashboard_frame, fg_color="transparent")
+    body.pack(fill="both", expand=True)
+
+    # ===== Header =====
+    header = ctk.CTkFrame(body, fg_color=THEME["panel"], corner_radius=RADIUS["lg"], border_width=1, border_color=THEME["line"])
+    header.pack(pady=(SPACING["xxl"], SPACING["md"]), padx=SPACING["xl"])
+    ctk.CTkLabel(header, text=f"📈  Dashboard • {cd if deck_name else 'All Decks'}", font=FONTS["h1"],
+                 text_color=THEME["gold"]).pack(pady=(SPACING["md"], 0), padx=SPACING["xl"], anchor="w")
+    ctk.CTkLabel(
+        header,
+        text=(f"Today {reviews[-1]}   |   {DASHBOARD_DAYS} days {sum(reviews)} reviews   |   "
+              f"Accuracy {correct / sum(reviews) * 100 if sum(reviews) else 0:.0f}%   |   Known {series[-1][3]}"),
+        font=FONTS["body"],
+        text_color=THEME["muted"]
+    ).pack(pady=(0, SPACING["sm"]), padx=SPACING["xl"], anchor="w")
+
+    def set_scope(label):
+        global dashboard_scope
+        dashboard_scope = "deck" if label == "This Deck" else "all"
+        build_dashboard()
+    if cd:
+        ctk.CTkSegmentedButton(
+            header,
+            values=["This Deck", "All Decks"],
+            variable=tk.StringVar(value="This Deck" if deck_name else "All Decks"),
+            command=set_scope,
+            font=FONTS["body_bold"],
+            selected_color=THEME["gold"],
+            selected_hover_color=THEME["gold_dim"],
+            unselected_color=THEME["panel"],
+            unselected_hover_color=THEME["card_hover"],
+            text_color=THEME["text"]
+        ).pack(pady=(0, SPACING["md"]), padx=SPACING["xl"], anchor="w")
+
+    # ===== Charts =====
+    for title, values, color, kind in (
+        ("Reviews per day", reviews, THEME["gold"], "bar"),
+        ("Known words", [k for _, _, _, k in series], THEME["success"], "line"),
+    ):
+        card = ctk.CTkFrame(body, fg_color=THEME["panel"], corner_radius=RADIUS["md"], border_width=1, border_color=THEME["line"])
+        card.pack(pady=(0, SPACING["md"]), padx=SPACING["xl"])
+        ctk.CTkLabel(card, text=title, font=FONTS["body_bold"]).pack(anchor="w", padx=SPACING["md"], pady=(SPACING["sm"], 0))
+        canvas = tk.Canvas(card, width=560, height=120, bg=THEME["panel"], highlightthickness=0)
+        canvas.pack(padx=SPACING["md"], pady=(0, SPACING["xs"]))
+        _draw_chart(canvas, values, color, kind)
+        ctk.CTkLabel(card, text=f"{series[0][0]}  →  {series[-1][0]}", font=FONTS["body"],
+                     text_color=THEME["muted"]).pack(anchor="e", padx=SPACING["md"], pady=(0, SPACING["sm"]))
+
+    # ===== Hardest words =====
+    card = ctk.CTkFrame(body, fg_color=THEME["panel"], corner_radius=RADIUS["md"], border_width=1, border_color=THEME["line"])
+    card.pack(pady=(0, SPACING["md"]), padx=SPACING["xl"])
+    ctk.CTkLabel(card, text="Hardest words", font=FONTS["body_bold"]).pack(anchor="w", padx=SPACING["md"], pady=(SPACING["sm"], 0))
+    hard = hardest_words(deck_name)
+    if not hard:
+        ctk.CTkLabel(card, text="Not enough reviews yet.", font=FONTS["body"], text_color=THEME["muted"], width=560)\
+            .pack(padx=SPACING["md"], pady=(0, SPACING["sm"]))
+    for name, word, miss_rate, n in hard:
+        label = word if deck_name else f"{word}  ({name})"
+        ctk.CTkLabel(card, text=f"{label}   —   {miss_rate * 100:.0f}% missed • {n} reviews", font=FONTS["body"],
+                     text_color=THEME["text"], width=560, anchor="w").pack(padx=SPACING["md"], pady=1)
+    ctk.CTkFrame(card, fg_color="transparent", height=SPACING["sm"]).pack()
+
+    ctk.CTkButton(
+        body,
+        text="🔙  Back",
+        width=240,
+        command=lambda: (build_main_menu(), show_frame(menu_frame)),
+        **BTN_GHOST
+    ).pack(pady=SPACING["xl"])
 
 # ==============================
 # About / Reset
@@ -2107,7 +5050,7 @@ def reset_app():
         # 안내 문구
         ctk.CTkLabel(
             parent,
-            text="Reset the app?\nAll decks and words will be deleted.",
+            text="Reset the app?\nAll decks and words will be deleted.\n(Ctrl+Z restores decks and dashboard history)",
             font=FONTS["body"],
             text_color=THEME["muted"],
             justify="center"
@@ -2125,8 +5068,14 @@ def reset_app():
 
                 # 메모리 초기화
                 global decks, current_deck
+                before, prev_current = decks, current_deck
                 decks = {"Default": {}}
                 current_deck = "Default"
+                srs_forget()
+                quiz_session_discard()
+                undo_record("Reset app", [("all", None, None, before, {"Default": {}}),
+                                          ("rollup", None, None, rollups_forget(), None)],
+                            (prev_current, current_deck))
                 save_decks()
 
                 # UI 갱신
@@ -2134,36 +5083,11 @@ def reset_app():
                 build_deck_select()
                 show_frame(deck_select_frame)
 
-                # 완료 알림도 커스텀 모달로
-                def build_done(parent2, overlay2):
-                    ctk.CTkLabel(
-                        parent2,
-                        text="✅ App has been reset.",
-                        font=FONTS["body"],
-                        text_color=THEME["muted"],
-                        justify="center"
-                    ).pack(pady=SPACING["md"])
-                    ctk.CTkButton(
-                        parent2, text="OK", command=overlay2.destroy, **BTN_SOLID
-                    ).pack(pady=SPACING["sm"])
-
-                show_modal("Reset Complete", build_done, show_close=False)
+                # 완료 알림
+                modal_info("✅ App has been reset.", title="Reset Complete")
 
             except Exception as e:
-                # 에러도 커스텀 모달로
-                def build_error(parent2, overlay2):
-                    ctk.CTkLabel(
-                        parent2,
-                        text=f"❌ Reset failed:\n{e}",
-                        font=FONTS["body"],
-                        text_color=THEME["muted"],
-                        justify="center"
-                    ).pack(pady=SPACING["md"])
-                    ctk.CTkButton(
-                        parent2, text="OK", command=overlay2.destroy, **BTN_SOLID
-                    ).pack(pady=SPACING["sm"])
-
-                show_modal("Error", build_error, show_close=False)
+                modal_error(f"❌ Reset failed:\n{e}")
 
         # Reset 버튼
         ctk.CTkButton(
@@ -2182,7 +5106,7 @@ def confirm_reset_app():
     def build(parent, overlay):
         ctk.CTkLabel(
             parent,
-            text="Reset the app?\nAll decks and words will be deleted.",
+            text="Reset the app?\nAll decks and words will be deleted.\n(Ctrl+Z restores decks and dashboard history)",
             font=FONTS["body"],
             text_color=THEME["muted"],
             justify="center"
@@ -2196,8 +5120,14 @@ def confirm_reset_app():
                 if os.path.exists(VOCAB_FILE):
                     os.remove(VOCAB_FILE)
                 global decks, current_deck
+                before, prev_current = decks, current_deck
                 decks = {"Default": {}}
                 current_deck = "Default"
+                srs_forget()
+                quiz_session_discard()
+                undo_record("Reset app", [("all", None, None, before, {"Default": {}}),
+                                          ("rollup", None, None, rollups_forget(), None)],
+                            (prev_current, current_deck))
                 save_decks()
                 overlay.destroy()
                 build_deck_select()
@@ -2226,4 +5156,28 @@ load_decks()
 build_all()
 show_frame(deck_select_frame)
 center_root_window(root)
+root.after(100, preload_assets)        # 첫 프레임 이후 첫 화면에 없던 매니페스트 이미지 디코딩
+root.after(200, _modal_ensure_pool)    # 모달 카드 미리 생성
+root.after(300, _warm_heavy_imports)  # 첫 프레임 이후 pandas/pyttsx3 미리 로드
+root.after(500, _start_tts_worker)    # TTS 엔진 미리 생성 (첫 🔊 지연 감소)
+
+def on_app_close():
+    quiz_session_flush()  # 마지막 퀴즈 체크포인트까지 기록하고 종료
+    rollups_flush()
+    root.destroy()
+
+for seq, action in (("<Control-z>", undo), ("<Control-Z>", undo), ("<Control-y>", redo), ("<Control-Y>", redo)):
+    root.bind(seq, lambda e, a=action: _on_undo_key(e, a))
+root.protocol("WM_DELETE_WINDOW", on_app_close)
+
+if STARTUP_CHECK_FLAG in sys.argv:
+    # 시작 경로 검사 (--import-report): 첫 화면을 그린 시점에 지연 모듈이 이미 로드됐으면 실패
+    root.update_idletasks()
+    _loaded_early = [m for m in DEFERRED_MODULES if m in sys.modules]
+    root.destroy()
+    if _loaded_early:
+        print("deferred modules loaded at startup: " + ", ".join(_loaded_early))
+        sys.exit(1)
+    sys.exit(0)
+
 root.mainloop()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# vocab_io 가져오기 파서 회귀 테스트 (tkinter 없이 실행 가능)
+
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vocab_io
+from vocab_io import (diff_deck, export_words, iter_delimited_rows, iter_import_rows, merge_word,
+                      preview_import_file, rows_to_deck)
+
+TAB_ROWS = "apple\tnoun\tfruit, red\tAn apple a day.\nbanana\tnoun\tfruit\tYellow, long.\n"
+
+
+def test_tab_rows_with_commas_split_on_tab():
+    words = rows_to_deck(iter_delimited_rows(io.StringIO(TAB_ROWS)))
+    assert sorted(words) == ["apple", "banana"]
+    assert words["apple"]["meaning"] == "fruit, red"
+    assert words["banana"]["example"] == "Yellow, long."
+
+
+def test_explicit_tab_delimiter():
+    text = "apple\tnoun\tfruit, red\nbanana, ripe\n"  # 둘째 줄엔 탭이 없어도 쉼표로 나누지 않음
+    words = rows_to_deck(iter_delimited_rows(io.StringIO(text), delimiter="\t"))
+    assert words["apple"]["meaning"] == "fruit, red"
+    assert "banana, ripe" in words
+
+
+def test_tsv_file_always_uses_tab(tmp_path):
+    path = tmp_path / "words.tsv"
+    path.write_text("apple\tnoun\tfruit, red, sweet\nkiwi, green\n", encoding="utf-8")
+    words = rows_to_deck(iter_import_rows(str(path)))
+    assert words["apple"]["meaning"] == "fruit, red, sweet"
+    assert "kiwi, green" in words
+
+
+def test_comma_rows_still_sniffed():
+    words = rows_to_deck(iter_delimited_rows(io.StringIO('apple,noun,"fruit, red"\nbanana,noun,fruit\n')))
+    assert words["apple"]["meaning"] == "fruit, red"
+
+
+def test_merge_keeps_existing_values_for_blank_fields():
+    old = {"part_of_speech": "noun", "meaning": "fruit", "example": "An apple a day.", "status": "known"}
+    incoming = rows_to_deck([[("apple", "", "red fruit", ""), ("pear", "", "", "")]])
+    assert merge_word(old, incoming["apple"]) == {**old, "meaning": "red fruit"}
+    diff = diff_deck({"apple": old, "pear": {**old, "meaning": "pear"}}, incoming)
+    assert diff["change"] == ["apple"] and diff["same"] == 1
+
+
+def test_exported_xlsx_has_row_count(tmp_path, monkeypatch):
+    pytest.importorskip("openpyxl")
+    monkeypatch.setattr(vocab_io, "_calamine", lambda: None)   # openpyxl 경로 (dimension에서 행 수)
+    path = str(tmp_path / "deck.xlsx")
+    words = {f"w{i}": {"part_of_speech": "noun", "meaning": f"m{i}", "example": "", "status": "known"} for i in range(5)}
+    export_words(path, [("Deck", iter(words.items()), len(words))])
+    totals = []
+    assert sorted(rows_to_deck(iter_import_rows(path, on_total=totals.append))) == sorted(words)
+    assert totals == [5]
+    assert preview_import_file(path)["total"] == 5
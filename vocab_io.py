@@ -0,0 +1,445 @@
+# -*- coding: utf-8 -*-
+# vocab_io.py — 단어장 가져오기 / 내보내기 (Excel / CSV / TSV / JSONL)
+# Notes:
+# - tkinter / customtkinter를 import하지 않는 순수 모듈.
+#   ProcessPoolExecutor의 spawn 자식 프로세스는 이 모듈만 import해서 파싱 (GUI 재실행 없음).
+# - pandas / openpyxl / python-calamine(선택, 빠른 엑셀 읽기)은 함수 안에서 필요할 때만 import.
+
+import csv
+import hashlib
+import json
+import os
+import re
+import time
+
+IMPORT_CHUNK_ROWS = 2000    # 한 번에 처리하는 행 수 (메모리 사용량 상한)
+DEFAULT_COLUMNS = (0, 1, 2, 3)  # (word, pos, meaning, example)를 읽을 원본 열 번호, None = 빈 값
+
+def _pick(row, columns):
+    """원본 행 → columns 순서의 4칸 튜플 (없는 열 / None은 "")"""
+    return tuple(row[c] if c is not None and c < len(row) else "" for c in columns)
+
+def _cell_text(value):
+    """엑셀 셀 값 → 앞뒤 공백 없는 문자열 (빈 칸 / NaN은 "", 정수인 실수 1.0은 "1")"""
+    if value is None or value != value:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+def _chunked(rows, chunk_rows=IMPORT_CHUNK_ROWS, columns=DEFAULT_COLUMNS):
+    """원본 행(문자열 튜플) → columns 순서 4칸 튜플의 chunk_rows행 목록들"""
+    chunk = []
+    for row in rows:
+        chunk.append(_pick(row, columns))
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# ----- 빠른 엑셀 읽기: python-calamine (선택 의존성, Rust 파서) -----
+# 설치돼 있으면 .xlsx / .xls 모두 calamine으로 읽음 (openpyxl read-only보다 훨씬 빠르고 행 수도 바로 앎).
+# 없으면 openpyxl read-only 스트리밍 / .xls는 pandas.
+
+def _calamine():
+    try:
+        import python_calamine
+    except ImportError:
+        return None
+    return python_calamine
+
+def _close_calamine(wb):
+    if hasattr(wb, "close"):   # 오래된 버전에는 close가 없음
+        wb.close()
+
+def _calamine_rows(sheet):
+    """calamine 시트 → 원본 열 번호 그대로의 행. calamine은 데이터가 시작하는 열부터 주므로 앞 열을 빈 칸으로 채움"""
+    pad = ("",) * sheet.start[1] if sheet.start else ()
+    for row in sheet.iter_rows():
+        yield pad + tuple(_cell_text(v) for v in row)
+
+def _calamine_height(sheet):
+    return sheet.end[0] + 1 if sheet.end else 0
+
+def iter_excel_rows(filepath, chunk_rows=IMPORT_CHUNK_ROWS, on_total=None, columns=DEFAULT_COLUMNS):
+    """첫 시트의 columns 열을 chunk_rows행씩 (word, pos, meaning, example) 튜플 목록으로.
+    calamine이 있으면 calamine, 없으면 .xlsx는 openpyxl read-only 스트리밍, .xls는 pandas로 읽은 뒤 열 단위로 변환.
+    on_total(행 수 또는 None)은 파일을 연 직후 한 번 호출 (진행바 분모)."""
+    cal = _calamine()
+    if cal is not None:
+        wb = cal.CalamineWorkbook.from_path(filepath)
+        try:
+            sheet = wb.get_sheet_by_index(0)
+            if on_total:
+                on_total(_calamine_height(sheet))
+            yield from _chunked(_calamine_rows(sheet), chunk_rows, columns)
+        finally:
+            _close_calamine(wb)
+        return
+
+    if filepath.lower().endswith(".xls"):
+        import pandas as pd
+        df = pd.read_excel(filepath, header=None)
+        if on_total:
+            on_total(len(df))
+        cols = []
+        for i in columns:
+            if i is not None and i < df.shape[1]:
+                col = df.iloc[:, i]
+                cols.append(col.where(col.notna(), "").astype(str).str.strip().tolist())
+            else:
+                cols.append([""] * len(df))
+        rows = list(zip(*cols))
+        for start in range(0, len(rows), chunk_rows):
+            yield rows[start:start + chunk_rows]
+        return
+
+    import openpyxl
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        if on_total:
+            on_total(ws.max_row)  # 시트 크기 정보(dimension)가 없으면 None
+        yield from _iter_sheet_rows(ws, chunk_rows, columns)
+    finally:
+        wb.close()
+
+def _iter_sheet_rows(ws, chunk_rows=IMPORT_CHUNK_ROWS, columns=DEFAULT_COLUMNS):
+    max_col = max(c for c in columns if c is not None) + 1
+    rows = (tuple(_cell_text(v) for v in row) for row in ws.iter_rows(max_col=max_col, values_only=True))
+    return _chunked(rows, chunk_rows, columns)
+
+def iter_excel_sheets(filepath, chunk_rows=IMPORT_CHUNK_ROWS):
+    """.xlsx의 모든 시트를 (시트 이름, 행 청크 이터레이터)로. 통합 문서는 한 번만 열고 시트는 차례로 스트리밍
+    (앞 시트의 청크를 다 쓴 뒤 다음 시트로 넘어가야 함)."""
+    cal = _calamine()
+    if cal is not None:
+        wb = cal.CalamineWorkbook.from_path(filepath)
+        try:
+            for name in wb.sheet_names:
+                yield name, _chunked(_calamine_rows(wb.get_sheet_by_name(name)), chunk_rows)
+        finally:
+            _close_calamine(wb)
+        return
+
+    import openpyxl
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        for ws in wb.worksheets:
+            yield ws.title, _iter_sheet_rows(ws, chunk_rows)
+    finally:
+        wb.close()
+
+CSV_EXTENSIONS = (".csv", ".tsv", ".txt")
+CSV_SNIFF_BYTES = 64 * 1024     # 구분자 추정에 쓰는 앞부분 크기
+
+def _sniff_dialect(f):
+    """앞부분 샘플로 구분자 추정 후 파일 위치를 처음으로 되돌림.
+    모든 줄에 탭이 있으면 탭 (엑셀에서 복사한 표는 뜻 / 예문 안에 쉼표가 흔함)"""
+    sample = f.read(CSV_SNIFF_BYTES)
+    f.seek(0)
+    if "\n" in sample:
+        sample = sample[:sample.rindex("\n")]  # 잘린 마지막 줄은 제외
+    lines = [line for line in sample.splitlines() if line.strip()]
+    if lines and all("\t" in line for line in lines):
+        return "excel-tab"
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",\t;|")
+    except csv.Error:
+        return "excel-tab" if "\t" in sample else "excel"  # 한 열뿐이면 추정 불가
+
+def _csv_reader(f, delimiter=None):
+    """delimiter를 주면 그 구분자로, 아니면 앞부분 샘플로 추정해서 csv.reader"""
+    if delimiter is None:
+        return csv.reader(f, _sniff_dialect(f))
+    return csv.reader(f, delimiter=delimiter)
+
+def _file_delimiter(filepath):
+    """.tsv는 항상 탭, 나머지는 None (추정)"""
+    return "\t" if filepath.lower().endswith(".tsv") else None
+
+def iter_delimited_rows(f, chunk_rows=IMPORT_CHUNK_ROWS, columns=DEFAULT_COLUMNS, delimiter=None):
+    """CSV/TSV 텍스트(파일 객체)를 chunk_rows행씩 (word, pos, meaning, example) 튜플 목록으로.
+    구분자는 delimiter(없으면 앞부분 샘플로 추정), 따옴표로 감싼 필드(쉼표 / 줄바꿈 포함)도 처리."""
+    chunk = []
+    for row in _csv_reader(f, delimiter):
+        chunk.append(_pick([c.strip() for c in row], columns))
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_import_rows(filepath, chunk_rows=IMPORT_CHUNK_ROWS, on_total=None, columns=DEFAULT_COLUMNS):
+    """확장자에 따라 CSV/TSV 또는 엑셀 행 청크"""
+    if filepath.lower().endswith(CSV_EXTENSIONS):
+        with open(filepath, "r", encoding="utf-8-sig", newline="") as f:
+            yield from iter_delimited_rows(f, chunk_rows, columns, _file_delimiter(filepath))
+    else:
+        yield from iter_excel_rows(filepath, chunk_rows, on_total, columns)
+
+# ----- 가져오기 미리보기 (앞부분 몇 행 + 행 수) -----
+PREVIEW_ROWS = 20
+PREVIEW_MAX_COLS = 8            # 미리보기 / 열 매핑에 보여줄 최대 열 수 (A~H)
+_COUNT_BLOCK_BYTES = 1 << 20
+
+def _count_lines(filepath):
+    """바이너리 블록 단위로 줄바꿈 개수만 셈 (따옴표 안 줄바꿈까지 세므로 근사치)"""
+    count, last = 0, b"\n"
+    with open(filepath, "rb") as f:
+        while True:
+            block = f.read(_COUNT_BLOCK_BYTES)
+            if not block:
+                break
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+_OOXML_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_OOXML_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+def _count_sheet_rows(filepath):
+    """dimension 정보가 없는 시트(다른 프로그램이 스트리밍으로 만든 파일 등)용: 첫 시트 XML을 압축만 풀면서
+    <row> 태그 개수를 셈 (zipfile + 통합 문서 관계 파일만 사용, 셀은 파싱하지 않음). 읽을 수 없으면 None."""
+    import zipfile
+    import xml.etree.ElementTree as ET
+    try:
+        with zipfile.ZipFile(filepath) as zf:
+            sheet = ET.fromstring(zf.read("xl/workbook.xml")).find(f"{_OOXML_MAIN}sheets/{_OOXML_MAIN}sheet")
+            rid = sheet.get(f"{_OOXML_REL}id")
+            target = next(rel.get("Target") for rel in ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+                          if rel.get("Id") == rid)
+            path = target.lstrip("/") if target.startswith("/") else "xl/" + target
+            count, tail = 0, b""
+            with zf.open(path) as f:
+                while True:
+                    block = f.read(_COUNT_BLOCK_BYTES)
+                    if not block:
+                        break
+                    data = tail + block
+                    count += data.count(b"<row ") + data.count(b"<row>")
+                    tail = data[-4:]   # 경계에 걸친 태그는 다음 블록에서 (4바이트는 "<row"보다 짧아 중복 없음)
+            return count
+    except (OSError, KeyError, AttributeError, StopIteration, ET.ParseError, zipfile.BadZipFile):
+        return None
+
+def preview_import_file(filepath, n=PREVIEW_ROWS, max_cols=PREVIEW_MAX_COLS):
+    """시트 전체를 읽지 않고 앞 n행(최대 max_cols열)과 행 수만.
+    → {"rows": [문자열 튜플], "columns": 열 수, "total": 행 수 또는 None, "approx": 근사치 여부}
+    xlsx는 시트 크기 정보(dimension, 없으면 <row> 개수), CSV는 줄 수로 행 수를 구하고,
+    .xls는 calamine이 있을 때만 행 수를 앎 (calamine은 시트 전체를 읽으므로 xlsx에는 쓰지 않음)."""
+    lower = filepath.lower()
+    total, approx = None, False
+    cal = _calamine() if lower.endswith(".xls") else None
+    if cal is not None:
+        wb = cal.CalamineWorkbook.from_path(filepath)
+        try:
+            sheet = wb.get_sheet_by_index(0)
+            total = _calamine_height(sheet)
+            rows = [r[:max_cols] for _, r in zip(range(n), _calamine_rows(sheet))]
+        finally:
+            _close_calamine(wb)
+    elif lower.endswith(CSV_EXTENSIONS):
+        with open(filepath, "r", encoding="utf-8-sig", newline="") as f:
+            reader = _csv_reader(f, _file_delimiter(filepath))
+            rows = [tuple(c.strip() for c in row[:max_cols]) for _, row in zip(range(n), reader)]
+        total, approx = _count_lines(filepath), True
+    elif lower.endswith(".xls"):
+        import pandas as pd
+        df = pd.read_excel(filepath, header=None, nrows=n)
+        rows = [tuple(_cell_text(v) for v in r[:max_cols]) for r in df.itertuples(index=False)]
+    else:
+        import openpyxl
+        wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0]
+            total = ws.max_row
+            if total is None:
+                total, approx = _count_sheet_rows(filepath), True
+            rows = [tuple(_cell_text(v) for v in r)
+                    for r in ws.iter_rows(max_row=n, max_col=max_cols, values_only=True)]
+        finally:
+            wb.close()
+    columns = max((len(r) for r in rows), default=0)
+    while columns and not any(r[columns - 1] for r in rows if len(r) >= columns):
+        columns -= 1   # 비어 있는 오른쪽 열은 제외
+    return {"rows": rows, "columns": columns, "total": total, "approx": approx}
+
+def rows_to_deck(chunks, on_chunk=None, cancel=None):
+    """(word, pos, meaning, example) 청크들 → 덱 dict. 단어가 빈 행은 건너뛰고 품사가 비면 "null".
+    on_chunk(read, accepted, skipped)는 청크마다 호출, cancel(Event)이 켜지면 None 반환."""
+    new_deck = {}
+    read = skipped = 0
+    for chunk in chunks:
+        if cancel is not None and cancel.is_set():
+            return None
+        for word, pos, meaning, example in chunk:
+            read += 1
+            if not word:
+                skipped += 1
+                continue
+            new_deck[word] = {
+                "part_of_speech": pos or "null",
+                "meaning": meaning,
+                "example": example,
+                "status": "unknown"
+            }
+        if on_chunk:
+            on_chunk(read, len(new_deck), skipped)
+    return new_deck
+
+# ----- 기존 덱과 병합할 때의 변경분 계산 -----
+DIFF_FIELDS = ("part_of_speech", "meaning", "example")   # 비교 대상 (학습 상태 / 복습 기록은 제외)
+
+def row_digest(info):
+    """단어 내용(품사 / 뜻 / 예문)의 8바이트 해시"""
+    text = "\x1f".join(info.get(f, "") for f in DIFF_FIELDS)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+def merge_word(old, new):
+    """기존 단어 레코드에 가져온 행을 합침: 비어 있지 않은 내용 필드만 덮어씀 (빈 칸 / 품사 "null"은 기존 값 유지),
+    상태 / 복습 기록은 기존 것. 병합 규칙은 여기 한 곳 (diff_deck / 덱 반영 공통)"""
+    filled = {f: new[f] for f in DIFF_FIELDS if new.get(f) not in (None, "", "null")}
+    return {**old, **filled, "status": old.get("status", "unknown")}
+
+def diff_deck(existing, incoming):
+    """가져온 단어(incoming)를 기존 덱과 한 번씩만 훑어 비교. 비용은 두 덱 크기에만 비례.
+    change는 merge_word로 합쳤을 때 실제로 내용이 바뀌는 단어만.
+    → {"add": [...], "change": [...], "remove": [...], "same": 개수}"""
+    add, change = [], []
+    same = 0
+    for w, info in incoming.items():
+        old = existing.get(w)
+        if old is None:
+            add.append(w)
+        elif row_digest(old) != row_digest(merge_word(old, info)):
+            change.append(w)
+        else:
+            same += 1
+    remove = [w for w in existing if w not in incoming]
+    return {"add": add, "change": change, "remove": remove, "same": same}
+
+def parse_import_file(filepath):
+    """파일 하나를 통째로 파싱 (프로세스 풀 작업 단위, 결과는 pickle로 부모에게 전달).
+    시트가 여러 개인 .xlsx(전체 덱 내보내기 등)는 시트마다 덱 하나 (빈 시트 제외), 나머지는 파일 이름이 덱 이름.
+    → {"path", "decks"([(덱 이름, 덱 dict)] 또는 None), "read", "skipped", "seconds", "error"}"""
+    t0 = time.perf_counter()
+    stats = {"read": 0, "skipped": 0}
+    base = dict(stats)
+
+    def on_chunk(read, accepted, skipped):
+        stats.update(read=base["read"] + read, skipped=base["skipped"] + skipped)
+
+    try:
+        lower = filepath.lower()
+        if lower.endswith(CSV_EXTENSIONS) or lower.endswith(".xls"):
+            decks = [(deck_name_for_file(filepath), rows_to_deck(iter_import_rows(filepath), on_chunk))]
+        else:
+            decks = []
+            for title, chunks in iter_excel_sheets(filepath):
+                base.update(stats)
+                decks.append((title, rows_to_deck(chunks, on_chunk)))
+            if len(decks) == 1:
+                decks = [(deck_name_for_file(filepath), decks[0][1])]
+            else:
+                decks = [(title, words) for title, words in decks if words]
+        error = None
+    except Exception as e:
+        decks, error = None, f"{type(e).__name__}: {e}"
+    return {"path": filepath, "decks": decks, "read": stats["read"], "skipped": stats["skipped"],
+            "seconds": time.perf_counter() - t0, "error": error}
+
+def deck_name_for_file(filepath):
+    """파일 이름(확장자 제외) → 덱 이름"""
+    return os.path.splitext(os.path.basename(filepath))[0].strip() or "Imported"
+
+# ----- 내보내기 (Excel / CSV / JSONL) -----
+EXPORT_FORMATS = {"xlsx": "Excel", "csv": "CSV", "jsonl": "JSONL"}
+EXPORT_PROGRESS_ROWS = IMPORT_CHUNK_ROWS    # 진행 콜백 간격 (행)
+_SHEET_BAD_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+class _ExportCancelled(Exception):
+    pass
+
+def _sheet_title(name, used):
+    """덱 이름 → 엑셀 시트 이름 (금지 문자 제거, 31자, 대소문자 무시 중복 회피)"""
+    base = _SHEET_BAD_CHARS.sub("_", name).strip("'") or "Deck"
+    title, n = base[:31], 1
+    while title.lower() in used:
+        n += 1
+        suffix = f" ({n})"
+        title = base[:31 - len(suffix)] + suffix
+    used.add(title.lower())
+    return title
+
+def _word_row(word, info):
+    """가져오기와 같은 A~D 순서 (word, pos, meaning, example)"""
+    return [word, info.get("part_of_speech", ""), info.get("meaning", ""), info.get("example", "")]
+
+def export_words(filepath, sections, on_progress=None, cancel=None):
+    """sections = [(덱 이름, (word, info) 이터러블[, 행 수 상한]), ...]을 한 행씩 만들어 바로 기록 (메모리 사용량 일정).
+    행 수 상한을 주면 xlsx 시트에 크기 정보(dimension)를 써서, 다시 읽을 때 진행률 / 미리보기 행 수가 바로 나옴.
+    xlsx: openpyxl write-only, 덱마다 시트 하나 / 헤더 없이 A~D
+          (Import는 첫 시트만, Batch Import는 시트마다 덱 하나로 다시 가져옴)
+    csv : A~D + E=deck, F=status (헤더 없음, 가져오기는 A~D만 읽음)
+    jsonl: 한 줄에 {"deck", "word", 품사 / 뜻 / 예문 / 상태}
+    임시 파일에 쓴 뒤 교체. on_progress(행 수)는 EXPORT_PROGRESS_ROWS마다, cancel이 켜지면 None."""
+    fmt = os.path.splitext(filepath)[1].lower().lstrip(".")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: .{fmt}")
+    tmp = filepath + ".part"
+    count = 0
+
+    def rows():
+        nonlocal count
+        for deck_name, items, *size in sections:
+            yield deck_name, None, size[0] if size else None  # 덱 경계 표시 (+ 행 수 상한)
+            for word, info in items:
+                if cancel is not None and cancel.is_set():
+                    raise _ExportCancelled
+                yield deck_name, (word, info), None
+                count += 1
+                if on_progress and count % EXPORT_PROGRESS_ROWS == 0:
+                    on_progress(count)
+
+    try:
+        if fmt == "xlsx":
+            import openpyxl
+            from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+            wb = openpyxl.Workbook(write_only=True)
+            used, ws = set(), None
+            for deck_name, item, size in rows():
+                if item is None:
+                    ws = wb.create_sheet(_sheet_title(deck_name, used))
+                    if size:
+                        # write-only 시트는 dimension을 쓰지 않음 → 작성기가 찾는 calculate_dimension을 달아 둠.
+                        # openpyxl read-only는 이 범위까지만 읽으므로 실제 행 수 이상이어야 함 (상한)
+                        ws.calculate_dimension = lambda ref=f"A1:D{size}": ref
+                    continue
+                ws.append([ILLEGAL_CHARACTERS_RE.sub("", v) for v in _word_row(*item)])
+            if ws is None:
+                wb.create_sheet("Deck")   # 빈 통합 문서는 저장 불가
+            wb.save(tmp)
+        else:
+            with open(tmp, "w", encoding="utf-8", newline="") as f:
+                if fmt == "csv":
+                    w = csv.writer(f)
+                    for deck_name, item, _ in rows():
+                        if item is not None:
+                            w.writerow(_word_row(*item) + [deck_name, item[1].get("status", "unknown")])
+                else:
+                    for deck_name, item, _ in rows():
+                        if item is not None:
+                            word, info = item
+                            f.write(json.dumps({"deck": deck_name, "word": word, **info}, ensure_ascii=False))
+                            f.write("\n")
+        os.replace(tmp, filepath)
+    except _ExportCancelled:
+        return None
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    if on_progress:
+        on_progress(count)
+    return count